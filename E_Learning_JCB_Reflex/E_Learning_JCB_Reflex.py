@@ -42,6 +42,10 @@ Notas:
 import reflex as rx
 from rxconfig import config
 
+from E_Learning_JCB_Reflex.database import ensure_indexes, mongodb_lifespan
+from E_Learning_JCB_Reflex.services.course_service import course_cache_lifespan
+from E_Learning_JCB_Reflex.services.progress_service import progress_flush_lifespan
+
 # Importar todas las páginas de la aplicación
 from E_Learning_JCB_Reflex.pages.index import index
 from E_Learning_JCB_Reflex.pages.courses import courses_page
@@ -76,6 +80,18 @@ from E_Learning_JCB_Reflex.pages.admin_settings import admin_settings_page
 # Crear la aplicación principal de Reflex
 app = rx.App()
 
+# Abrir el pool de MongoDB al arrancar el backend y cerrarlo al apagarlo
+app.register_lifespan_task(mongodb_lifespan)
+
+# Crear los índices declarados en database/indexes.py que falten
+app.register_lifespan_task(ensure_indexes)
+
+# Aplicar las invalidaciones de caché publicadas por otros workers (requiere REDIS_URL)
+app.register_lifespan_task(course_cache_lifespan)
+
+# Escribir periódicamente el progreso de lecciones acumulado en memoria
+app.register_lifespan_task(progress_flush_lifespan)
+
 
 # ============================================================================
 # REGISTRO DE RUTAS PÚBLICAS
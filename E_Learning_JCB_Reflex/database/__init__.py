@@ -1,5 +1,22 @@
 """Database package."""
 
-from .mongodb import MongoDB, get_sync_client
+from .mongodb import MongoDB, get_sync_client, mongodb_lifespan
+from .memory import MemoryClient
+from .repository import Collection, Database
+from .redis_cache import RedisCache
+from .indexes import ensure_indexes, verify_indexes
+from .migrations import Migration, run_migration
 
-__all__ = ["MongoDB", "get_sync_client"]
+__all__ = [
+    "MongoDB",
+    "get_sync_client",
+    "mongodb_lifespan",
+    "MemoryClient",
+    "Collection",
+    "Database",
+    "RedisCache",
+    "ensure_indexes",
+    "verify_indexes",
+    "Migration",
+    "run_migration",
+]
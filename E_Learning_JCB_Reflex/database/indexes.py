@@ -0,0 +1,276 @@
+"""
+Declaración y verificación de los índices de MongoDB.
+
+Este módulo declara en un único lugar los índices que necesitan las consultas
+frecuentes de los servicios (login por email, listados por rol, inscripciones
+por estudiante y por curso, contactos por email, cursos por instructor y por
+fecha, lecciones y reseñas por curso y búsqueda de texto de cursos). Se
+ejecuta al arrancar la aplicación y desde scripts/ensure_indexes.py.
+
+Un índice existente cuenta como el declarado solo si coinciden sus claves y
+sus opciones (unicidad y, en los de texto, campos, pesos e idioma). Un índice
+con las mismas claves y otras opciones (por ejemplo, el índice de texto sin
+pesos de la documentación o un {email: 1} no único) se informa como
+discrepante: MongoDB no permite crear el declarado mientras exista.
+
+Funciones:
+- ensure_indexes: Crear los índices declarados que falten (idempotente)
+- verify_indexes: Informar de índices declarados ausentes o discrepantes y de índices sin uso
+
+Para añadir un índice nuevo basta con declararlo en REQUIRED_INDEXES.
+"""
+
+from typing import Dict, List
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from E_Learning_JCB_Reflex.database.mongodb import MongoDB
+
+
+# Índice de texto de search_courses (title > description > instructor > category)
+COURSE_TEXT_INDEX_NAME = "courses_text_search"
+COURSE_TEXT_INDEX_WEIGHTS = {
+    "title": 10,
+    "description": 5,
+    "instructor.name": 3,
+    "category": 1,
+}
+
+# Índices requeridos por colección
+REQUIRED_INDEXES: Dict[str, List[IndexModel]] = {
+    "users": [
+        # get_user_by_email (login y registro)
+        IndexModel([("email", ASCENDING)], name="users_email_unique", unique=True),
+        # get_all_students / get_all_instructors / get_all_admins y estadísticas por rol
+        IndexModel([("role", ASCENDING)], name="users_role"),
+    ],
+    "courses": [
+        # Cursos ordenados por fecha de creación
+        IndexModel([("createdAt", DESCENDING)], name="courses_created_at"),
+        # get_courses_by_instructor y último curso creado por un instructor
+        IndexModel(
+            [("instructor.userId", ASCENDING), ("createdAt", DESCENDING)],
+            name="courses_instructor_created_at",
+        ),
+        # search_courses filtrando por nivel sin texto (ordenado por _id)
+        IndexModel([("level", ASCENDING), ("_id", DESCENDING)], name="courses_level_id"),
+        # Comprobación de categorías huérfanas al borrar un curso
+        IndexModel([("categories", ASCENDING)], name="courses_categories"),
+        # search_courses con $text
+        IndexModel(
+            [(field, TEXT) for field in COURSE_TEXT_INDEX_WEIGHTS],
+            name=COURSE_TEXT_INDEX_NAME,
+            weights=COURSE_TEXT_INDEX_WEIGHTS,
+            default_language="spanish",
+        ),
+    ],
+    "enrollments": [
+        # Una inscripción por estudiante y curso (enroll_student, is_enrolled)
+        IndexModel(
+            [("userId", ASCENDING), ("courseId", ASCENDING)],
+            name="enrollments_user_course_unique",
+            unique=True,
+        ),
+        # get_student_enrollments (paginación por cursor, más recientes primero)
+        IndexModel(
+            [("userId", ASCENDING), ("enrolledAt", DESCENDING), ("_id", DESCENDING)],
+            name="enrollments_user_enrolled_at",
+        ),
+        # get_course_students (paginación por cursor, más recientes primero)
+        IndexModel(
+            [("courseId", ASCENDING), ("enrolledAt", DESCENDING), ("_id", DESCENDING)],
+            name="enrollments_course_enrolled_at",
+        ),
+        # Resumen del dashboard del estudiante y filtros por estado
+        IndexModel([("userId", ASCENDING), ("status", ASCENDING)], name="enrollments_user_status"),
+    ],
+    "lessons": [
+        # Lecciones de un curso en orden (get_lesson filtra por _id y courseId)
+        IndexModel([("courseId", ASCENDING), ("order", ASCENDING)], name="lessons_course_order"),
+    ],
+    "reviews": [
+        # Una reseña por estudiante y curso
+        IndexModel([("courseId", ASCENDING), ("student", ASCENDING)], name="reviews_course_student_unique", unique=True),
+        # get_course_reviews (paginación por cursor, más recientes primero)
+        IndexModel(
+            [("courseId", ASCENDING), ("createdAt", DESCENDING), ("_id", DESCENDING)],
+            name="reviews_course_created_at",
+        ),
+    ],
+    "contacts": [
+        # get_contact_by_email (filtrado por email y ordenado por fecha)
+        IndexModel([("email", ASCENDING), ("createdAt", DESCENDING)], name="contacts_email_created_at"),
+        # get_all_contacts (ordenado por fecha)
+        IndexModel([("createdAt", DESCENDING)], name="contacts_created_at"),
+    ],
+}
+
+
+def _key_signature(key) -> tuple:
+    """
+    Obtener una firma comparable de las claves de un índice.
+
+    Los índices de texto se guardan en MongoDB como {"_fts": "text", "_ftsx": 1},
+    así que todos los índices de texto de una colección tienen la misma firma
+    (MongoDB solo permite uno por colección).
+    """
+    items = list(key.items())
+    if any(value == TEXT for _, value in items):
+        return (("_fts", TEXT), ("_ftsx", 1))
+    return tuple(items)
+
+
+def _index_options(index: dict) -> dict:
+    """
+    Obtener las opciones comparables de un índice (declarado o de list_indexes).
+
+    Incluye la unicidad y, en los índices de texto, los pesos de cada campo
+    (los campos sin peso explícito pesan 1) y el idioma por defecto.
+    """
+    options = {"unique": bool(index.get("unique", False))}
+
+    key = index["key"]
+    if "_fts" in key or any(value == TEXT for value in key.values()):
+        # list_indexes devuelve la clave {_fts, _ftsx} y todos los campos en weights
+        weights = {field: 1 for field, value in key.items() if value == TEXT and field != "_fts"}
+        weights.update(index.get("weights") or {})
+        options["weights"] = weights
+        options["default_language"] = index.get("default_language", "english")
+
+    return options
+
+
+def _index_differences(declared: dict, existing: dict) -> List[str]:
+    """Describir en qué opciones difiere un índice existente del declarado (vacío si coinciden)."""
+    declared_options = _index_options(declared)
+    existing_options = _index_options(existing)
+    return [
+        f"{option}: {existing_options[option]!r} (esperado {declared_options[option]!r})"
+        for option in declared_options
+        if existing_options.get(option) != declared_options[option]
+    ]
+
+
+async def ensure_indexes(replace_mismatched: bool = False) -> Dict[str, List[str]]:
+    """
+    Crear los índices declarados en REQUIRED_INDEXES que aún no existan.
+
+    Es idempotente: un índice ya existente con las mismas claves y opciones
+    (aunque tenga otro nombre) no se vuelve a crear. Si existe con las mismas
+    claves pero otras opciones (unique, pesos o idioma del índice de texto),
+    se informa como error; con replace_mismatched=True se elimina y se crea
+    el declarado. Se ejecuta al arrancar la aplicación.
+
+    Args:
+        replace_mismatched: Eliminar y volver a crear los índices discrepantes.
+                            Por defecto False: eliminar un índice único o de
+                            texto en producción debe ser una decisión explícita
+                            (scripts/ensure_indexes.py --replace-mismatched).
+
+    Returns:
+        Dict[str, List[str]]: Errores por colección (por ejemplo, emails
+        duplicados que impiden crear el índice único o índices discrepantes
+        sin reemplazar). Vacío si todo fue bien.
+
+    Ejemplo:
+        >>> errors = await ensure_indexes()
+        >>> if errors:
+        ...     print(errors)
+    """
+    db = MongoDB.get_db()
+    errors: Dict[str, List[str]] = {}
+
+    for collection_name, models in REQUIRED_INDEXES.items():
+        try:
+            existing = {
+                _key_signature(index["key"]): index
+                async for index in db[collection_name].list_indexes()
+            }
+            missing = []
+            for model in models:
+                current = existing.get(_key_signature(model.document["key"]))
+                if current is None:
+                    missing.append(model)
+                    continue
+
+                differences = _index_differences(model.document, current)
+                if not differences:
+                    continue
+
+                message = (
+                    f"index {current['name']} has the keys of {model.document['name']} "
+                    f"but different options: {'; '.join(differences)}"
+                )
+                if replace_mismatched:
+                    await db[collection_name].drop_index(current["name"])
+                    print(f"Dropped mismatched index on {collection_name}: {message}")
+                    missing.append(model)
+                else:
+                    print(f"Index mismatch on {collection_name}: {message}")
+                    errors.setdefault(collection_name, []).append(message)
+
+            if missing:
+                created = await db[collection_name].create_indexes(missing)
+                print(f"Created indexes on {collection_name}: {', '.join(created)}")
+        except Exception as e:
+            print(f"Error creating indexes on {collection_name}: {e}")
+            errors.setdefault(collection_name, []).append(str(e))
+
+    return errors
+
+
+async def verify_indexes() -> dict:
+    """
+    Comparar los índices existentes con los declarados.
+
+    Usa list_indexes para detectar índices declarados que faltan y $indexStats
+    para detectar índices sin ninguna operación desde el último reinicio del
+    servidor (candidatos a eliminarse, ya que solo encarecen las escrituras).
+
+    Returns:
+        dict: Informe con las claves:
+            - missing (list[str]): "colección.nombre" de índices declarados ausentes
+            - mismatched (list[str]): "colección.nombre" de índices declarados que
+              existen con las mismas claves pero otras opciones, con el detalle
+            - unused (list[str]): "colección.nombre" de índices con 0 accesos
+            - undeclared (list[str]): "colección.nombre" de índices no declarados
+
+    Ejemplo:
+        >>> report = await verify_indexes()
+        >>> if report["missing"]:
+        ...     raise SystemExit(1)
+    """
+    db = MongoDB.get_db()
+    report = {"missing": [], "mismatched": [], "unused": [], "undeclared": []}
+
+    for collection_name, models in REQUIRED_INDEXES.items():
+        existing = {
+            _key_signature(index["key"]): index
+            async for index in db[collection_name].list_indexes()
+        }
+        declared = {_key_signature(model.document["key"]) for model in models}
+
+        for model in models:
+            current = existing.get(_key_signature(model.document["key"]))
+            if current is None:
+                report["missing"].append(f"{collection_name}.{model.document['name']}")
+                continue
+
+            differences = _index_differences(model.document, current)
+            if differences:
+                report["mismatched"].append(
+                    f"{collection_name}.{model.document['name']} "
+                    f"(existe como {current['name']}: {'; '.join(differences)})"
+                )
+
+        for signature, index in existing.items():
+            if index["name"] != "_id_" and signature not in declared:
+                report["undeclared"].append(f"{collection_name}.{index['name']}")
+
+        try:
+            async for stats in db[collection_name].aggregate([{"$indexStats": {}}]):
+                if stats["name"] != "_id_" and stats["accesses"]["ops"] == 0:
+                    report["unused"].append(f"{collection_name}.{stats['name']}")
+        except Exception as e:
+            # $indexStats requiere permisos que algunos usuarios de Atlas no tienen
+            print(f"Could not read index usage for {collection_name}: {e}")
+
+    return report
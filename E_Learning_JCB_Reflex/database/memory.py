@@ -0,0 +1,1497 @@
+"""
+Backend de base de datos en memoria con la interfaz de Motor.
+
+Implementa, sobre diccionarios de Python, el subconjunto de la API de Motor
+que usan los servicios (find/find_one con proyección, orden, skip y limit,
+inserciones, actualizaciones, borrados, bulk_write, find_one_and_*,
+count_documents, aggregate e índices). Se activa con DATABASE_BACKEND=memory
+(ver database/mongodb.py) y sirve para medir y probar la lógica de servicios y
+estados sin un mongod: no hay red ni serialización BSON, así que un servicio
+se puede ejecutar miles de veces por segundo.
+
+Índices:
+- _id: diccionario _id → documento (búsqueda directa)
+- Índices secundarios creados con create_index/create_indexes (por ejemplo
+  desde ensure_indexes): mapas hash del valor de la primera clave y de la
+  clave completa a los _id. Las consultas con igualdad o $in sobre las claves
+  de un índice solo evalúan los documentos candidatos; el resto recorre la
+  colección. Los índices únicos lanzan DuplicateKeyError (código 11000)
+- Índice de texto: $text busca palabras completas (sin distinguir mayúsculas
+  ni acentos) en los campos del índice y puntúa con sus pesos (textScore)
+
+Operadores soportados:
+- Consultas: igualdad (con rutas con puntos y arrays), $eq, $ne, $gt, $gte,
+  $lt, $lte, $in, $nin, $exists, $regex, $not, $elemMatch, $size, $all,
+  $and, $or, $nor, $text
+- Actualizaciones: $set, $setOnInsert, $unset, $inc, $min, $max, $push,
+  $addToSet, $pull (con $each y array_filters $[id])
+- Agregación: $match, $group, $project, $addFields/$set, $sort, $skip,
+  $limit, $count, $unwind, $indexStats y las expresiones que usan los
+  servicios ($size, $ifNull, $cond, $reduce, $setUnion, comparaciones...)
+
+Limitaciones: no hay transacciones (MongoDB.supports_transactions devuelve
+False y los servicios usan su camino sin sesión), ni $lookup, ni stemming en
+la búsqueda de texto. Los datos solo viven en el proceso.
+
+Ejemplo:
+    >>> client = MemoryClient()
+    >>> db = client.get_default_database()
+    >>> await db["courses"].insert_one({"title": "Python"})
+    >>> await db["courses"].find_one({"title": "Python"})
+"""
+
+import itertools
+import re
+import unicodedata
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+from bson import ObjectId
+from pymongo import (
+    ASCENDING,
+    DeleteMany,
+    DeleteOne,
+    InsertOne,
+    ReplaceOne,
+    ReturnDocument,
+    TEXT,
+    UpdateMany,
+    UpdateOne,
+)
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
+from pymongo.results import (
+    BulkWriteResult,
+    DeleteResult,
+    InsertManyResult,
+    InsertOneResult,
+    UpdateResult,
+)
+
+
+# Nombre de la base de datos por defecto
+MEMORY_DATABASE_NAME = "elearning_memory"
+
+# Código de error de MongoDB para claves duplicadas
+DUPLICATE_KEY_ERROR = 11000
+
+# Orden de tipos de BSON al comparar valores de tipos distintos
+_TYPE_ORDER = {type(None): 0, int: 1, float: 1, str: 2, dict: 3, list: 4, ObjectId: 5, bool: 6, datetime: 7}
+
+_WORD = re.compile(r"\w+")
+
+
+# ============================================================================
+# VALORES Y RUTAS
+# ============================================================================
+
+def _get_values(value, parts: List[str]) -> list:
+    """Valores en la ruta (con puntos ya separada) recorriendo arrays como MongoDB."""
+    if not parts:
+        return [value]
+    key, rest = parts[0], parts[1:]
+    if isinstance(value, dict):
+        return _get_values(value[key], rest) if key in value else []
+    if isinstance(value, list):
+        if key.isdigit():
+            index = int(key)
+            return _get_values(value[index], rest) if index < len(value) else []
+        results = []
+        for item in value:
+            if isinstance(item, dict):
+                results.extend(_get_values(item, parts))
+        return results
+    return []
+
+
+def _values(document: dict, path: str) -> list:
+    """Valores de un campo del documento (lista vacía si no existe)."""
+    return _get_values(document, path.split("."))
+
+
+def _candidates(values: list) -> list:
+    """Valores a comparar: los propios valores y los elementos de los arrays."""
+    result = []
+    for value in values:
+        result.append(value)
+        if isinstance(value, list):
+            result.extend(value)
+    return result
+
+
+def _field_value(document: dict, path: str):
+    """Valor de una ruta en expresiones de agregación ($campo); None si no existe."""
+    value = document
+    for part in path.split("."):
+        if isinstance(value, dict):
+            value = value.get(part)
+        elif isinstance(value, list):
+            value = [item.get(part) for item in value if isinstance(item, dict) and part in item]
+        else:
+            return None
+    return value
+
+
+def _type_rank(value) -> int:
+    return _TYPE_ORDER.get(type(value), 3 if isinstance(value, dict) else 8)
+
+
+def _compare(a, b) -> int:
+    """Comparar dos valores con el orden de BSON (-1, 0 o 1)."""
+    rank_a, rank_b = _type_rank(a), _type_rank(b)
+    if rank_a != rank_b:
+        return -1 if rank_a < rank_b else 1
+    if a is None:
+        return 0
+    if isinstance(a, dict):
+        a, b = list(a.items()), list(b.items())
+    if isinstance(a, datetime):
+        # Fechas con y sin zona, a la precisión de BSON (MongoDB las guarda en UTC)
+        a, b = _copy(a), _copy(b)
+    try:
+        return (a > b) - (a < b)
+    except TypeError:
+        return (str(a) > str(b)) - (str(a) < str(b))
+
+
+class _SortKey:
+    """Clave de ordenación con el orden de BSON y dirección por campo."""
+
+    __slots__ = ("values", "directions")
+
+    def __init__(self, values: list, directions: list):
+        self.values = values
+        self.directions = directions
+
+    def __lt__(self, other: "_SortKey") -> bool:
+        for a, b, direction in zip(self.values, other.values, self.directions):
+            result = _compare(a, b)
+            if result:
+                return result * direction < 0
+        return False
+
+
+def _sort_value(document: dict, field: str, direction: int):
+    """Valor por el que se ordena un documento (en arrays, el menor o el mayor)."""
+    values = _candidates(_values(document, field))
+    values = [value for value in values if not isinstance(value, list)] or [None]
+    best = values[0]
+    for value in values[1:]:
+        if _compare(value, best) * direction < 0:
+            best = value
+    return best
+
+
+def _hashable(value):
+    """Convertir un valor en clave de diccionario para los índices."""
+    if isinstance(value, list):
+        return ("__list__",) + tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return ("__dict__",) + tuple((key, _hashable(item)) for key, item in value.items())
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, datetime):
+        return _copy(value)
+    return value
+
+
+def _copy(value):
+    """
+    Copiar un valor como lo haría un viaje de ida y vuelta por BSON.
+
+    Los documentos y arrays se copian en profundidad (tuplas incluidas, que
+    BSON guarda como arrays) y las fechas se guardan en UTC sin zona horaria
+    y con precisión de milisegundos, igual que las devuelve Motor. El resto de
+    valores (str, números, ObjectId...) son inmutables y se comparten.
+    """
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_copy(item) for item in value]
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.replace(microsecond=value.microsecond // 1000 * 1000)
+    return value
+
+
+def _doc_key(document: dict):
+    """Clave del documento en el diccionario de la colección (su _id)."""
+    return _hashable(document["_id"])
+
+
+def _normalize_text(text: str) -> List[str]:
+    """Palabras en minúsculas y sin acentos para la búsqueda de texto."""
+    text = unicodedata.normalize("NFKD", str(text).lower())
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return _WORD.findall(text)
+
+
+# ============================================================================
+# CONSULTAS
+# ============================================================================
+
+def _is_operator_dict(value) -> bool:
+    return isinstance(value, dict) and bool(value) and all(key.startswith("$") for key in value)
+
+
+def _regex(pattern, options: str = ""):
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    flags = 0
+    for option, flag in (("i", re.IGNORECASE), ("m", re.MULTILINE), ("s", re.DOTALL), ("x", re.VERBOSE)):
+        if option in options:
+            flags |= flag
+    return re.compile(pattern, flags)
+
+
+def _equals(values: list, expected) -> bool:
+    if isinstance(expected, re.Pattern):
+        return any(isinstance(value, str) and expected.search(value) for value in _candidates(values))
+    if expected is None and not values:
+        return True
+    return any(_compare(value, expected) == 0 and _type_rank(value) == _type_rank(expected)
+               for value in _candidates(values))
+
+
+def _match_condition(values: list, condition) -> bool:
+    """Evaluar la condición de un campo sobre sus valores."""
+    if not _is_operator_dict(condition):
+        return _equals(values, condition)
+
+    candidates = _candidates(values)
+    for operator, argument in condition.items():
+        if operator == "$eq":
+            ok = _equals(values, argument)
+        elif operator == "$ne":
+            ok = not _equals(values, argument)
+        elif operator in ("$gt", "$gte", "$lt", "$lte"):
+            ok = any(
+                _type_rank(value) == _type_rank(argument) and _check_order(operator, _compare(value, argument))
+                for value in candidates
+            )
+        elif operator == "$in":
+            ok = any(_equals(values, item) for item in argument)
+        elif operator == "$nin":
+            ok = not any(_equals(values, item) for item in argument)
+        elif operator == "$exists":
+            ok = bool(values) == bool(argument)
+        elif operator == "$regex":
+            pattern = _regex(argument, condition.get("$options", ""))
+            ok = any(isinstance(value, str) and pattern.search(value) for value in candidates)
+        elif operator == "$options":
+            continue
+        elif operator == "$not":
+            inner = argument if isinstance(argument, dict) else {"$regex": argument}
+            ok = not _match_condition(values, inner)
+        elif operator == "$elemMatch":
+            ok = any(_elem_match(item, argument) for value in values if isinstance(value, list) for item in value)
+        elif operator == "$size":
+            ok = any(isinstance(value, list) and len(value) == argument for value in values)
+        elif operator == "$all":
+            ok = all(_equals(values, item) for item in argument)
+        else:
+            raise OperationFailure(f"Operador de consulta no soportado por el backend en memoria: {operator}")
+        if not ok:
+            return False
+    return True
+
+
+def _check_order(operator: str, result: int) -> bool:
+    return {
+        "$gt": result > 0,
+        "$gte": result >= 0,
+        "$lt": result < 0,
+        "$lte": result <= 0,
+    }[operator]
+
+
+def _elem_match(item, condition: dict) -> bool:
+    """Condición de $elemMatch sobre un elemento de array."""
+    if _is_operator_dict(condition):
+        return _match_condition([item], condition)
+    return isinstance(item, dict) and _matches(item, condition)
+
+
+def _matches(document: dict, query: dict) -> bool:
+    """Indicar si un documento cumple un filtro de MongoDB."""
+    for key, condition in query.items():
+        if key == "$and":
+            if not all(_matches(document, sub) for sub in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(document, sub) for sub in condition):
+                return False
+        elif key == "$nor":
+            if any(_matches(document, sub) for sub in condition):
+                return False
+        elif key in ("$text", "$comment"):
+            # $text lo resuelve la colección con su índice de texto
+            continue
+        elif key.startswith("$"):
+            raise OperationFailure(f"Operador de consulta no soportado por el backend en memoria: {key}")
+        elif not _match_condition(_values(document, key), condition):
+            return False
+    return True
+
+
+# ============================================================================
+# PROYECCIONES
+# ============================================================================
+
+def _projection_tree(fields: Iterable[str]) -> dict:
+    tree = {}
+    for field in fields:
+        node = tree
+        parts = field.split(".")
+        for part in parts[:-1]:
+            child = node.setdefault(part, {})
+            if child is True:
+                break
+            node = child
+        else:
+            node[parts[-1]] = True
+    return tree
+
+
+def _include(value, tree: dict):
+    if isinstance(value, list):
+        return [_include(item, tree) for item in value if isinstance(item, dict)]
+    result = {}
+    for key, sub in tree.items():
+        if key not in value:
+            continue
+        if sub is True:
+            result[key] = _copy(value[key])
+        elif isinstance(value[key], (dict, list)):
+            result[key] = _include(value[key], sub)
+    return result
+
+
+def _exclude(value, tree: dict):
+    if isinstance(value, list):
+        for item in value:
+            if isinstance(item, dict):
+                _exclude(item, tree)
+        return
+    for key, sub in tree.items():
+        if key not in value:
+            continue
+        if sub is True:
+            del value[key]
+        elif isinstance(value[key], (dict, list)):
+            _exclude(value[key], sub)
+
+
+def _project(document: dict, projection, score: Optional[float] = None) -> dict:
+    """Aplicar una proyección de find a una copia del documento."""
+    if not projection:
+        return _copy(document)
+    if not isinstance(projection, dict):
+        projection = {field: 1 for field in projection}
+
+    include_id = bool(projection.get("_id", 1))
+    includes, excludes, slices, metas = [], [], {}, []
+    for field, spec in projection.items():
+        if field == "_id":
+            continue
+        if isinstance(spec, dict):
+            if "$slice" in spec:
+                slices[field] = spec["$slice"]
+            elif spec.get("$meta") == "textScore":
+                metas.append(field)
+        elif spec:
+            includes.append(field)
+        else:
+            excludes.append(field)
+
+    if includes:
+        result = {"_id": document["_id"]} if include_id and "_id" in document else {}
+        result.update(_include(document, _projection_tree(includes + list(slices))))
+    else:
+        result = _copy(document)
+        _exclude(result, _projection_tree(excludes))
+        if not include_id:
+            result.pop("_id", None)
+
+    for field, count in slices.items():
+        values = result.get(field)
+        if isinstance(values, list):
+            result[field] = values[:count] if count >= 0 else values[count:]
+    for field in metas:
+        result[field] = score or 0.0
+    return result
+
+
+# ============================================================================
+# ACTUALIZACIONES
+# ============================================================================
+
+def _array_filter_matches(item, identifier: str, array_filters: list) -> bool:
+    """Indicar si un elemento cumple los array_filters de $[identifier]."""
+    for array_filter in array_filters:
+        for key, condition in array_filter.items():
+            name, _, rest = key.partition(".")
+            if name != identifier:
+                continue
+            if rest:
+                values = _values(item, rest) if isinstance(item, dict) else []
+            else:
+                values = [item]
+            if not _match_condition(values, condition):
+                return False
+    return True
+
+
+def _modify(container, parts: List[str], operation, array_filters: list, create: bool):
+    """Aplicar operation(padre, clave) en la ruta, con posiciones $[id] de array_filters."""
+    key, rest = parts[0], parts[1:]
+
+    if isinstance(container, list):
+        if key.startswith("$[") and key.endswith("]"):
+            identifier = key[2:-1]
+            indexes = [
+                index for index, item in enumerate(container)
+                if not identifier or _array_filter_matches(item, identifier, array_filters)
+            ]
+        elif key.isdigit():
+            index = int(key)
+            if index >= len(container):
+                if not create:
+                    return
+                container.extend([None] * (index + 1 - len(container)))
+            indexes = [index]
+        else:
+            raise OperationFailure(f"No se puede crear el campo '{key}' en un array")
+        for index in indexes:
+            if rest:
+                child = container[index]
+                if not isinstance(child, (dict, list)):
+                    if not create:
+                        continue
+                    child = container[index] = {}
+                _modify(child, rest, operation, array_filters, create)
+            else:
+                operation(container, index)
+        return
+
+    if not rest:
+        operation(container, key)
+        return
+    child = container.get(key)
+    if not isinstance(child, (dict, list)):
+        if not create:
+            return
+        child = container[key] = {}
+    _modify(child, rest, operation, array_filters, create)
+
+
+def _slot_get(parent, key, default=None):
+    if isinstance(parent, list):
+        return parent[key] if key < len(parent) else default
+    return parent.get(key, default)
+
+
+def _each(argument) -> list:
+    if isinstance(argument, dict) and "$each" in argument:
+        return list(argument["$each"])
+    return [argument]
+
+
+def _apply_update(document: dict, update: dict, array_filters: Optional[list], inserting: bool):
+    """Aplicar in situ un documento de actualización con operadores."""
+    array_filters = array_filters or []
+
+    for operator, fields in update.items():
+        if operator == "$setOnInsert" and not inserting:
+            continue
+        for path, argument in fields.items():
+            parts = path.split(".")
+
+            if operator in ("$set", "$setOnInsert"):
+                def operation(parent, key, value=argument):
+                    parent[key] = _copy(value)
+                create = True
+            elif operator == "$unset":
+                def operation(parent, key):
+                    if isinstance(parent, list):
+                        if key < len(parent):
+                            parent[key] = None
+                    else:
+                        parent.pop(key, None)
+                create = False
+            elif operator == "$inc":
+                def operation(parent, key, amount=argument):
+                    parent[key] = (_slot_get(parent, key) or 0) + amount
+                create = True
+            elif operator in ("$min", "$max"):
+                def operation(parent, key, value=argument, sign=(-1 if operator == "$min" else 1)):
+                    current = _slot_get(parent, key)
+                    if current is None or _compare(value, current) * sign > 0:
+                        parent[key] = _copy(value)
+                create = True
+            elif operator == "$push":
+                def operation(parent, key, items=_each(argument)):
+                    values = _slot_get(parent, key)
+                    if values is None:
+                        values = parent[key] = []
+                    values.extend(_copy(items))
+                create = True
+            elif operator == "$addToSet":
+                def operation(parent, key, items=_each(argument)):
+                    values = _slot_get(parent, key)
+                    if values is None:
+                        values = parent[key] = []
+                    for item in items:
+                        if not any(_compare(item, existing) == 0 for existing in values):
+                            values.append(_copy(item))
+                create = True
+            elif operator == "$pull":
+                def operation(parent, key, condition=argument):
+                    values = _slot_get(parent, key)
+                    if isinstance(values, list):
+                        parent[key] = [item for item in values if not _pull_matches(item, condition)]
+                create = False
+            else:
+                raise OperationFailure(f"Operador de actualización no soportado por el backend en memoria: {operator}")
+
+            _modify(document, parts, operation, array_filters, create)
+
+
+def _pull_matches(item, condition) -> bool:
+    if _is_operator_dict(condition):
+        return _match_condition([item], condition)
+    if isinstance(condition, dict) and isinstance(item, dict):
+        return _matches(item, condition)
+    return _equals([item], condition)
+
+
+def _upsert_seed(query: dict) -> dict:
+    """Documento inicial de un upsert a partir de las igualdades del filtro."""
+    document = {}
+    for key, condition in query.items():
+        if key == "$and":
+            for sub in condition:
+                document.update(_upsert_seed(sub))
+        elif key.startswith("$"):
+            continue
+        elif not _is_operator_dict(condition):
+            _modify(document, key.split("."), lambda parent, k, v=condition: parent.__setitem__(k, _copy(v)), [], True)
+        elif "$eq" in condition:
+            _modify(document, key.split("."), lambda parent, k, v=condition["$eq"]: parent.__setitem__(k, _copy(v)), [], True)
+    return document
+
+
+# ============================================================================
+# AGREGACIÓN
+# ============================================================================
+
+def _evaluate(expression, document: dict, variables: Optional[dict] = None):
+    """Evaluar una expresión de agregación sobre un documento."""
+    if isinstance(expression, str):
+        if expression.startswith("$$"):
+            name, _, path = expression[2:].partition(".")
+            value = (variables or {}).get(name, document if name in ("ROOT", "CURRENT") else None)
+            return _field_value(value, path) if path and isinstance(value, (dict, list)) else value
+        if expression.startswith("$"):
+            return _field_value(document, expression[1:])
+        return expression
+    if isinstance(expression, list):
+        return [_evaluate(item, document, variables) for item in expression]
+    if not isinstance(expression, dict):
+        return expression
+    if len(expression) == 1:
+        operator, argument = next(iter(expression.items()))
+        if operator.startswith("$"):
+            return _evaluate_operator(operator, argument, document, variables)
+    return {key: _evaluate(value, document, variables) for key, value in expression.items()}
+
+
+def _evaluate_operator(operator: str, argument, document: dict, variables: Optional[dict]):
+    def evaluate(expression):
+        return _evaluate(expression, document, variables)
+
+    if operator == "$literal":
+        return argument
+    if operator == "$cond":
+        if isinstance(argument, dict):
+            condition, then, otherwise = argument["if"], argument["then"], argument["else"]
+        else:
+            condition, then, otherwise = argument
+        return evaluate(then) if evaluate(condition) else evaluate(otherwise)
+    if operator == "$ifNull":
+        for expression in argument:
+            value = evaluate(expression)
+            if value is not None:
+                return value
+        return None
+    if operator == "$reduce":
+        value = evaluate(argument["initialValue"])
+        for item in evaluate(argument["input"]) or []:
+            value = _evaluate(argument["in"], document, {**(variables or {}), "value": value, "this": item})
+        return value
+
+    arguments = [evaluate(item) for item in argument] if isinstance(argument, list) else evaluate(argument)
+
+    if operator in ("$eq", "$ne", "$gt", "$gte", "$lt", "$lte"):
+        result = _compare(arguments[0], arguments[1])
+        if operator == "$eq":
+            return result == 0
+        if operator == "$ne":
+            return result != 0
+        return _check_order(operator, result)
+    if operator == "$size":
+        if not isinstance(arguments, list):
+            raise OperationFailure("The argument to $size must be an array")
+        return len(arguments)
+    if operator == "$setUnion":
+        result = []
+        for values in arguments:
+            for value in values or []:
+                if not any(_compare(value, existing) == 0 for existing in result):
+                    result.append(value)
+        return result
+    if operator == "$and":
+        return all(arguments)
+    if operator == "$or":
+        return any(arguments)
+    if operator == "$not":
+        return not (arguments[0] if isinstance(arguments, list) else arguments)
+    if operator == "$in":
+        return any(_compare(arguments[0], item) == 0 for item in arguments[1] or [])
+    if operator == "$add":
+        return sum(value or 0 for value in arguments)
+    if operator == "$subtract":
+        return arguments[0] - arguments[1]
+    if operator == "$multiply":
+        result = 1
+        for value in arguments:
+            result *= value
+        return result
+    if operator == "$divide":
+        return arguments[0] / arguments[1]
+    if operator in ("$sum", "$avg", "$max", "$min"):
+        values = arguments if isinstance(arguments, list) else [arguments]
+        if len(values) == 1 and isinstance(values[0], list):
+            values = values[0]
+        return _accumulate(operator, values)
+    if operator == "$arrayElemAt":
+        values, index = arguments
+        return values[index] if values and -len(values) <= index < len(values) else None
+    if operator == "$concat":
+        return "".join(str(value) for value in arguments)
+    if operator == "$toString":
+        return None if arguments is None else str(arguments)
+    raise OperationFailure(f"Expresión no soportada por el backend en memoria: {operator}")
+
+
+def _accumulate(operator: str, values: list):
+    """Acumuladores de $group (también usados como expresiones sobre arrays)."""
+    if operator == "$sum":
+        return sum(value for value in values if isinstance(value, (int, float)) and not isinstance(value, bool))
+    numbers = [value for value in values if isinstance(value, (int, float)) and not isinstance(value, bool)]
+    if operator == "$avg":
+        return sum(numbers) / len(numbers) if numbers else None
+    present = [value for value in values if value is not None]
+    if not present:
+        return None
+    best = present[0]
+    for value in present[1:]:
+        if _compare(value, best) * (1 if operator == "$max" else -1) > 0:
+            best = value
+    return best
+
+
+def _group(documents: list, spec: dict) -> list:
+    groups = {}
+    for document in documents:
+        group_id = _evaluate(spec["_id"], document)
+        key = _hashable(group_id)
+        if key not in groups:
+            groups[key] = {"_id": group_id, "__values__": {field: [] for field in spec if field != "_id"}}
+        for field, accumulator in spec.items():
+            if field == "_id":
+                continue
+            operator, expression = next(iter(accumulator.items()))
+            value = 1 if operator == "$count" else _evaluate(expression, document)
+            groups[key]["__values__"][field].append(value)
+
+    results = []
+    for group in groups.values():
+        result = {"_id": group["_id"]}
+        for field, accumulator in spec.items():
+            if field == "_id":
+                continue
+            operator = next(iter(accumulator))
+            values = group["__values__"][field]
+            if operator in ("$sum", "$count"):
+                result[field] = _accumulate("$sum", values)
+            elif operator in ("$avg", "$max", "$min"):
+                result[field] = _accumulate(operator, values)
+            elif operator == "$first":
+                result[field] = values[0] if values else None
+            elif operator == "$last":
+                result[field] = values[-1] if values else None
+            elif operator == "$push":
+                result[field] = values
+            elif operator == "$addToSet":
+                unique = []
+                for value in values:
+                    if not any(_compare(value, existing) == 0 for existing in unique):
+                        unique.append(value)
+                result[field] = unique
+            else:
+                raise OperationFailure(f"Acumulador no soportado por el backend en memoria: {operator}")
+        results.append(result)
+    return results
+
+
+def _project_stage(documents: list, spec: dict) -> list:
+    exclusions = [field for field, value in spec.items() if value in (0, False)]
+    if exclusions and len(exclusions) == len(spec):
+        return [_project(document, spec) for document in documents]
+
+    results = []
+    for document in documents:
+        result = {}
+        if spec.get("_id", 1) not in (0, False) and "_id" in document:
+            result["_id"] = document["_id"]
+        for field, value in spec.items():
+            if field == "_id" or value in (0, False):
+                continue
+            if value in (1, True):
+                result.update(_include(document, _projection_tree([field])))
+            else:
+                result[field] = _evaluate(value, document)
+        results.append(result)
+    return results
+
+
+def _sort_documents(documents: list, spec, scores: Optional[dict] = None) -> list:
+    """Ordenar documentos según una especificación [(campo, dirección)] o {campo: dirección}."""
+    if isinstance(spec, dict):
+        spec = list(spec.items())
+    fields = [(field, direction) for field, direction in spec]
+
+    def key(document):
+        values, directions = [], []
+        for field, direction in fields:
+            if isinstance(direction, dict) and direction.get("$meta") == "textScore":
+                values.append((scores or {}).get(_doc_key(document), 0.0))
+                directions.append(-1)
+            else:
+                values.append(_sort_value(document, field, direction))
+                directions.append(direction)
+        return _SortKey(values, directions)
+
+    return sorted(documents, key=key)
+
+
+# ============================================================================
+# CURSORES
+# ============================================================================
+
+class MemoryCursor:
+    """Cursor de find: sort, skip, limit y lectura con to_list o async for."""
+
+    def __init__(self, collection: "MemoryCollection", query: dict, projection=None,
+                 sort=None, skip: int = 0, limit: int = 0):
+        self._collection = collection
+        self._query = query
+        self._projection = projection
+        self._sort = sort
+        self._skip = skip
+        self._limit = limit
+        self._results = None
+
+    def sort(self, key_or_list, direction=None) -> "MemoryCursor":
+        if isinstance(key_or_list, str):
+            self._sort = [(key_or_list, ASCENDING if direction is None else direction)]
+        else:
+            self._sort = list(key_or_list)
+        return self
+
+    def skip(self, skip: int) -> "MemoryCursor":
+        self._skip = skip
+        return self
+
+    def limit(self, limit: int) -> "MemoryCursor":
+        self._limit = limit
+        return self
+
+    def batch_size(self, batch_size: int) -> "MemoryCursor":
+        return self
+
+    def hint(self, index) -> "MemoryCursor":
+        return self
+
+    def _execute(self) -> list:
+        if self._results is None:
+            self._results = self._collection._select(
+                self._query, self._projection, self._sort, self._skip, self._limit
+            )
+        return self._results
+
+    async def to_list(self, length: Optional[int] = None) -> list:
+        results = self._execute()
+        return results if length is None else results[:length]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for document in self._execute():
+            yield document
+
+
+class MemoryCommandCursor(MemoryCursor):
+    """Cursor de aggregate y list_indexes sobre resultados ya calculados."""
+
+    def __init__(self, results: list):
+        self._results = results
+
+    def _execute(self) -> list:
+        return self._results
+
+
+# ============================================================================
+# ÍNDICES
+# ============================================================================
+
+class _Index:
+    """Índice secundario: mapas del valor de la primera clave y de la clave completa a _id."""
+
+    def __init__(self, name: str, keys: list, unique: bool = False, weights: Optional[dict] = None,
+                 default_language: str = "english"):
+        self.name = name
+        self.keys = keys
+        self.fields = [field for field, _ in keys]
+        self.unique = unique
+        self.text = any(direction == TEXT for _, direction in keys)
+        self.weights = {field: (weights or {}).get(field, 1) for field in self.fields} if self.text else {}
+        self.default_language = default_language
+        self.by_key = {}
+        self.by_prefix = {}
+        self.accesses = 0
+        self.since = datetime.now(timezone.utc)
+
+    def info(self) -> dict:
+        if self.text:
+            info = {"v": 2, "key": {"_fts": TEXT, "_ftsx": 1}, "name": self.name, "weights": self.weights,
+                    "default_language": self.default_language}
+            if self.unique:
+                info["unique"] = True
+            return info
+        info = {"v": 2, "key": dict(self.keys), "name": self.name}
+        if self.unique:
+            info["unique"] = True
+        return info
+
+    def entries(self, document: dict) -> list:
+        """Claves del documento en el índice (varias si algún campo es un array)."""
+        per_field = []
+        for field in self.fields:
+            values = _values(document, field)
+            expanded = []
+            for value in values:
+                if isinstance(value, list) and value:
+                    expanded.extend(value)
+                else:
+                    expanded.append(None if isinstance(value, list) else value)
+            per_field.append([_hashable(value) for value in expanded] or [None])
+        return list(dict.fromkeys(itertools.product(*per_field)))
+
+    def add(self, document: dict):
+        key = _doc_key(document)
+        for entry in self.entries(document):
+            self.by_key.setdefault(entry, set()).add(key)
+            self.by_prefix.setdefault(entry[0], set()).add(key)
+
+    def remove(self, document: dict):
+        key = _doc_key(document)
+        for entry in self.entries(document):
+            for mapping, mapping_key in ((self.by_key, entry), (self.by_prefix, entry[0])):
+                ids = mapping.get(mapping_key)
+                if ids is not None:
+                    ids.discard(key)
+                    if not ids:
+                        del mapping[mapping_key]
+
+    def conflict(self, document: dict):
+        """_id de otro documento con la misma clave única (None si no hay conflicto)."""
+        key = _doc_key(document)
+        for entry in self.entries(document):
+            for other in self.by_key.get(entry, ()):
+                if other != key:
+                    return entry
+        return None
+
+
+def _equality_values(condition) -> Optional[list]:
+    """Valores de igualdad de una condición ({campo: v} o {campo: {$in: [...]}}) o None."""
+    if _is_operator_dict(condition):
+        if set(condition) == {"$in"}:
+            values = condition["$in"]
+        elif set(condition) == {"$eq"}:
+            values = [condition["$eq"]]
+        else:
+            return None
+    else:
+        values = [condition]
+    if any(isinstance(value, (dict, list, re.Pattern)) for value in values):
+        return None
+    return [_hashable(value) for value in values]
+
+
+# ============================================================================
+# COLECCIÓN, BASE DE DATOS Y CLIENTE
+# ============================================================================
+
+class MemoryCollection:
+    """
+    Colección en memoria con la interfaz asíncrona de una colección de Motor.
+
+    Los documentos se guardan en un diccionario _id → documento (en orden de
+    inserción, el orden natural) y se devuelven siempre como copias, así que
+    modificar un resultado no altera la colección.
+
+    Atributos:
+        name (str): Nombre de la colección
+        database (MemoryDatabase): Base de datos a la que pertenece
+    """
+
+    def __init__(self, database: "MemoryDatabase", name: str):
+        self.database = database
+        self.name = name
+        self._documents = {}
+        self._order = {}
+        self._sequence = itertools.count()
+        self._indexes = {}
+        self._id_index_accesses = 0
+
+    def __repr__(self) -> str:
+        return f"MemoryCollection({self.database.name!r}, {self.name!r})"
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.database.name}.{self.name}"
+
+    # ------------------------------------------------------------------
+    # Selección de documentos
+    # ------------------------------------------------------------------
+
+    def _candidate_ids(self, query: dict) -> Optional[list]:
+        """_id a evaluar usando el índice más selectivo (None = recorrer la colección)."""
+        best = None
+        id_values = _equality_values(query["_id"]) if "_id" in query else None
+        if id_values is not None:
+            self._id_index_accesses += 1
+            best = [value for value in id_values if value in self._documents]
+
+        for index in self._indexes.values():
+            if index.text or index.fields[0] not in query:
+                continue
+            values = [_equality_values(query.get(field)) if field in query else None for field in index.fields]
+            if values[0] is None:
+                continue
+            if all(value is not None for value in values):
+                ids = set()
+                for key in itertools.product(*values):
+                    ids.update(index.by_key.get(key, ()))
+            else:
+                ids = set()
+                for value in values[0]:
+                    ids.update(index.by_prefix.get(value, ()))
+            if best is None or len(ids) < len(best):
+                best = list(ids)
+                index.accesses += 1
+        if best is None:
+            return None
+        return sorted(set(best), key=lambda _id: self._order[_id])
+
+    def _text_scores(self, query: dict) -> Optional[dict]:
+        """Puntuaciones de $text por _id (None si la consulta no usa $text)."""
+        if "$text" not in query:
+            return None
+        text_index = next((index for index in self._indexes.values() if index.text), None)
+        if text_index is None:
+            raise OperationFailure("text index required for $text query", code=27)
+        terms = set(_normalize_text(query["$text"].get("$search", "")))
+        scores = {}
+        for _id, document in self._documents.items():
+            score = 0.0
+            for field, weight in text_index.weights.items():
+                for value in _candidates(_values(document, field)):
+                    if isinstance(value, str):
+                        words = _normalize_text(value)
+                        matches = sum(1 for word in words if word in terms)
+                        if matches:
+                            score += weight * matches / len(words)
+            if score:
+                scores[_id] = score
+        text_index.accesses += 1
+        return scores
+
+    def _matching(self, query: Optional[dict]) -> tuple:
+        """Documentos (originales, sin copiar) que cumplen el filtro y puntuaciones de $text."""
+        query = self._normalize_query(query)
+        scores = self._text_scores(query)
+        ids = self._candidate_ids(query)
+        if scores is not None:
+            ids = [_id for _id in (ids if ids is not None else self._documents) if _id in scores]
+        documents = self._documents.values() if ids is None else (self._documents[_id] for _id in ids)
+        return [document for document in documents if _matches(document, query)], scores
+
+    @staticmethod
+    def _normalize_query(query) -> dict:
+        if query is None:
+            return {}
+        if not isinstance(query, dict):
+            return {"_id": query}
+        return query
+
+    def _select(self, query, projection=None, sort=None, skip: int = 0, limit: int = 0) -> list:
+        documents, scores = self._matching(query)
+        if sort:
+            documents = _sort_documents(documents, sort, scores)
+        if skip:
+            documents = documents[skip:]
+        if limit:
+            documents = documents[:limit]
+        return [_project(document, projection, (scores or {}).get(_doc_key(document))) for document in documents]
+
+    # ------------------------------------------------------------------
+    # Escritura interna
+    # ------------------------------------------------------------------
+
+    def _check_unique(self, document: dict):
+        for index in self._indexes.values():
+            if index.unique:
+                entry = index.conflict(document)
+                if entry is not None:
+                    raise DuplicateKeyError(
+                        f"E11000 duplicate key error collection: {self.full_name} "
+                        f"index: {index.name} dup key: {dict(zip(index.fields, entry))}",
+                        code=DUPLICATE_KEY_ERROR,
+                    )
+
+    def _insert(self, document: dict):
+        if "_id" not in document:
+            document["_id"] = ObjectId()
+        key = _doc_key(document)
+        if key in self._documents:
+            raise DuplicateKeyError(
+                f"E11000 duplicate key error collection: {self.full_name} index: _id_ "
+                f"dup key: {{_id: {document['_id']!r}}}",
+                code=DUPLICATE_KEY_ERROR,
+            )
+        # MongoDB guarda el _id como primer campo
+        stored = {"_id": document["_id"], **_copy(document)}
+        self._check_unique(stored)
+        self._documents[key] = stored
+        self._order[key] = next(self._sequence)
+        for index in self._indexes.values():
+            index.add(stored)
+        return document["_id"]
+
+    def _replace_stored(self, current: dict, new: dict):
+        """Sustituir un documento guardado manteniendo índices y orden natural."""
+        for index in self._indexes.values():
+            index.remove(current)
+        try:
+            self._check_unique(new)
+        except DuplicateKeyError:
+            for index in self._indexes.values():
+                index.add(current)
+            raise
+        self._documents[_doc_key(current)] = new
+        for index in self._indexes.values():
+            index.add(new)
+
+    def _update_document(self, current: dict, update, array_filters=None, replacement: bool = False) -> bool:
+        if replacement:
+            new = {"_id": current["_id"], **{key: value for key, value in _copy(update).items() if key != "_id"}}
+            changed = new != current
+        else:
+            new = _copy(current)
+            _apply_update(new, update, array_filters, inserting=False)
+            changed = new != current
+            if _hashable(new.get("_id")) != _doc_key(current):
+                raise OperationFailure("Performing an update on the path '_id' would modify the immutable field '_id'")
+        if changed:
+            self._replace_stored(current, new)
+        return changed
+
+    def _upsert(self, query: dict, update, array_filters=None, replacement: bool = False):
+        document = _upsert_seed(self._normalize_query(query))
+        if replacement:
+            document = {**({"_id": document["_id"]} if "_id" in document else {}), **_copy(update)}
+        else:
+            _apply_update(document, update, array_filters, inserting=True)
+        return self._insert(document)
+
+    def _update(self, query, update, upsert=False, array_filters=None, multi=False, replacement=False) -> dict:
+        if not replacement and not _is_operator_dict(update):
+            raise ValueError("update only works with $ operators")
+        documents, _ = self._matching(query)
+        if not multi:
+            documents = documents[:1]
+        modified = 0
+        for document in documents:
+            if self._update_document(document, update, array_filters, replacement):
+                modified += 1
+        raw = {"n": len(documents), "nModified": modified, "ok": 1.0, "updatedExisting": bool(documents)}
+        if not documents and upsert:
+            raw["upserted"] = self._upsert(query, update, array_filters, replacement)
+            raw["n"] = 1
+        return raw
+
+    def _delete(self, query, multi: bool) -> int:
+        documents, _ = self._matching(query)
+        if not multi:
+            documents = documents[:1]
+        for document in documents:
+            for index in self._indexes.values():
+                index.remove(document)
+            key = _doc_key(document)
+            del self._documents[key]
+            del self._order[key]
+        return len(documents)
+
+    # ------------------------------------------------------------------
+    # API de Motor
+    # ------------------------------------------------------------------
+
+    def find(self, filter=None, projection=None, *args, sort=None, skip: int = 0, limit: int = 0,
+             session=None, **kwargs) -> MemoryCursor:
+        return MemoryCursor(self, self._normalize_query(filter), projection, sort, skip, limit)
+
+    async def find_one(self, filter=None, projection=None, *args, sort=None, session=None, **kwargs):
+        results = self._select(filter, projection, sort, kwargs.get("skip", 0), 1)
+        return results[0] if results else None
+
+    async def insert_one(self, document: dict, session=None, **kwargs) -> InsertOneResult:
+        return InsertOneResult(self._insert(document), True)
+
+    async def insert_many(self, documents: list, ordered: bool = True, session=None, **kwargs) -> InsertManyResult:
+        inserted, errors = [], []
+        for position, document in enumerate(documents):
+            try:
+                inserted.append(self._insert(document))
+            except DuplicateKeyError as e:
+                errors.append({"index": position, "code": DUPLICATE_KEY_ERROR, "errmsg": str(e), "op": document})
+                if ordered:
+                    break
+        if errors:
+            raise BulkWriteError(self._bulk_result(n_inserted=len(inserted), errors=errors))
+        return InsertManyResult(inserted, True)
+
+    async def update_one(self, filter, update, upsert: bool = False, array_filters=None,
+                         session=None, **kwargs) -> UpdateResult:
+        return UpdateResult(self._update(filter, update, upsert, array_filters), True)
+
+    async def update_many(self, filter, update, upsert: bool = False, array_filters=None,
+                          session=None, **kwargs) -> UpdateResult:
+        return UpdateResult(self._update(filter, update, upsert, array_filters, multi=True), True)
+
+    async def replace_one(self, filter, replacement: dict, upsert: bool = False,
+                          session=None, **kwargs) -> UpdateResult:
+        return UpdateResult(self._update(filter, replacement, upsert, replacement=True), True)
+
+    async def delete_one(self, filter, session=None, **kwargs) -> DeleteResult:
+        return DeleteResult({"n": self._delete(filter, multi=False), "ok": 1.0}, True)
+
+    async def delete_many(self, filter, session=None, **kwargs) -> DeleteResult:
+        return DeleteResult({"n": self._delete(filter, multi=True), "ok": 1.0}, True)
+
+    async def find_one_and_update(self, filter, update, projection=None, sort=None, upsert: bool = False,
+                                  return_document=ReturnDocument.BEFORE, array_filters=None,
+                                  session=None, **kwargs):
+        return self._find_and_modify(filter, update, projection, sort, upsert, return_document,
+                                     array_filters, replacement=False)
+
+    async def find_one_and_replace(self, filter, replacement: dict, projection=None, sort=None,
+                                   upsert: bool = False, return_document=ReturnDocument.BEFORE,
+                                   session=None, **kwargs):
+        return self._find_and_modify(filter, replacement, projection, sort, upsert, return_document,
+                                     None, replacement=True)
+
+    async def find_one_and_delete(self, filter, projection=None, sort=None, session=None, **kwargs):
+        documents, _ = self._matching(filter)
+        if sort:
+            documents = _sort_documents(documents, sort)
+        if not documents:
+            return None
+        document = documents[0]
+        self._delete({"_id": document["_id"]}, multi=False)
+        return _project(document, projection)
+
+    def _find_and_modify(self, filter, update, projection, sort, upsert, return_document,
+                         array_filters, replacement: bool):
+        documents, _ = self._matching(filter)
+        if sort:
+            documents = _sort_documents(documents, sort)
+        if not documents:
+            if not upsert:
+                return None
+            _id = self._upsert(filter, update, array_filters, replacement)
+            return _project(self._documents[_hashable(_id)], projection) if return_document else None
+        current = documents[0]
+        before = _project(current, projection)
+        self._update_document(current, update, array_filters, replacement)
+        if return_document:
+            return _project(self._documents[_doc_key(current)], projection)
+        return before
+
+    async def count_documents(self, filter=None, session=None, limit: int = 0, skip: int = 0, **kwargs) -> int:
+        count = max(len(self._matching(filter)[0]) - (skip or 0), 0)
+        return min(count, limit) if limit else count
+
+    async def estimated_document_count(self, **kwargs) -> int:
+        return len(self._documents)
+
+    async def distinct(self, key: str, filter=None, session=None, **kwargs) -> list:
+        values = []
+        for document in self._matching(filter)[0]:
+            for value in _candidates(_values(document, key)):
+                if isinstance(value, list):
+                    continue
+                if not any(_compare(value, existing) == 0 for existing in values):
+                    values.append(value)
+        return values
+
+    async def bulk_write(self, requests: list, ordered: bool = True, session=None, **kwargs) -> BulkWriteResult:
+        counts = {"inserted": 0, "matched": 0, "modified": 0, "removed": 0}
+        upserted, errors = [], []
+        for position, request in enumerate(requests):
+            try:
+                if isinstance(request, InsertOne):
+                    self._insert(request._doc)
+                    counts["inserted"] += 1
+                elif isinstance(request, (UpdateOne, UpdateMany, ReplaceOne)):
+                    replacement = isinstance(request, ReplaceOne)
+                    raw = self._update(
+                        request._filter,
+                        request._doc,
+                        request._upsert,
+                        None if replacement else request._array_filters,
+                        multi=isinstance(request, UpdateMany),
+                        replacement=replacement,
+                    )
+                    if "upserted" in raw:
+                        upserted.append({"index": position, "_id": raw["upserted"]})
+                    else:
+                        counts["matched"] += raw["n"]
+                        counts["modified"] += raw["nModified"]
+                elif isinstance(request, (DeleteOne, DeleteMany)):
+                    counts["removed"] += self._delete(request._filter, multi=isinstance(request, DeleteMany))
+                else:
+                    raise TypeError(f"{request!r} is not a valid request")
+            except DuplicateKeyError as e:
+                errors.append({"index": position, "code": DUPLICATE_KEY_ERROR, "errmsg": str(e)})
+                if ordered:
+                    break
+
+        result = self._bulk_result(counts["inserted"], counts["matched"], counts["modified"],
+                                   counts["removed"], upserted, errors)
+        if errors:
+            raise BulkWriteError(result)
+        return BulkWriteResult(result, True)
+
+    @staticmethod
+    def _bulk_result(n_inserted: int = 0, n_matched: int = 0, n_modified: int = 0, n_removed: int = 0,
+                     upserted: Optional[list] = None, errors: Optional[list] = None) -> dict:
+        return {
+            "writeErrors": errors or [],
+            "writeConcernErrors": [],
+            "nInserted": n_inserted,
+            "nUpserted": len(upserted or []),
+            "nMatched": n_matched,
+            "nModified": n_modified,
+            "nRemoved": n_removed,
+            "upserted": upserted or [],
+        }
+
+    def aggregate(self, pipeline: list, session=None, **kwargs) -> MemoryCommandCursor:
+        if pipeline and "$indexStats" in pipeline[0]:
+            documents = [{"name": "_id_", "key": {"_id": 1},
+                          "accesses": {"ops": self._id_index_accesses, "since": datetime.now(timezone.utc)}}]
+            documents += [
+                {"name": index.name, "key": index.info()["key"],
+                 "accesses": {"ops": index.accesses, "since": index.since}}
+                for index in self._indexes.values()
+            ]
+            pipeline = pipeline[1:]
+        else:
+            documents = None
+
+        scores = None
+        for position, stage in enumerate(pipeline):
+            operator, spec = next(iter(stage.items()))
+            if operator == "$match":
+                if documents is None:
+                    # El primer $match usa los índices de la colección
+                    documents, scores = self._matching(spec)
+                    documents = [_copy(document) for document in documents]
+                else:
+                    documents = [document for document in documents if _matches(document, spec)]
+                continue
+            if documents is None:
+                documents = [_copy(document) for document in self._documents.values()]
+
+            if operator == "$group":
+                documents = _group(documents, spec)
+            elif operator == "$project":
+                documents = _project_stage(documents, spec)
+            elif operator in ("$addFields", "$set"):
+                documents = [{**document, **{field: _evaluate(expression, document)
+                                             for field, expression in spec.items()}} for document in documents]
+            elif operator == "$sort":
+                documents = _sort_documents(documents, spec, scores)
+            elif operator == "$skip":
+                documents = documents[spec:]
+            elif operator == "$limit":
+                documents = documents[:spec]
+            elif operator == "$count":
+                documents = [{spec: len(documents)}] if documents else []
+            elif operator == "$unwind":
+                path = spec if isinstance(spec, str) else spec["path"]
+                field = path[1:]
+                unwound = []
+                for document in documents:
+                    values = _field_value(document, field)
+                    for value in values if isinstance(values, list) else []:
+                        unwound.append({**document, field: value})
+                documents = unwound
+            else:
+                raise OperationFailure(f"Etapa de agregación no soportada por el backend en memoria: {operator}")
+
+        if documents is None:
+            documents = [_copy(document) for document in self._documents.values()]
+        return MemoryCommandCursor(documents)
+
+    # ------------------------------------------------------------------
+    # Índices
+    # ------------------------------------------------------------------
+
+    async def create_index(self, keys, name: Optional[str] = None, unique: bool = False,
+                           weights: Optional[dict] = None, default_language: str = "english", **kwargs) -> str:
+        if isinstance(keys, str):
+            keys = [(keys, ASCENDING)]
+        keys = list(keys.items()) if isinstance(keys, dict) else list(keys)
+        name = name or "_".join(f"{field}_{direction}" for field, direction in keys)
+        if name in self._indexes:
+            return name
+
+        index = _Index(name, keys, unique=unique, weights=weights, default_language=default_language)
+        for document in self._documents.values():
+            if index.unique and index.conflict(document) is not None:
+                raise DuplicateKeyError(
+                    f"E11000 duplicate key error collection: {self.full_name} index: {name}",
+                    code=DUPLICATE_KEY_ERROR,
+                )
+            index.add(document)
+        self._indexes[name] = index
+        return name
+
+    async def create_indexes(self, indexes: list, session=None, **kwargs) -> List[str]:
+        names = []
+        for model in indexes:
+            document = dict(model.document)
+            keys = list(document.pop("key").items())
+            names.append(await self.create_index(keys, **document))
+        return names
+
+    def list_indexes(self, session=None, **kwargs) -> MemoryCommandCursor:
+        indexes = [{"v": 2, "key": {"_id": 1}, "name": "_id_"}]
+        indexes += [index.info() for index in self._indexes.values()]
+        return MemoryCommandCursor(indexes)
+
+    async def index_information(self, session=None, **kwargs) -> dict:
+        return {
+            info["name"]: {"key": list(info["key"].items()), **({"unique": True} if info.get("unique") else {})}
+            for info in self.list_indexes()._results
+        }
+
+    async def drop_index(self, index_or_name, session=None, **kwargs):
+        if index_or_name not in self._indexes:
+            raise OperationFailure(f"index not found with name [{index_or_name}]", code=27)
+        del self._indexes[index_or_name]
+
+    async def drop(self, session=None, **kwargs):
+        self.database._collections.pop(self.name, None)
+
+
+class MemoryDatabase:
+    """Base de datos en memoria: crea las colecciones al primer acceso, como MongoDB."""
+
+    def __init__(self, client: "MemoryClient", name: str):
+        self.client = client
+        self.name = name
+        self._collections = {}
+
+    def __getitem__(self, name: str) -> MemoryCollection:
+        return self.get_collection(name)
+
+    def __getattr__(self, name: str) -> MemoryCollection:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self.get_collection(name)
+
+    def __repr__(self) -> str:
+        return f"MemoryDatabase({self.name!r})"
+
+    def get_collection(self, name: str, **kwargs) -> MemoryCollection:
+        if name not in self._collections:
+            self._collections[name] = MemoryCollection(self, name)
+        return self._collections[name]
+
+    async def list_collection_names(self, **kwargs) -> List[str]:
+        return list(self._collections)
+
+    async def drop_collection(self, name, **kwargs):
+        self._collections.pop(getattr(name, "name", name), None)
+
+    async def command(self, command, *args, **kwargs) -> dict:
+        name = command if isinstance(command, str) else next(iter(command))
+        if name == "ping":
+            return {"ok": 1.0}
+        if name in ("hello", "isMaster"):
+            # Sin setName ni msg="isdbgrid": los servicios no abren transacciones
+            return {"isWritablePrimary": True, "ok": 1.0}
+        raise OperationFailure(f"Comando no soportado por el backend en memoria: {name}")
+
+
+class MemoryClient:
+    """
+    Cliente en memoria con la interfaz mínima de AsyncIOMotorClient.
+
+    Cada cliente tiene sus propias bases de datos; crear un cliente nuevo
+    equivale a empezar con una base de datos vacía.
+
+    Ejemplo:
+        >>> client = MemoryClient()
+        >>> db = client.get_default_database()
+    """
+
+    def __init__(self, default_database: str = MEMORY_DATABASE_NAME):
+        self._default_database = default_database
+        self._databases = {}
+        self.admin = self.get_database("admin")
+
+    def __getitem__(self, name: str) -> MemoryDatabase:
+        return self.get_database(name)
+
+    def get_database(self, name: str, **kwargs) -> MemoryDatabase:
+        if name not in self._databases:
+            self._databases[name] = MemoryDatabase(self, name)
+        return self._databases[name]
+
+    def get_default_database(self, default: Optional[str] = None, **kwargs) -> MemoryDatabase:
+        return self.get_database(default or self._default_database)
+
+    async def drop_database(self, name, **kwargs):
+        self._databases.pop(getattr(name, "name", name), None)
+
+    def close(self):
+        self._databases.clear()
+
@@ -0,0 +1,270 @@
+"""
+Ejecución de migraciones de datos por lotes y reanudables.
+
+Una migración recorre una colección por orden de _id en lotes de tamaño
+configurable (paginación por cursor, nunca carga la colección entera) y, por
+cada documento, genera actualizaciones dirigidas (UpdateOne con $set y, si
+hace falta, array_filters para tocar solo los elementos de un array). Cada
+lote se escribe con un único bulk_write no ordenado y después se guarda el
+último _id procesado en la colección migrations, de modo que si la ejecución
+se interrumpe la siguiente continúa desde ese punto.
+
+Documentos de la colección migrations:
+    {_id: nombre, version, status ("running" | "completed"), lastId,
+     processed, modified, startedAt, updatedAt, completedAt}
+
+Una migración completada no se vuelve a ejecutar salvo que se incremente su
+version o se pida restart=True.
+
+Clases y funciones:
+- Migration: Clase base para declarar una migración
+- run_migration: Ejecutar (o reanudar) una migración
+- get_migration_status: Consultar el estado guardado de una migración
+
+Ejemplo:
+    >>> class AddFlag(Migration):
+    ...     name = "add_flag_to_courses"
+    ...     collection = "courses"
+    ...     query = {"flag": {"$exists": False}}
+    ...     def build_updates(self, document):
+    ...         return [UpdateOne({"_id": document["_id"]}, {"$set": {"flag": True}})]
+    >>> report = await run_migration(AddFlag(), batch_size=500)
+"""
+
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+from pymongo import UpdateOne
+from E_Learning_JCB_Reflex.database.mongodb import MongoDB
+
+
+MIGRATIONS_COLLECTION = "migrations"
+
+# Documentos por lote por defecto
+DEFAULT_BATCH_SIZE = 500
+
+
+class Migration(ABC):
+    """
+    Clase base abstracta de una migración de datos.
+
+    Las subclases definen el nombre, la colección a recorrer, el filtro y la
+    proyección de los documentos que necesitan cambios, y build_updates, que
+    devuelve las actualizaciones de un documento (método abstracto: una
+    subclase que no lo implemente falla al instanciarse). build_updates no debe
+    depender de otros documentos: los lotes se pueden repetir tras una
+    interrupción, así que las actualizaciones deben ser idempotentes.
+
+    Atributos:
+        name (str): Identificador único de la migración (_id en migrations)
+        version (int): Versión; al incrementarla la migración se vuelve a ejecutar
+        collection (str): Colección que se recorre
+        target_collection (str): Colección en la que se escriben las
+            actualizaciones (por defecto la recorrida)
+        query (dict): Filtro de los documentos a migrar
+        projection (Optional[dict]): Campos que necesita build_updates
+        description (str): Descripción para los informes
+    """
+
+    name: str = ""
+    version: int = 1
+    collection: str = ""
+    target_collection: str = ""
+    query: dict = {}
+    projection: Optional[dict] = None
+    description: str = ""
+
+    @abstractmethod
+    def build_updates(self, document: dict) -> List[UpdateOne]:
+        """
+        Generar las actualizaciones de un documento.
+
+        Args:
+            document: Documento de la colección (con los campos de projection)
+
+        Returns:
+            List[UpdateOne]: Actualizaciones a aplicar sobre target_collection
+            (vacía si el documento no necesita cambios)
+        """
+
+    async def after_write(self, documents: List[dict]) -> None:
+        """
+        Hook llamado tras escribir cada lote y antes de guardar su checkpoint.
+
+        Sirve para efectos que deben acompañar a la escritura, como invalidar
+        cachés de los documentos modificados: al ejecutarse antes del
+        checkpoint, un lote interrumpido se repite completo al reanudar. No se
+        llama en dry_run.
+
+        Args:
+            documents: Documentos del lote que generaron actualizaciones
+        """
+
+
+async def get_migration_status(name: str) -> Optional[dict]:
+    """
+    Consultar el estado guardado de una migración.
+
+    Args:
+        name: Nombre de la migración
+
+    Returns:
+        Optional[dict]: Documento de la colección migrations o None si nunca
+        se ha ejecutado
+    """
+    db = MongoDB.get_db()
+    return await db[MIGRATIONS_COLLECTION].find_one({"_id": name})
+
+
+async def run_migration(
+    migration: Migration,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    restart: bool = False,
+    on_batch: Optional[Callable[[dict], None]] = None,
+) -> dict:
+    """
+    Ejecutar una migración por lotes, reanudando desde el último checkpoint.
+
+    Por cada lote: lee hasta batch_size documentos con _id mayor que el último
+    procesado, genera sus actualizaciones, las aplica con un bulk_write no
+    ordenado, llama a migration.after_write y guarda el nuevo checkpoint. En dry_run no escribe nada (ni
+    actualizaciones ni checkpoint) y solo cuenta las actualizaciones que se
+    aplicarían.
+
+    Args:
+        migration: Migración a ejecutar
+        batch_size: Documentos leídos por lote
+        dry_run: Simular sin escribir
+        restart: Ignorar el checkpoint y el estado completado y empezar de cero
+        on_batch: Función llamada tras cada lote con el informe parcial
+
+    Returns:
+        dict: Informe con las claves:
+            - name (str): Nombre de la migración
+            - status (str): "completed", "already_completed" o "dry_run"
+            - processed (int): Documentos leídos (acumulado si se reanudó)
+            - updates (int): Actualizaciones enviadas (o que se enviarían)
+            - modified (int): Documentos modificados (acumulado si se reanudó)
+            - resumed_from (str): _id desde el que se reanudó ("" si desde el inicio)
+            - elapsed (float): Segundos de esta ejecución
+            - docs_per_second (float): Documentos leídos por segundo en esta ejecución
+
+    Ejemplo:
+        >>> report = await run_migration(AddVideoUrlsToLessons(), batch_size=1000)
+        >>> print(report["modified"], report["docs_per_second"])
+    """
+    db = MongoDB.get_db()
+    migrations_collection = db[MIGRATIONS_COLLECTION]
+    source = db[migration.collection]
+    target = db[migration.target_collection or migration.collection]
+
+    state = await migrations_collection.find_one({"_id": migration.name})
+    if state and state.get("version") != migration.version:
+        # Nueva versión de la migración: empezar de cero
+        state = None
+
+    report = {
+        "name": migration.name,
+        "status": "dry_run" if dry_run else "completed",
+        "processed": 0,
+        "updates": 0,
+        "modified": 0,
+        "resumed_from": "",
+        "elapsed": 0.0,
+        "docs_per_second": 0.0,
+    }
+
+    if state and not restart:
+        if state.get("status") == "completed":
+            report.update(status="already_completed", processed=state.get("processed", 0),
+                          modified=state.get("modified", 0))
+            return report
+        last_id = state.get("lastId")
+        report["processed"] = state.get("processed", 0)
+        report["modified"] = state.get("modified", 0)
+        report["resumed_from"] = str(last_id) if last_id is not None else ""
+    else:
+        last_id = None
+
+    if not dry_run:
+        now = datetime.now(timezone.utc)
+        running = {
+            "version": migration.version,
+            "description": migration.description,
+            "status": "running",
+            "lastId": last_id,
+            "processed": report["processed"],
+            "modified": report["modified"],
+            "updatedAt": now,
+        }
+        if last_id is None:
+            running["startedAt"] = now
+        await migrations_collection.update_one({"_id": migration.name}, {"$set": running}, upsert=True)
+
+    start = time.perf_counter()
+    processed_now = 0
+
+    while True:
+        query = migration.query
+        if last_id is not None:
+            query = {"$and": [migration.query, {"_id": {"$gt": last_id}}]}
+
+        batch = await (
+            source.find(query, migration.projection)
+            .sort("_id", 1)
+            .limit(batch_size)
+            .to_list(length=batch_size)
+        )
+        if not batch:
+            break
+
+        operations = []
+        updated_documents = []
+        for document in batch:
+            updates = migration.build_updates(document)
+            if updates:
+                operations.extend(updates)
+                updated_documents.append(document)
+
+        if operations and not dry_run:
+            result = await target.bulk_write(operations, ordered=False)
+            report["modified"] += result.modified_count
+            await migration.after_write(updated_documents)
+
+        last_id = batch[-1]["_id"]
+        processed_now += len(batch)
+        report["processed"] += len(batch)
+        report["updates"] += len(operations)
+
+        if not dry_run:
+            # Checkpoint después de escribir el lote
+            await migrations_collection.update_one(
+                {"_id": migration.name},
+                {"$set": {
+                    "lastId": last_id,
+                    "processed": report["processed"],
+                    "modified": report["modified"],
+                    "updatedAt": datetime.now(timezone.utc),
+                }},
+            )
+
+        report["elapsed"] = time.perf_counter() - start
+        report["docs_per_second"] = processed_now / max(report["elapsed"], 1e-9)
+        if on_batch:
+            on_batch(dict(report))
+
+        if len(batch) < batch_size:
+            break
+
+    report["elapsed"] = time.perf_counter() - start
+    report["docs_per_second"] = processed_now / max(report["elapsed"], 1e-9)
+
+    if not dry_run:
+        await migrations_collection.update_one(
+            {"_id": migration.name},
+            {"$set": {"status": "completed", "completedAt": datetime.now(timezone.utc)}},
+        )
+
+    return report
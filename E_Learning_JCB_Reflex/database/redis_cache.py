@@ -0,0 +1,269 @@
+"""
+Caché compartida en Redis entre los workers del backend.
+
+Cada worker de Granian tiene su propia memoria, así que una caché en proceso
+se duplica y caduca de forma independiente en cada uno. Este módulo añade una
+capa opcional en Redis, común a todos los workers, con:
+
+- Claves versionadas: cada grupo de claves depende de un contador de versión
+  en Redis. Invalidar es incrementar el contador (INCR), de modo que las
+  entradas antiguas dejan de leerse y expiran solas por TTL, y un worker que
+  estaba cargando datos anteriores a la escritura los guarda bajo la versión
+  vieja, que ya nadie lee.
+- Difusión de invalidaciones por pub/sub para que cada worker descarte
+  también su caché en memoria.
+- Cubos de tokens compartidos (take_token) para limitar la frecuencia de
+  operaciones caras, como los intentos de login, entre todos los workers.
+- Degradación transparente: si REDIS_URL no está configurada, la librería
+  redis no está instalada o el servidor no responde, las funciones se
+  comportan como una caché vacía y los servicios consultan MongoDB.
+
+Los valores se serializan con bson.json_util, que conserva ObjectId y datetime,
+por lo que se pueden guardar documentos de MongoDB tal cual.
+
+Variables de entorno opcionales:
+- REDIS_URL: URI de Redis (ejemplo: redis://localhost:6379/0). Sin ella la caché está desactivada.
+- REDIS_CACHE_TTL_SECONDS: Vida de las entradas en Redis (por defecto 300)
+- REDIS_SOCKET_TIMEOUT_MS: Tiempo máximo por operación antes de recurrir a MongoDB (por defecto 200)
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Awaitable, Callable
+from bson import json_util
+from dotenv import load_dotenv
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # redis es opcional: sin él la caché compartida queda desactivada
+    aioredis = None
+
+# Cargar variables de entorno desde archivo .env
+load_dotenv()
+
+REDIS_URL = os.getenv("REDIS_URL", "")
+REDIS_CACHE_TTL_SECONDS = int(os.getenv("REDIS_CACHE_TTL_SECONDS", "300"))
+REDIS_SOCKET_TIMEOUT = int(os.getenv("REDIS_SOCKET_TIMEOUT_MS", "200")) / 1000
+
+# Segundos sin intentar usar Redis tras un fallo, para no añadir latencia a cada request
+REDIS_RETRY_AFTER_SECONDS = 30
+
+# Cubo de tokens atómico: KEYS[1] = cubo, ARGV = capacidad, tokens por segundo.
+# Devuelve los segundos de espera como string (0 si se consumió un token).
+_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisCache:
+    """
+    Gestor de la conexión a Redis usada como caché compartida.
+
+    Igual que MongoDB, es un singleton a nivel de clase. Todas las operaciones
+    capturan sus errores: un fallo de Redis nunca interrumpe una petición, solo
+    desactiva la caché durante REDIS_RETRY_AFTER_SECONDS.
+
+    Ejemplo:
+        >>> docs = await RedisCache.get_or_set(
+        ...     "elearning:v1:catalog:version", "popular:6", load_popular_docs
+        ... )
+        >>> await RedisCache.bump_version("elearning:v1:catalog:version")
+    """
+
+    client = None
+    _token_bucket = None
+    _unavailable_until: float = 0.0
+
+    @classmethod
+    def enabled(cls) -> bool:
+        """Indica si la caché compartida está configurada y disponible."""
+        return bool(REDIS_URL) and aioredis is not None and time.monotonic() >= cls._unavailable_until
+
+    @classmethod
+    def _get_client(cls):
+        """Crear el cliente de Redis de forma perezosa."""
+        if cls.client is None:
+            cls.client = aioredis.Redis.from_url(
+                REDIS_URL,
+                decode_responses=True,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+            )
+        return cls.client
+
+    @classmethod
+    def _mark_unavailable(cls, error: Exception):
+        """Desactivar temporalmente la caché tras un error de Redis."""
+        print(f"Redis cache unavailable, falling back to MongoDB: {error}")
+        cls._unavailable_until = time.monotonic() + REDIS_RETRY_AFTER_SECONDS
+
+    @classmethod
+    async def get_or_set(
+        cls,
+        version_key: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int = REDIS_CACHE_TTL_SECONDS,
+    ) -> Any:
+        """
+        Obtener un valor de una clave versionada o cargarlo y guardarlo.
+
+        La clave real es "{version_key}:{versión}:{key}", donde la versión es el
+        valor actual del contador version_key.
+
+        Args:
+            version_key: Clave del contador de versión del grupo
+            key: Sufijo de la clave dentro del grupo
+            loader: Función sin argumentos que devuelve un awaitable con el valor
+                    (serializable con bson.json_util)
+            ttl: Segundos de vida de la entrada
+
+        Returns:
+            Any: Valor de Redis o el devuelto por loader(). None no se guarda.
+        """
+        if not cls.enabled():
+            return await loader()
+
+        full_key = None
+        try:
+            client = cls._get_client()
+            version = await client.get(version_key) or "0"
+            full_key = f"{version_key}:{version}:{key}"
+
+            cached = await client.get(full_key)
+            if cached is not None:
+                return json_util.loads(cached)
+        except Exception as e:
+            cls._mark_unavailable(e)
+
+        value = await loader()
+
+        if value is not None and full_key is not None and cls.enabled():
+            try:
+                await cls._get_client().set(full_key, json_util.dumps(value), ex=ttl)
+            except Exception as e:
+                cls._mark_unavailable(e)
+
+        return value
+
+    @classmethod
+    async def bump_version(cls, *version_keys: str) -> None:
+        """
+        Invalidar uno o varios grupos de claves incrementando sus versiones.
+
+        Args:
+            version_keys: Claves de los contadores de versión a incrementar
+        """
+        if not cls.enabled() or not version_keys:
+            return
+        try:
+            async with cls._get_client().pipeline(transaction=False) as pipe:
+                for version_key in version_keys:
+                    pipe.incr(version_key)
+                await pipe.execute()
+        except Exception as e:
+            cls._mark_unavailable(e)
+
+    @classmethod
+    async def publish(cls, channel: str, message: str) -> None:
+        """
+        Difundir un mensaje de invalidación a todos los workers.
+
+        Args:
+            channel: Canal de pub/sub
+            message: Contenido del mensaje
+        """
+        if not cls.enabled():
+            return
+        try:
+            await cls._get_client().publish(channel, message)
+        except Exception as e:
+            cls._mark_unavailable(e)
+
+    @classmethod
+    async def listen(cls, channel: str, callback: Callable[[str], None]) -> None:
+        """
+        Escuchar un canal de pub/sub y llamar a callback(mensaje) por cada mensaje.
+
+        Se ejecuta hasta que se cancela la tarea; si la conexión se pierde,
+        reintenta cada REDIS_RETRY_AFTER_SECONDS. Usa una conexión propia sin
+        socket_timeout, ya que la suscripción permanece inactiva entre mensajes.
+        No hace nada si Redis no está configurado.
+
+        Args:
+            channel: Canal de pub/sub
+            callback: Función síncrona que recibe el mensaje
+        """
+        if not REDIS_URL or aioredis is None:
+            return
+
+        while True:
+            subscriber = aioredis.Redis.from_url(REDIS_URL, decode_responses=True)
+            try:
+                async with subscriber.pubsub() as pubsub:
+                    await pubsub.subscribe(channel)
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if message is not None:
+                            callback(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Redis pub/sub error on {channel}: {e}")
+                await asyncio.sleep(REDIS_RETRY_AFTER_SECONDS)
+            finally:
+                await subscriber.aclose()
+
+    @classmethod
+    async def take_token(cls, key: str, capacity: float, refill_per_second: float) -> float | None:
+        """
+        Consumir un token de un cubo compartido por todos los workers.
+
+        El cubo se recalcula y actualiza de forma atómica en Redis (script
+        Lua con el reloj del servidor) y expira solo cuando vuelve a estar
+        lleno.
+
+        Args:
+            key: Clave del cubo en Redis
+            capacity: Tokens máximos (ráfaga permitida)
+            refill_per_second: Tokens que se recuperan por segundo
+
+        Returns:
+            float | None: 0.0 si se consumió un token, los segundos hasta el
+                          siguiente token si el cubo está vacío, o None si
+                          Redis no está disponible (el llamador decide el respaldo)
+        """
+        if not cls.enabled():
+            return None
+        try:
+            if cls._token_bucket is None:
+                cls._token_bucket = cls._get_client().register_script(_TOKEN_BUCKET_SCRIPT)
+            return float(await cls._token_bucket(keys=[key], args=[capacity, refill_per_second]))
+        except Exception as e:
+            cls._mark_unavailable(e)
+            return None
+
+    @classmethod
+    async def close(cls) -> None:
+        """Cerrar el cliente de Redis si existe."""
+        if cls.client is not None:
+            await cls.client.aclose()
+            cls.client = None
+            cls._token_bucket = None
@@ -0,0 +1,93 @@
+"""
+Interfaz de acceso a colecciones que usan los servicios.
+
+Los servicios obtienen la base de datos con MongoDB.get_db() y trabajan con
+sus colecciones (db["courses"], db["enrollments"], ...) usando únicamente las
+operaciones declaradas aquí. Dos backends cumplen esta interfaz:
+
+- Motor (AsyncIOMotorDatabase / AsyncIOMotorCollection): el de producción
+- database/memory.py (MemoryDatabase / MemoryCollection): en memoria, para
+  benchmarks y pruebas de servicios y estados sin servidor MongoDB
+
+El backend se elige con la variable de entorno DATABASE_BACKEND (ver
+database/mongodb.py). Una operación nueva en un servicio debe estar en
+estos protocolos y, si no lo está, añadirse aquí y a MemoryCollection.
+
+Protocolos:
+- Cursor: Resultado de find y aggregate
+- Collection: Operaciones sobre una colección
+- Database: Acceso a colecciones por nombre
+"""
+
+from typing import Any, AsyncIterator, List, Optional, Protocol
+
+
+class Cursor(Protocol):
+    """Cursor de find/aggregate: se encadena y se consume con to_list o async for."""
+
+    def sort(self, key_or_list, direction=None) -> "Cursor": ...
+
+    def skip(self, skip: int) -> "Cursor": ...
+
+    def limit(self, limit: int) -> "Cursor": ...
+
+    async def to_list(self, length: Optional[int] = None) -> List[dict]: ...
+
+    def __aiter__(self) -> AsyncIterator[dict]: ...
+
+
+class Collection(Protocol):
+    """
+    Subconjunto de la API de colecciones de Motor que usan los servicios.
+
+    Los parámetros opcionales (projection, upsert, array_filters, session,
+    return_document...) tienen el mismo significado que en Motor/PyMongo, y
+    los resultados son los de pymongo.results (InsertOneResult, UpdateResult,
+    DeleteResult, BulkWriteResult). Los errores también son los de PyMongo
+    (DuplicateKeyError, BulkWriteError, OperationFailure).
+    """
+
+    name: str
+
+    def find(self, filter: Optional[dict] = None, projection: Optional[dict] = None, **kwargs) -> Cursor: ...
+
+    async def find_one(self, filter: Optional[dict] = None, projection: Optional[dict] = None,
+                       **kwargs) -> Optional[dict]: ...
+
+    async def insert_one(self, document: dict, **kwargs) -> Any: ...
+
+    async def insert_many(self, documents: List[dict], ordered: bool = True, **kwargs) -> Any: ...
+
+    async def update_one(self, filter: dict, update: dict, upsert: bool = False, **kwargs) -> Any: ...
+
+    async def update_many(self, filter: dict, update: dict, upsert: bool = False, **kwargs) -> Any: ...
+
+    async def replace_one(self, filter: dict, replacement: dict, upsert: bool = False, **kwargs) -> Any: ...
+
+    async def delete_one(self, filter: dict, **kwargs) -> Any: ...
+
+    async def delete_many(self, filter: dict, **kwargs) -> Any: ...
+
+    async def find_one_and_update(self, filter: dict, update: dict, **kwargs) -> Optional[dict]: ...
+
+    async def find_one_and_delete(self, filter: dict, **kwargs) -> Optional[dict]: ...
+
+    async def count_documents(self, filter: dict, **kwargs) -> int: ...
+
+    async def estimated_document_count(self, **kwargs) -> int: ...
+
+    async def bulk_write(self, requests: list, ordered: bool = True, **kwargs) -> Any: ...
+
+    def aggregate(self, pipeline: List[dict], **kwargs) -> Cursor: ...
+
+    async def create_indexes(self, indexes: list, **kwargs) -> List[str]: ...
+
+    def list_indexes(self, **kwargs) -> Cursor: ...
+
+
+class Database(Protocol):
+    """Base de datos: colecciones por nombre (db["users"])."""
+
+    name: str
+
+    def __getitem__(self, name: str) -> Collection: ...
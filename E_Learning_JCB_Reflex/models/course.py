@@ -6,6 +6,12 @@ Este módulo define las clases necesarias para representar cursos en el sistema:
 - Instructor: Información del instructor embebida en el curso
 - Lesson: Lecciones individuales del curso
 - Review: Reseñas y calificaciones de estudiantes
+
+Todas las clases declaran __slots__: un listado puede tener decenas de miles
+de cursos en memoria y los slots evitan un __dict__ por instancia. Por el
+mismo motivo Course guarda los arrays embebidos (lecciones y reseñas) tal
+como vienen de MongoDB y solo crea los objetos Lesson/Review la primera vez
+que se accede a course.lessons o course.reviews.
 """
 
 from datetime import datetime, timezone
@@ -28,6 +34,8 @@ class Instructor:
         bio (str): Biografía o descripción del instructor
     """
 
+    __slots__ = ("name", "email", "user_id", "avatar_url", "bio")
+
     def __init__(
         self,
         name: str = "Unknown",
@@ -103,6 +111,8 @@ class Lesson:
         video_url (str): URL del video de YouTube para la lección
     """
 
+    __slots__ = ("id", "title", "content", "order", "duration", "video_url")
+
     def __init__(
         self,
         title: str = "",
@@ -172,7 +182,7 @@ class Review:
     Modelo de reseña/calificación embebida en un curso.
 
     Representa una reseña y calificación que un estudiante hace de un curso.
-    Las reseñas se almacenan como un array embebido en el documento de curso.
+    Las reseñas se almacenan en la colección reviews (ver review_service).
 
     Atributos:
         id (str): Identificador único de la reseña
@@ -182,6 +192,8 @@ class Review:
         created_at (datetime): Fecha y hora de creación de la reseña
     """
 
+    __slots__ = ("id", "student", "rating", "comment", "created_at")
+
     def __init__(
         self,
         student: str = "",
@@ -219,7 +231,7 @@ class Review:
         """
         return cls(
             _id=data.get("_id"),
-            student=data.get("student", ""),
+            student=str(data.get("student") or ""),
             rating=data.get("rating", 5),
             comment=data.get("comment", ""),
             created_at=data.get("createdAt"),
@@ -258,14 +270,40 @@ class Course:
         level (str): Nivel del curso ("beginner", "intermediate", "advanced")
         category (str): Categoría principal del curso
         categories (List[str]): Lista de categorías a las que pertenece el curso
-        students (List[str]): Lista de IDs de estudiantes inscritos
-        lessons (List[Lesson]): Lista de lecciones del curso
-        reviews (List[Review]): Lista de reseñas del curso
+        students (List[str]): IDs de estudiantes del formato antiguo (las
+            inscripciones viven en la colección enrollments)
+        students_enrolled (int): Número de estudiantes inscritos (contador del curso)
+        lessons (List[Lesson]): Lista de lecciones del curso (se construye en el primer acceso)
+        reviews (List[Review]): Lista de reseñas del curso (se construye en el primer acceso)
         average_rating (int): Calificación promedio del curso (calculada)
         total_reviews (int): Número total de reseñas (calculado)
         created_at (datetime): Fecha y hora de creación del curso
+        partial (bool): True si se cargó con una proyección (ver course_service.COURSE_FIELD_SETS)
+            y solo tiene algunos campos
     """
 
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "instructor",
+        "price",
+        "thumbnail",
+        "level",
+        "category",
+        "categories",
+        "students",
+        "students_enrolled",
+        "_lessons",
+        "_lessons_data",
+        "_reviews",
+        "_reviews_data",
+        "average_rating",
+        "total_reviews",
+        "created_at",
+        "partial",
+    )
+
     def __init__(
         self,
         title: str,
@@ -277,6 +315,7 @@ class Course:
         category: str = "",
         categories: Optional[List[str]] = None,
         students: Optional[List[str]] = None,
+        students_enrolled: int = 0,
         lessons: Optional[List[Lesson]] = None,
         reviews: Optional[List[Review]] = None,
         average_rating: Optional[int] = None,
@@ -296,7 +335,8 @@ class Course:
             level: Nivel de dificultad ("beginner", "intermediate", "advanced")
             category: Categoría principal del curso
             categories: Lista de categorías
-            students: Lista de IDs de estudiantes inscritos
+            students: Lista de IDs de estudiantes (formato antiguo)
+            students_enrolled: Número de estudiantes inscritos
             lessons: Lista de objetos Lesson
             reviews: Lista de objetos Review
             average_rating: Calificación promedio (calculada automáticamente)
@@ -313,23 +353,29 @@ class Course:
         self.level = level  # "beginner", "intermediate", "advanced"
         self.category = category
         self.categories = categories or []
-        self.students = students or []  # IDs de estudiantes inscritos
+        self.students = students or []  # IDs de estudiantes (formato antiguo)
+        self.students_enrolled = students_enrolled  # Contador studentsEnrolled
         self.lessons = lessons or []  # Lecciones del curso
         self.reviews = reviews or []  # Reseñas del curso
         self.average_rating = average_rating  # Calculado de las reviews
         self.total_reviews = total_reviews  # Calculado de las reviews
         self.created_at = created_at or datetime.now(timezone.utc)
+        self.partial = False
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Course":
+    def from_dict(cls, data: dict, partial: bool = False) -> "Course":
         """
         Crear instancia de Course desde un documento de MongoDB.
 
-        Este método deserializa un documento de MongoDB y crea objetos Python
-        completos incluyendo todos los objetos embebidos (instructor, lecciones, reviews).
+        Este método deserializa un documento de MongoDB y crea el objeto
+        Instructor embebido. Las lecciones y reseñas se guardan como los
+        arrays del documento y se convierten en objetos Lesson/Review solo si
+        se accede a course.lessons o course.reviews.
 
         Args:
             data: Diccionario con el documento de curso desde MongoDB
+            partial: True si el documento viene de una proyección. created_at
+                     queda en None si no se proyectó, en lugar de la fecha actual
 
         Returns:
             Course: Nueva instancia con todos los datos deserializados
@@ -342,15 +388,7 @@ class Course:
         instructor_data = data.get("instructor", {})
         instructor = Instructor.from_dict(instructor_data) if isinstance(instructor_data, dict) else Instructor()
 
-        # Parsear lecciones (array de objetos embebidos)
-        lessons_data = data.get("lessons", [])
-        lessons = [Lesson.from_dict(lesson) for lesson in lessons_data] if isinstance(lessons_data, list) else []
-
-        # Parsear reviews (array de objetos embebidos)
-        reviews_data = data.get("reviews", [])
-        reviews = [Review.from_dict(review) for review in reviews_data] if isinstance(reviews_data, list) else []
-
-        return cls(
+        course = cls(
             _id=data.get("_id"),
             title=data.get("title", ""),
             description=data.get("description", ""),
@@ -361,13 +399,53 @@ class Course:
             category=data.get("category", ""),
             categories=data.get("categories", []),
             students=data.get("students", []),
-            lessons=lessons,
-            reviews=reviews,
+            students_enrolled=data.get("studentsEnrolled") or 0,
             average_rating=data.get("averageRating"),
             total_reviews=data.get("totalReviews"),
             created_at=data.get("createdAt"),
         )
 
+        # Arrays embebidos sin convertir (ver las propiedades lessons y reviews)
+        lessons_data = data.get("lessons")
+        if isinstance(lessons_data, list) and lessons_data:
+            course._lessons, course._lessons_data = None, lessons_data
+
+        reviews_data = data.get("reviews")
+        if isinstance(reviews_data, list) and reviews_data:
+            course._reviews, course._reviews_data = None, reviews_data
+
+        if partial:
+            course.partial = True
+            course.created_at = data.get("createdAt")
+
+        return course
+
+    @property
+    def lessons(self) -> List[Lesson]:
+        """Lecciones del curso; los objetos Lesson se crean en el primer acceso."""
+        if self._lessons is None:
+            self._lessons = [Lesson.from_dict(lesson) for lesson in self._lessons_data]
+            self._lessons_data = None
+        return self._lessons
+
+    @lessons.setter
+    def lessons(self, lessons: List[Lesson]):
+        self._lessons = lessons
+        self._lessons_data = None
+
+    @property
+    def reviews(self) -> List[Review]:
+        """Reseñas del curso; los objetos Review se crean en el primer acceso."""
+        if self._reviews is None:
+            self._reviews = [Review.from_dict(review) for review in self._reviews_data]
+            self._reviews_data = None
+        return self._reviews
+
+    @reviews.setter
+    def reviews(self, reviews: List[Review]):
+        self._reviews = reviews
+        self._reviews_data = None
+
     def to_dict(self) -> dict:
         """
         Convertir instancia de Course a diccionario.
@@ -394,6 +472,7 @@ class Course:
             "category": self.category,
             "categories": self.categories,
             "students": self.students,
+            "students_enrolled": self.students_enrolled,
             "lessons": [lesson.to_dict() for lesson in self.lessons],
             "reviews": [review.to_dict() for review in self.reviews],
             "average_rating": self.average_rating,
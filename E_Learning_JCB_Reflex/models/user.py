@@ -2,7 +2,9 @@
 Modelo de usuario para la plataforma E-Learning.
 
 Este módulo define la clase User que representa a todos los tipos de usuarios
-del sistema: estudiantes, instructores y administradores.
+del sistema: estudiantes, instructores y administradores. La clase declara
+__slots__ para que los listados de usuarios no reserven un __dict__ por
+instancia.
 """
 
 from datetime import datetime, timezone
@@ -28,8 +30,24 @@ class User:
         enrollments (list): Lista de inscripciones del estudiante a cursos
         courses_created (list): Lista de IDs de cursos creados por el instructor
         created_at (datetime): Fecha y hora de creación de la cuenta
+        partial (bool): True si se cargó con una proyección (ver user_service.USER_FIELD_SETS)
+            y solo tiene algunos campos
     """
 
+    __slots__ = (
+        "id",
+        "first_name",
+        "last_name",
+        "email",
+        "role",
+        "password",
+        "instructor_profile",
+        "enrollments",
+        "courses_created",
+        "created_at",
+        "partial",
+    )
+
     def __init__(
         self,
         first_name: str,
@@ -68,9 +86,10 @@ class User:
         self.enrollments = enrollments or []  # Solo para estudiantes
         self.courses_created = courses_created or []  # Solo para instructores
         self.created_at = created_at or datetime.now(timezone.utc)
+        self.partial = False
 
     @classmethod
-    def from_dict(cls, data: dict) -> "User":
+    def from_dict(cls, data: dict, partial: bool = False) -> "User":
         """
         Crear instancia de User desde un documento de MongoDB.
 
@@ -79,6 +98,9 @@ class User:
 
         Args:
             data: Diccionario con los datos del usuario desde MongoDB
+            partial: True si el documento viene de una proyección. Los campos
+                     no proyectados quedan vacíos (rol "" y created_at None)
+                     en lugar de tomar valores por defecto que parecerían reales
 
         Returns:
             User: Nueva instancia de User con los datos proporcionados
@@ -91,12 +113,12 @@ class User:
         courses_created_raw = data.get("coursesCreated", [])
         courses_created = [str(course_id) for course_id in courses_created_raw] if courses_created_raw else []
 
-        return cls(
+        user = cls(
             _id=data.get("_id"),
             first_name=data.get("firstName", ""),
             last_name=data.get("lastName", ""),
             email=data.get("email", ""),
-            role=data.get("role", "student"),
+            role=data.get("role", "" if partial else "student"),
             password=data.get("password"),
             instructor_profile=data.get("instructorProfile"),
             enrollments=data.get("enrollments", []),
@@ -104,6 +126,12 @@ class User:
             created_at=data.get("createdAt"),
         )
 
+        if partial:
+            user.partial = True
+            user.created_at = data.get("createdAt")
+
+        return user
+
     def to_dict(self) -> dict:
         """
         Convertir instancia de User a diccionario para MongoDB.
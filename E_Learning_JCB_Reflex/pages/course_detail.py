@@ -401,12 +401,6 @@ def course_detail_page() -> rx.Component:
                                                     color_scheme="blue",
                                                 ),
                                             ),
-                                            rx.text(
-                                                lesson["content"],
-                                                size="2",
-                                                no_of_lines=2,
-                                                margin_top="2",
-                                            ),
                                             padding="3",
                                             width="100%",
                                             _hover={
@@ -453,6 +447,16 @@ def course_detail_page() -> rx.Component:
                                     spacing="2",
                                     width="100%",
                                 ),
+                                rx.cond(
+                                    CourseState.has_more_reviews,
+                                    rx.button(
+                                        "Ver más reseñas",
+                                        on_click=CourseState.load_more_reviews,
+                                        disabled=CourseState.loading_reviews,
+                                        variant="soft",
+                                        margin_top="3",
+                                    ),
+                                ),
                                 width="100%",
                                 padding="4",
                                 margin_top="4",
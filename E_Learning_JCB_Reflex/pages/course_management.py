@@ -249,7 +249,7 @@ def courses_table() -> rx.Component:
         rx.Component: Card con tabla de cursos
 
     Notas:
-        - Muestra CourseManagementState.filtered_courses (ya filtrados)
+        - Muestra CourseManagementState.filtered_courses (filtrados en MongoDB, por páginas)
         - Los botones de editar/eliminar usan lambdas para pasar todos los parámetros
         - El botón editar abre el diálogo con datos precargados del curso
         - El botón eliminar abre el diálogo de confirmación
@@ -328,7 +328,7 @@ def statistics_cards() -> rx.Component:
                 rx.hstack(
                     rx.icon("book-open", size=20, color=rx.color("purple", 9)),
                     rx.spacer(),
-                    rx.badge(CourseManagementState.courses.length().to_string(), size="2", color_scheme="purple"),
+                    rx.badge(CourseManagementState.total_courses.to_string(), size="2", color_scheme="purple"),
                 ),
                 rx.text("Total Cursos", size="3", weight="bold"),
                 spacing="2",
@@ -340,7 +340,7 @@ def statistics_cards() -> rx.Component:
                 rx.hstack(
                     rx.icon("filter", size=20, color=rx.color("blue", 9)),
                     rx.spacer(),
-                    rx.badge(CourseManagementState.filtered_courses.length().to_string(), size="2", color_scheme="blue"),
+                    rx.badge(CourseManagementState.filtered_total.to_string(), size="2", color_scheme="blue"),
                 ),
                 rx.text("Cursos Filtrados", size="3", weight="bold"),
                 spacing="2",
@@ -396,7 +396,8 @@ def course_management_content() -> rx.Component:
                         rx.input(
                             value=CourseManagementState.search_query,
                             on_change=CourseManagementState.on_search_change,
-                            placeholder="Buscar por título, descripción o categoría...",
+                            debounce_timeout=400,
+                            placeholder="Buscar por título, descripción, instructor o categoría...",
                             width="100%",
                         ),
                         rx.select(
@@ -411,6 +412,14 @@ def course_management_content() -> rx.Component:
                 ),
                 # Tabla
                 courses_table(),
+                rx.cond(
+                    CourseManagementState.has_more_results,
+                    rx.button(
+                        "Cargar más",
+                        on_click=CourseManagementState.load_more_results,
+                        variant="soft",
+                    ),
+                ),
                 spacing="6",
                 width="100%",
                 padding_y="4",
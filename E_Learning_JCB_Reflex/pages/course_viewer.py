@@ -200,8 +200,10 @@ def navigation_controls() -> rx.Component:
     """
     Renderiza los controles de navegación entre lecciones.
 
-    Muestra botones para ir a la lección anterior y siguiente.
-    Los botones se deshabilitan si no hay lección anterior/siguiente.
+    Muestra botones para ir a la lección anterior y siguiente y para marcar
+    la lección actual como completada ("Siguiente" también la completa).
+    Los botones se deshabilitan si no hay lección anterior/siguiente o si la
+    lección ya está completada.
 
     Returns:
         rx.Component: Controles de navegación
@@ -219,6 +221,23 @@ def navigation_controls() -> rx.Component:
             disabled=~CourseViewerState.has_previous_lesson,
         ),
         rx.spacer(),
+        rx.button(
+            rx.hstack(
+                rx.icon("check", size=18),
+                rx.cond(
+                    CourseViewerState.current_lesson_completed,
+                    rx.text("Completada"),
+                    rx.text("Marcar como completada"),
+                ),
+                spacing="2",
+            ),
+            variant="soft",
+            color_scheme="green",
+            size="3",
+            on_click=CourseViewerState.mark_current_lesson_completed,
+            disabled=CourseViewerState.current_lesson_completed,
+        ),
+        rx.spacer(),
         rx.button(
             rx.hstack(
                 rx.text("Siguiente"),
@@ -425,6 +444,7 @@ def course_viewer_page() -> rx.Component:
                 spacing="4",
                 width="100%",
                 on_mount=CourseViewerState.load_course_viewer_from_url,
+                on_unmount=CourseViewerState.flush_progress,
             ),
             width="100%",
             padding_x=rx.cond(
@@ -1,12 +1,13 @@
 """
 Página de catálogo de cursos de la plataforma E-Learning JCB.
 
-Este módulo muestra el catálogo completo de todos los cursos disponibles
-en la plataforma. Los cursos se presentan en una cuadrícula utilizando
+Este módulo muestra el catálogo de cursos disponibles en la plataforma,
+cargado por páginas desde el servidor. Los cursos se presentan en una cuadrícula utilizando
 el componente course_card para mantener consistencia visual.
 
 Funcionalidades:
-- Catálogo completo de cursos disponibles
+- Catálogo de cursos paginado con botón "Cargar más"
+- Búsqueda en el servidor (índice de texto de MongoDB) con debounce
 - Visualización en cuadrícula responsive (3 columnas)
 - Estado de carga mientras se obtienen los datos
 - Manejo de errores con mensajes visuales
@@ -42,6 +43,7 @@ def courses_page() -> rx.Component:
         - Muestra un spinner mientras CourseState.loading es True
         - Muestra callout de error si CourseState.error no está vacío
         - La cuadrícula solo se muestra si hay cursos disponibles (CourseState.courses.length() > 0)
+        - El botón "Cargar más" pide la siguiente página mientras CourseState.has_more_courses sea True
     """
     return rx.box(
         # Background image
@@ -77,6 +79,7 @@ def courses_page() -> rx.Component:
                             placeholder="Buscar por título, instructor, nivel...",
                             value=CourseState.search_query,
                             on_change=CourseState.set_search_query,
+                            debounce_timeout=400,
                             size="3",
                             width="100%",
                         ),
@@ -88,7 +91,7 @@ def courses_page() -> rx.Component:
                     rx.cond(
                         CourseState.search_query != "",
                         rx.text(
-                            f"{CourseState.filtered_courses.length()} resultado(s) para: ",
+                            f"{CourseState.search_total} resultado(s) para: ",
                             rx.text.strong(CourseState.search_query),
                             size="2",
                             color=rx.color("gray", 10),
@@ -112,10 +115,10 @@ def courses_page() -> rx.Component:
                 ),
                 # Cuadrícula de cursos usando course_card
                 rx.cond(
-                    CourseState.filtered_courses.length() > 0,
+                    CourseState.courses.length() > 0,
                     rx.grid(
                         rx.foreach(
-                            CourseState.filtered_courses,
+                            CourseState.courses,
                             lambda course: course_card(course)
                         ),
                         columns="3",
@@ -144,11 +147,27 @@ def courses_page() -> rx.Component:
                         ),
                     ),
                 ),
+                # Cargar la siguiente página del catálogo
+                rx.cond(
+                    CourseState.has_more_courses,
+                    rx.button(
+                        rx.cond(
+                            CourseState.loading_more,
+                            rx.spinner(size="2"),
+                            rx.icon("chevrons-down", size=18),
+                        ),
+                        "Cargar más cursos",
+                        on_click=CourseState.load_more_courses,
+                        disabled=CourseState.loading_more,
+                        variant="soft",
+                        size="3",
+                    ),
+                ),
                 spacing="4",
                 width="100%",
                 padding_y="8",
                 align_items="center",
-                on_mount=CourseState.load_courses, # Cargar todos los cursos al montar la página
+                on_mount=CourseState.load_courses, # Cargar la primera página al montar la página
             ),
             width="100%",
             max_width="100%",
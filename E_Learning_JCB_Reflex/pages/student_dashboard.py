@@ -385,6 +385,18 @@ def student_dashboard_content() -> rx.Component:
                                 ),
                             ),
                         ),
+                        rx.cond(
+                            EnrollmentState.has_more_enrolled_courses,
+                            rx.center(
+                                rx.button(
+                                    "Ver más cursos",
+                                    on_click=EnrollmentState.load_more_enrolled_courses,
+                                    disabled=EnrollmentState.loading_more_courses,
+                                    variant="soft",
+                                ),
+                                width="100%",
+                            ),
+                        ),
                         spacing="4",
                         width="100%",
                     ),
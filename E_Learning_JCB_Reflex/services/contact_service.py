@@ -44,8 +44,7 @@ async def create_contact(name: str, email: str, message: str) -> bool:
         en el modelo Contact.
     """
     try:
-        # Asegurar la conexión a MongoDB
-        await MongoDB.connect()
+        # Obtener la base de datos del cliente compartido
         db = MongoDB.get_db()
 
         # Obtener la colección de contactos
@@ -85,8 +84,7 @@ async def get_all_contacts() -> List[Contact]:
         descendente para mostrar los más recientes primero.
     """
     try:
-        # Asegurar la conexión a MongoDB
-        await MongoDB.connect()
+        # Obtener la base de datos del cliente compartido
         db = MongoDB.get_db()
 
         # Obtener la colección de contactos
@@ -130,7 +128,6 @@ async def get_contact_by_email(email: str) -> List[Contact]:
         específico o para detectar spam.
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         contacts_collection = db["contacts"]
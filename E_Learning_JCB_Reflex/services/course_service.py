@@ -7,19 +7,113 @@ Incluye operaciones CRUD completas, búsqueda y listado de cursos.
 Funciones principales:
 - get_popular_courses: Obtener cursos populares (limitado)
 - get_all_courses: Obtener todos los cursos
+- get_course_catalog_page: Obtener una página del catálogo (paginación por cursor)
+- search_courses: Búsqueda de texto completo con ranking y paginación
+- count_courses: Contar cursos de la plataforma
 - get_course_by_id: Obtener curso por ID
+- get_courses_by_ids: Obtener varios cursos por ID en una sola consulta
+- get_courses_by_instructor: Obtener los cursos de un instructor
 - create_course: Crear nuevo curso
 - update_course: Actualizar curso existente
 - delete_course: Eliminar curso
+- invalidate_course_cache: Descartar un curso de las cachés (memoria y Redis)
+- invalidate_courses_cache: Descartar varios cursos de las cachés en una sola operación
+- invalidate_catalog_cache: Descartar los listados del catálogo en Redis
+- get_course_cache_stats: Contadores de la caché de cursos (monitorización)
+- course_cache_lifespan: Escuchar las invalidaciones de otros workers
+
+Conjuntos de campos (parámetro fields de los listados, ver COURSE_FIELD_SETS):
+- "card": Campos de la tarjeta del catálogo
+- "summary": Campos de listados y dashboards (sin lecciones ni reseñas)
+- "full": Documento completo
+
+Cachés:
+- En memoria por proceso (AsyncTTLCache) para get_course_by_id
+- Compartida en Redis (opcional, ver database/redis_cache.py) para
+  get_course_by_id, get_popular_courses y get_course_catalog_page
+
+Variables de entorno opcionales (caché de cursos por proceso):
+- COURSE_CACHE_MAX_SIZE: Número máximo de cursos en caché (por defecto 1024, 0 la desactiva)
+- COURSE_CACHE_TTL_SECONDS: Segundos de vida de cada curso en caché (por defecto 60)
 """
 
-from typing import List
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+from typing import List, Optional, Tuple
 from bson import ObjectId
 from E_Learning_JCB_Reflex.models.course import Course
-from E_Learning_JCB_Reflex.database import MongoDB
-
-
-async def get_popular_courses(limit: int = 6) -> List[Course]:
+from E_Learning_JCB_Reflex.database import MongoDB, RedisCache
+from E_Learning_JCB_Reflex.services.lesson_service import (
+    delete_course_lessons,
+    insert_course_lessons,
+    split_lessons,
+)
+from E_Learning_JCB_Reflex.services.stats_service import update_platform_stats
+from E_Learning_JCB_Reflex.utils.cache import AsyncTTLCache
+
+
+# Campos necesarios para listados y dashboards (sin cuerpos de lecciones ni reseñas)
+COURSE_SUMMARY_PROJECTION = {
+    "title": 1,
+    "description": 1,
+    "image": 1,
+    "price": 1,
+    "level": 1,
+    "category": 1,
+    "categories": 1,
+    "instructor": 1,
+    "studentsEnrolled": 1,
+    "averageRating": 1,
+    "totalReviews": 1,
+    "createdAt": 1,
+}
+
+# Campos que muestra course_card en el catálogo
+COURSE_CARD_PROJECTION = {
+    "title": 1,
+    "description": 1,
+    "image": 1,
+    "price": 1,
+    "level": 1,
+    "instructor.name": 1,
+}
+
+# Proyección de cada conjunto de campos; None carga el documento completo
+COURSE_FIELD_SETS = {
+    "card": COURSE_CARD_PROJECTION,
+    "summary": COURSE_SUMMARY_PROJECTION,
+    "full": None,
+}
+
+# Tamaño de página por defecto del catálogo
+CATALOG_PAGE_SIZE = 12
+
+# Caché LRU con TTL delante de get_course_by_id (documentos completos ya deserializados)
+_course_cache = AsyncTTLCache(
+    max_size=int(os.getenv("COURSE_CACHE_MAX_SIZE", "1024")),
+    ttl=float(os.getenv("COURSE_CACHE_TTL_SECONDS", "60")),
+)
+
+# Claves de Redis: cambiar el prefijo si cambia el formato de los documentos cacheados
+CACHE_KEY_PREFIX = "elearning:v1"
+CATALOG_CACHE_VERSION_KEY = f"{CACHE_KEY_PREFIX}:catalog:version"
+COURSE_INVALIDATION_CHANNEL = f"{CACHE_KEY_PREFIX}:course-invalidations"
+
+
+def _course_cache_version_key(course_id: str) -> str:
+    """Clave del contador de versión de un curso en Redis."""
+    return f"{CACHE_KEY_PREFIX}:course:{course_id}:version"
+
+
+def _course_projection(fields: str) -> dict | None:
+    """Proyección del conjunto de campos `fields` (ValueError si no existe)."""
+    if fields not in COURSE_FIELD_SETS:
+        raise ValueError(f"Unknown course field set: {fields}")
+    return COURSE_FIELD_SETS[fields]
+
+
+async def get_popular_courses(limit: int = 6, fields: str = "summary") -> List[Course]:
     """
     Obtener cursos populares de la plataforma.
 
@@ -28,6 +122,7 @@ async def get_popular_courses(limit: int = 6) -> List[Course]:
 
     Args:
         limit: Número máximo de cursos a retornar. Por defecto 6.
+        fields: Conjunto de campos ("card", "summary" o "full"). Por defecto "summary".
 
     Returns:
         List[Course]: Lista de objetos Course. Retorna lista vacía si hay error.
@@ -40,34 +135,41 @@ async def get_popular_courses(limit: int = 6) -> List[Course]:
     Nota:
         Actualmente retorna los primeros cursos encontrados. En el futuro
         se puede ordenar por popularidad (número de estudiantes, calificación, etc.)
+        Con fields distinto de "full" no se cargan lecciones ni reseñas, y el
+        resultado se comparte entre workers a través de Redis si está configurado.
     """
     try:
-        # Asegurar la conexión a MongoDB
-        await MongoDB.connect()
-        db = MongoDB.get_db()
+        projection = _course_projection(fields)
 
-        # Obtener la colección de cursos
-        courses_collection = db["courses"]
+        async def load():
+            # Obtener la base de datos del cliente compartido
+            db = MongoDB.get_db()
 
-        # Recuperar cursos con límite especificado
-        cursor = courses_collection.find().limit(limit)
-        courses_data = await cursor.to_list(length=limit)
+            # Recuperar cursos con límite especificado
+            cursor = db["courses"].find({}, projection).limit(limit)
+            return await cursor.to_list(length=limit)
+
+        courses_data = await RedisCache.get_or_set(CATALOG_CACHE_VERSION_KEY, f"popular:{fields}:{limit}", load)
 
         # Convertir los documentos de MongoDB a objetos Course
-        courses = [Course.from_dict(course_data) for course_data in courses_data]
+        courses = [Course.from_dict(course_data, partial=projection is not None) for course_data in courses_data]
 
         return courses
     except Exception as e:
         print(f"Error fetching courses: {e}")
         return []
 
-async def get_all_courses() -> List[Course]:
+async def get_all_courses(fields: str = "summary") -> List[Course]:
     """
     Obtener todos los cursos de la base de datos.
 
     Recupera el catálogo completo de cursos disponibles en la plataforma
     sin aplicar ningún filtro o límite.
 
+    Args:
+        fields: Conjunto de campos ("card", "summary" o "full"). Por defecto
+                "summary": sin lecciones ni reseñas.
+
     Returns:
         List[Course]: Lista completa de objetos Course. Retorna lista vacía si hay error.
 
@@ -80,19 +182,19 @@ async def get_all_courses() -> List[Course]:
         usar paginación para catálogos muy grandes.
     """
     try:
-        # Asegurar la conexión a MongoDB
-        await MongoDB.connect()
+        # Obtener la base de datos del cliente compartido
         db = MongoDB.get_db()
 
         # Obtener la colección de cursos
         courses_collection = db["courses"]
 
         # Recuperar todos los cursos sin límite
-        cursor = courses_collection.find()
+        projection = _course_projection(fields)
+        cursor = courses_collection.find({}, projection)
         courses_data = await cursor.to_list(length=None)
 
         # Convertir los documentos de MongoDB a objetos Course
-        courses = [Course.from_dict(course_data) for course_data in courses_data]
+        courses = [Course.from_dict(course_data, partial=projection is not None) for course_data in courses_data]
 
         return courses
     except Exception as e:
@@ -100,11 +202,171 @@ async def get_all_courses() -> List[Course]:
         return []
 
 
+async def get_course_catalog_page(
+    page_size: int = CATALOG_PAGE_SIZE,
+    after: str = "",
+) -> Optional[Tuple[List[Course], str]]:
+    """
+    Obtener una página del catálogo de cursos con paginación por cursor (keyset).
+
+    Ordena por _id descendente (el ObjectId incluye la fecha de creación, así que
+    los cursos más recientes aparecen primero) y continúa a partir del cursor
+    `after` con un filtro {"_id": {"$lt": after}}, que usa el índice de _id en
+    lugar de saltar documentos con skip(). Solo se proyectan los campos de la
+    tarjeta, por lo que cada página tiene un tamaño constante. Las páginas se
+    comparten entre workers a través de Redis si está configurado.
+
+    Args:
+        page_size: Número de cursos por página. Por defecto CATALOG_PAGE_SIZE.
+        after: Cursor devuelto por la página anterior ("" para la primera página)
+
+    Returns:
+        Optional[Tuple[List[Course], str]]: Cursos de la página (parciales, solo
+        campos de tarjeta) y cursor de la página siguiente ("" si no hay más).
+        Retorna None si hay error, para que el llamador conserve su cursor y
+        pueda reintentar en lugar de dar el catálogo por terminado.
+
+    Ejemplo:
+        >>> courses, cursor = await get_course_catalog_page()
+        >>> while cursor:
+        ...     more, cursor = await get_course_catalog_page(after=cursor)
+    """
+    try:
+        query = {"_id": {"$lt": ObjectId(after)}} if after else {}
+
+        async def load():
+            db = MongoDB.get_db()
+
+            # Pedir un documento extra para saber si existe una página siguiente
+            cursor = (
+                db["courses"].find(query, COURSE_CARD_PROJECTION)
+                .sort("_id", -1)
+                .limit(page_size + 1)
+            )
+            return await cursor.to_list(length=page_size + 1)
+
+        courses_data = await RedisCache.get_or_set(
+            CATALOG_CACHE_VERSION_KEY, f"page:{page_size}:{after}", load
+        )
+
+        has_more = len(courses_data) > page_size
+        courses_data = courses_data[:page_size]
+
+        courses = [Course.from_dict(course_data, partial=True) for course_data in courses_data]
+        next_cursor = str(courses_data[-1]["_id"]) if has_more else ""
+
+        return courses, next_cursor
+    except Exception as e:
+        print(f"Error fetching course catalog page: {e}")
+        return None
+
+
+async def search_courses(
+    query: str = "",
+    level: str = "",
+    category: str = "",
+    page: int = 1,
+    page_size: int = CATALOG_PAGE_SIZE,
+    fields: str = "card",
+) -> Tuple[List[Course], bool, int]:
+    """
+    Buscar cursos en MongoDB usando el índice de texto, con ranking y paginación.
+
+    La búsqueda se resuelve en el servidor de base de datos mediante $text sobre
+    el índice de texto declarado en database/indexes.py. Los resultados se
+    ordenan por relevancia (textScore, ponderado por COURSE_TEXT_INDEX_WEIGHTS)
+    y después por _id; sin
+    texto de búsqueda se ordenan del más reciente al más antiguo. El total de
+    resultados se cuenta con count_documents sobre el mismo filtro, en paralelo
+    con la consulta de la página.
+
+    Args:
+        query: Texto a buscar (palabras completas; MongoDB aplica stemming en español)
+        level: Filtrar por nivel ("beginner", "intermediate", "advanced").
+               "" o "all" no filtran.
+        category: Filtrar por categoría principal. "" no filtra.
+        page: Número de página empezando en 1
+        page_size: Resultados por página. Por defecto CATALOG_PAGE_SIZE.
+        fields: Conjunto de campos ("card", "summary" o "full"). Por defecto "card".
+
+    Returns:
+        Tuple[List[Course], bool, int]: Cursos de la página (parciales según
+        fields), indicador de si hay más resultados y total de cursos que
+        cumplen los filtros. Retorna ([], False, 0) si hay error.
+
+    Ejemplo:
+        >>> courses, has_more, total = await search_courses("python", level="beginner")
+    """
+    try:
+        db = MongoDB.get_db()
+
+        courses_collection = db["courses"]
+
+        filters = {}
+        projection = _course_projection(fields)
+        partial = projection is not None
+        projection = dict(projection or {})
+        sort = [("_id", -1)]
+
+        if query.strip():
+            filters["$text"] = {"$search": query.strip()}
+            projection["score"] = {"$meta": "textScore"}
+            sort = [("score", {"$meta": "textScore"}), ("_id", -1)]
+        if level and level != "all":
+            filters["level"] = level
+        if category:
+            filters["category"] = category
+
+        # Pedir un documento extra para saber si existe una página siguiente
+        skip = max(page - 1, 0) * page_size
+        cursor = (
+            courses_collection.find(filters, projection or None)
+            .sort(sort)
+            .skip(skip)
+            .limit(page_size + 1)
+        )
+        courses_data, total = await asyncio.gather(
+            cursor.to_list(length=page_size + 1),
+            courses_collection.count_documents(filters),
+        )
+
+        has_more = len(courses_data) > page_size
+        courses = [Course.from_dict(course_data, partial=partial) for course_data in courses_data[:page_size]]
+
+        return courses, has_more, total
+    except Exception as e:
+        print(f"Error searching courses: {e}")
+        return [], False, 0
+
+
+async def count_courses() -> int:
+    """
+    Contar el número total de cursos de la plataforma.
+
+    Returns:
+        int: Número de cursos. Retorna 0 si hay error.
+    """
+    try:
+        db = MongoDB.get_db()
+
+        return await db["courses"].count_documents({})
+    except Exception as e:
+        print(f"Error counting courses: {e}")
+        return 0
+
+
 async def get_course_by_id(course_id: str) -> Course | None:
     """
     Obtener un curso específico por su ID.
 
-    Busca y retorna un curso individual usando su ObjectId de MongoDB.
+    Busca y retorna un curso individual usando su ObjectId de MongoDB. El
+    resultado se guarda en una caché LRU en memoria con TTL: las lecturas
+    repetidas del mismo curso no consultan MongoDB ni vuelven a deserializar
+    lecciones y reseñas, y las lecturas simultáneas de un curso que no está en
+    caché comparten una única consulta. Si Redis está configurado, los fallos
+    de la caché en memoria se consultan antes en la caché compartida.
+    update_course, delete_course y los cambios de inscripción invalidan la
+    entrada del curso en todos los workers.
 
     Args:
         course_id: ID del curso (string del ObjectId de MongoDB)
@@ -116,22 +378,204 @@ async def get_course_by_id(course_id: str) -> Course | None:
         >>> course = await get_course_by_id("507f1f77bcf86cd799439011")
         >>> if course:
         ...     print(f"Curso: {course.title}")
+
+    Nota:
+        El objeto Course devuelto se comparte con otras lecturas a través de la
+        caché: no debe modificarse in situ.
     """
     try:
-        await MongoDB.connect()
-        db = MongoDB.get_db()
+        course_oid = ObjectId(course_id)
+        key = str(course_oid)
 
-        courses_collection = db["courses"]
-        course_data = await courses_collection.find_one({"_id": ObjectId(course_id)})
+        async def load_document():
+            db = MongoDB.get_db()
 
-        if course_data:
-            return Course.from_dict(course_data)
-        return None
+            return await db["courses"].find_one({"_id": course_oid})
+
+        async def load():
+            course_data = await RedisCache.get_or_set(_course_cache_version_key(key), "doc", load_document)
+            return Course.from_dict(course_data) if course_data else None
+
+        return await _course_cache.get_or_load(key, load)
     except Exception as e:
         print(f"Error fetching course: {e}")
         return None
 
 
+async def invalidate_course_cache(course_id, catalog: bool = True) -> None:
+    """
+    Descartar un curso de las cachés de get_course_by_id en todos los workers.
+
+    Debe llamarse tras cualquier escritura sobre el documento del curso
+    (incluido el contador studentsEnrolled) para que la siguiente lectura
+    obtenga los datos actualizados. Elimina la entrada local, incrementa la
+    versión del curso en Redis y publica el ID para que el resto de workers
+    lo eliminen de su caché en memoria.
+
+    Args:
+        course_id: ID del curso (string u ObjectId)
+        catalog: Si también se invalidan los listados del catálogo. Los
+                 cambios de contadores que no muestran las tarjetas pasan False.
+    """
+    await invalidate_courses_cache([course_id], catalog=catalog)
+
+
+async def invalidate_courses_cache(course_ids: List, catalog: bool = True) -> None:
+    """
+    Descartar varios cursos de las cachés de get_course_by_id en todos los workers.
+
+    Equivale a llamar a invalidate_course_cache por cada curso, pero con un
+    único pipeline de Redis para todas las versiones y una sola publicación
+    con los IDs separados por espacios, en lugar de dos round trips por curso.
+
+    Args:
+        course_ids: IDs de los cursos (string u ObjectId)
+        catalog: Si también se invalidan los listados del catálogo
+
+    Ejemplo:
+        >>> await invalidate_courses_cache(course_oids)
+    """
+    keys = list(dict.fromkeys(str(course_id) for course_id in course_ids))
+    if not keys:
+        return
+
+    for key in keys:
+        _course_cache.invalidate(key)
+
+    version_keys = [_course_cache_version_key(key) for key in keys]
+    if catalog:
+        version_keys.append(CATALOG_CACHE_VERSION_KEY)
+    await RedisCache.bump_version(*version_keys)
+    await RedisCache.publish(COURSE_INVALIDATION_CHANNEL, " ".join(keys))
+
+
+def _invalidate_published(message: str) -> None:
+    """Aplicar a la caché en memoria una invalidación publicada ("<id> <id> ...")."""
+    for key in message.split():
+        _course_cache.invalidate(key)
+
+
+async def invalidate_catalog_cache() -> None:
+    """Descartar en Redis los listados del catálogo (populares y páginas)."""
+    await RedisCache.bump_version(CATALOG_CACHE_VERSION_KEY)
+
+
+def get_course_cache_stats() -> dict:
+    """
+    Obtener los contadores de la caché de cursos para monitorización.
+
+    Returns:
+        dict: size, max_size, ttl, hits, misses, evictions, expirations,
+              invalidations y hit_ratio
+
+    Ejemplo:
+        >>> get_course_cache_stats()["hit_ratio"]
+        0.97
+    """
+    return _course_cache.stats()
+
+
+@asynccontextmanager
+async def course_cache_lifespan():
+    """
+    Tarea de ciclo de vida de la app Reflex para la caché compartida de cursos.
+
+    Escucha en Redis las invalidaciones publicadas por otros workers y las
+    aplica a la caché en memoria de este proceso. Sin REDIS_URL no hace nada.
+    Se registra con app.register_lifespan_task(course_cache_lifespan).
+    """
+    listener = asyncio.create_task(
+        RedisCache.listen(COURSE_INVALIDATION_CHANNEL, _invalidate_published)
+    )
+    try:
+        yield
+    finally:
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+        await RedisCache.close()
+
+
+async def get_courses_by_ids(course_ids: List[str], fields: str = "summary") -> List[Course]:
+    """
+    Obtener varios cursos por sus IDs en una sola consulta.
+
+    Usa $in sobre _id (siempre indexado) y la proyección del conjunto de
+    campos, de modo que el coste depende del número de cursos pedidos y no
+    del catálogo completo. Con "summary" las lecciones y reseñas no se cargan.
+
+    Args:
+        course_ids: Lista de IDs de cursos (strings u ObjectIds). Los IDs
+                    vacíos o con formato inválido se ignoran.
+        fields: Conjunto de campos ("card", "summary" o "full"). Por defecto "summary".
+
+    Returns:
+        List[Course]: Cursos encontrados (sin lecciones ni reseñas).
+                      Retorna lista vacía si hay error.
+
+    Ejemplo:
+        >>> courses = await get_courses_by_ids(instructor.courses_created)
+        >>> print(len(courses))
+    """
+    try:
+        db = MongoDB.get_db()
+
+        courses_collection = db["courses"]
+
+        # Convertir a ObjectId descartando IDs vacíos o inválidos
+        object_ids = [ObjectId(cid) for cid in course_ids if cid and ObjectId.is_valid(cid)]
+        if not object_ids:
+            return []
+
+        projection = _course_projection(fields)
+        cursor = courses_collection.find(
+            {"_id": {"$in": object_ids}},
+            projection,
+        )
+        courses_data = await cursor.to_list(length=None)
+
+        return [Course.from_dict(course_data, partial=projection is not None) for course_data in courses_data]
+    except Exception as e:
+        print(f"Error fetching courses by IDs: {e}")
+        return []
+
+
+async def get_courses_by_instructor(instructor_id: str, fields: str = "summary") -> List[Course]:
+    """
+    Obtener los cursos cuyo instructor embebido es el usuario indicado.
+
+    Filtra por instructor.userId (campo indexado) con la proyección del
+    conjunto de campos.
+
+    Args:
+        instructor_id: ID del usuario instructor
+        fields: Conjunto de campos ("card", "summary" o "full"). Por defecto "summary".
+
+    Returns:
+        List[Course]: Cursos del instructor (sin lecciones ni reseñas).
+                      Retorna lista vacía si hay error.
+
+    Ejemplo:
+        >>> my_courses = await get_courses_by_instructor("507f1f77bcf86cd799439011")
+    """
+    try:
+        db = MongoDB.get_db()
+
+        courses_collection = db["courses"]
+
+        projection = _course_projection(fields)
+        cursor = courses_collection.find(
+            {"instructor.userId": ObjectId(instructor_id)},
+            projection,
+        )
+        courses_data = await cursor.to_list(length=None)
+
+        return [Course.from_dict(course_data, partial=projection is not None) for course_data in courses_data]
+    except Exception as e:
+        print(f"Error fetching courses by instructor: {e}")
+        return []
+
+
 async def create_course(course_data: dict) -> bool:
     """
     Crear un nuevo curso en la base de datos.
@@ -156,9 +600,11 @@ async def create_course(course_data: dict) -> bool:
 
     Nota:
         Los campos createdAt y studentsEnrolled se agregan automáticamente.
+        El contenido de las lecciones se guarda en la colección lessons y el
+        curso solo conserva su índice (_id, title, order, duration).
+        También actualiza el documento platform_stats (cursos, lecciones, categorías).
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         courses_collection = db["courses"]
@@ -168,8 +614,24 @@ async def create_course(course_data: dict) -> bool:
         course_data["createdAt"] = datetime.now(timezone.utc)
         course_data["studentsEnrolled"] = 0
 
+        # Dejar en el curso solo el índice de lecciones
+        outline, lesson_bodies = split_lessons(course_data.get("lessons", []))
+        course_data["lessons"] = outline
+
         result = await courses_collection.insert_one(course_data)
-        return result.inserted_id is not None
+        if result.inserted_id is None:
+            return False
+
+        await insert_course_lessons(result.inserted_id, lesson_bodies)
+
+        await invalidate_catalog_cache()
+
+        # Actualizar las estadísticas materializadas de la plataforma
+        await update_platform_stats(
+            inc={"totalCourses": 1, "totalLessons": len(course_data.get("lessons", []))},
+            add_categories=course_data.get("categories", []),
+        )
+        return True
     except Exception as e:
         print(f"Error creating course: {e}")
         return False
@@ -180,6 +642,8 @@ async def update_course(course_id: str, update_data: dict) -> bool:
     Actualizar los datos de un curso existente.
 
     Actualiza campos específicos de un curso usando la operación $set de MongoDB.
+    Si cambian las categorías, añade las nuevas al documento platform_stats y
+    quita las que ya no tenga ningún curso, como create_course y delete_course.
 
     Args:
         course_id: ID del curso a actualizar
@@ -194,17 +658,40 @@ async def update_course(course_id: str, update_data: dict) -> bool:
         >>> success = await update_course("507f1f77bcf86cd799439011", update_data)
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         courses_collection = db["courses"]
 
-        result = await courses_collection.update_one(
+        if "categories" not in update_data:
+            result = await courses_collection.update_one(
+                {"_id": ObjectId(course_id)},
+                {"$set": update_data}
+            )
+            await invalidate_course_cache(course_id)
+            return result.matched_count > 0
+
+        # Recuperar las categorías anteriores para actualizar las estadísticas
+        previous = await courses_collection.find_one_and_update(
             {"_id": ObjectId(course_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"categories": 1},
         )
-
-        return result.matched_count > 0
+        await invalidate_course_cache(course_id)
+        if previous is None:
+            return False
+
+        old_categories = set(previous.get("categories") or [])
+        new_categories = set(update_data.get("categories") or [])
+        orphan_categories = [
+            category for category in old_categories - new_categories
+            if not await courses_collection.count_documents({"categories": category}, limit=1)
+        ]
+        if new_categories - old_categories or orphan_categories:
+            await update_platform_stats(
+                add_categories=sorted(new_categories - old_categories),
+                remove_categories=orphan_categories,
+            )
+        return True
     except Exception as e:
         print(f"Error updating course: {e}")
         return False
@@ -230,18 +717,42 @@ async def delete_course(course_id: str) -> bool:
 
     Advertencia:
         - Esta operación es IRREVERSIBLE
-        - NO elimina automáticamente las inscripciones de estudiantes
-        - Considerar manejar la limpieza de datos relacionados antes de eliminar
+        - Elimina las lecciones, reseñas e inscripciones del curso (colecciones
+          lessons, reviews y enrollments)
+        - Actualiza el documento platform_stats (cursos, lecciones, inscripciones, categorías)
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         courses_collection = db["courses"]
 
-        result = await courses_collection.delete_one({"_id": ObjectId(course_id)})
-
-        return result.deleted_count > 0
+        # Recuperar lecciones y categorías del curso borrado para las estadísticas
+        deleted = await courses_collection.find_one_and_delete(
+            {"_id": ObjectId(course_id)},
+            projection={"categories": 1, "lessons.title": 1},
+        )
+        await invalidate_course_cache(course_id)
+        if deleted is None:
+            return False
+
+        await delete_course_lessons(course_id)
+        await db["reviews"].delete_many({"courseId": ObjectId(course_id)})
+        enrollments = await db["enrollments"].delete_many({"courseId": ObjectId(course_id)})
+
+        # Quitar las categorías que ya no tenga ningún otro curso
+        orphan_categories = [
+            category for category in deleted.get("categories", [])
+            if not await courses_collection.count_documents({"categories": category}, limit=1)
+        ]
+        await update_platform_stats(
+            inc={
+                "totalCourses": -1,
+                "totalLessons": -len(deleted.get("lessons", [])),
+                "totalEnrollments": -enrollments.deleted_count,
+            },
+            remove_categories=orphan_categories,
+        )
+        return True
     except Exception as e:
         print(f"Error deleting course: {e}")
         return False
@@ -5,43 +5,120 @@ Este módulo gestiona todas las operaciones relacionadas con las inscripciones
 de estudiantes en cursos, incluyendo inscripción, desinscripción, verificación
 y obtención de información de cursos inscritos.
 
+Las inscripciones se guardan en la colección enrollments (un documento por
+estudiante y curso) en lugar de en un array embebido en el usuario, de modo
+que tanto las consultas por estudiante como las consultas por curso usan un
+índice y se pueden paginar.
+
 Funcionalidades:
 - Inscribir estudiantes en cursos (con validaciones)
+- Inscribir en bloque pares (estudiante, curso) con bulk_write
 - Desinscribir estudiantes de cursos
 - Verificar si un estudiante está inscrito en un curso
-- Obtener lista completa de inscripciones de un estudiante
-- Contar inscripciones totales en la plataforma
+- Obtener las inscripciones de un estudiante (paginadas) y su resumen
+- Obtener los estudiantes de un curso (paginados)
+- Contar inscripciones totales y estudiantes únicos de varios cursos
 
 Colecciones MongoDB utilizadas:
-- users: Para gestionar enrolledCourses del estudiante
+- enrollments: {userId, courseId, enrolledAt, progress, completedLessons, status}
+- users: Para validar que el usuario es estudiante
 - courses: Para actualizar contador de studentsEnrolled
 """
 
-from typing import List, Optional
-from datetime import datetime
+from collections import Counter
+from typing import List, Tuple
+from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from E_Learning_JCB_Reflex.database import MongoDB
+from E_Learning_JCB_Reflex.services.course_service import invalidate_course_cache, invalidate_courses_cache
+from E_Learning_JCB_Reflex.services.stats_service import update_platform_stats
+
+
+# Campos del curso que muestra el dashboard del estudiante
+STUDENT_DASHBOARD_PROJECTION = {
+    "title": 1,
+    "description": 1,
+    "image": 1,
+    "instructor.name": 1,
+    "price": 1,
+    "level": 1,
+}
+
+# Cursos por página en el dashboard del estudiante
+STUDENT_ENROLLMENTS_PAGE_SIZE = 12
+
+# Estudiantes por página en los listados de un curso
+COURSE_STUDENTS_PAGE_SIZE = 50
+
+# Código de error de MongoDB para claves duplicadas
+DUPLICATE_KEY_ERROR = 11000
+
+
+class _CourseNotFound(Exception):
+    """El curso no existe; aborta la transacción de inscripción."""
+
+
+class _AlreadyEnrolled(Exception):
+    """La inscripción ya existe; aborta la transacción de inscripción."""
+
+
+async def _run_atomically(operation):
+    """
+    Ejecutar operation(session) dentro de una transacción multi-documento.
+
+    Si el servidor no admite transacciones (mongod standalone) la operación se
+    ejecuta sin sesión y es responsable de compensar sus propias escrituras.
+    with_transaction reintenta automáticamente ante errores transitorios.
+    """
+    if await MongoDB.supports_transactions():
+        async with await MongoDB.client.start_session() as session:
+            return await session.with_transaction(operation)
+    return await operation(None)
+
+
+def new_enrollment(user_oid: ObjectId, course_oid: ObjectId) -> dict:
+    """
+    Crear el documento de una inscripción nueva para la colección enrollments.
+
+    Args:
+        user_oid: ObjectId del estudiante
+        course_oid: ObjectId del curso
+
+    Returns:
+        dict: Documento con userId, courseId, enrolledAt, progress,
+              completedLessons y status
+    """
+    return {
+        "userId": user_oid,
+        "courseId": course_oid,
+        "enrolledAt": datetime.now(timezone.utc),
+        "progress": 0,
+        "completedLessons": [],
+        "status": "active",
+    }
 
 
 async def enroll_student(user_id: str, course_id: str) -> bool:
     """
     Inscribe un estudiante en un curso específico.
 
-    Realiza las siguientes validaciones y operaciones:
-    1. Verifica que el usuario existe y tiene rol "student"
-    2. Verifica que el curso existe
-    3. Comprueba que el estudiante no esté ya inscrito
-    4. Crea un objeto de inscripción con progreso inicial en 0
-    5. Actualiza el array enrolledCourses del usuario
-    6. Incrementa el contador studentsEnrolled del curso
+    Comprueba que el usuario tenga rol "student" e inserta la inscripción en
+    la colección enrollments. El índice único (userId, courseId) impide que
+    dos clics concurrentes dupliquen la inscripción. Después se incrementa el
+    contador studentsEnrolled del curso. Ambas escrituras se ejecutan en una
+    transacción cuando el servidor lo permite; en un servidor standalone, si el
+    curso no existe se borra la inscripción recién insertada.
 
     Args:
         user_id: ID del usuario estudiante (formato ObjectId en string)
         course_id: ID del curso (formato ObjectId en string)
 
     Returns:
-        bool: True si la inscripción fue exitosa, False si falló alguna validación
-              o hubo un error en la base de datos
+        bool: True si la inscripción fue exitosa, False si el usuario no es
+              estudiante, ya estaba inscrito, el curso no existe o hubo un error
+              en la base de datos
 
     Ejemplos:
         >>> await enroll_student("507f1f77bcf86cd799439011", "507f191e810c19729de860ea")
@@ -49,75 +126,235 @@ async def enroll_student(user_id: str, course_id: str) -> bool:
 
     Notas:
         - Solo permite inscripción a usuarios con rol "student"
-        - Previene inscripciones duplicadas
-        - El objeto de inscripción incluye: courseId, enrolledAt, progress,
-          completedLessons y status
+        - Previene inscripciones duplicadas de forma atómica (índice único)
+        - El documento de inscripción incluye: userId, courseId, enrolledAt,
+          progress, completedLessons y status
+        - Tres round trips a la base de datos en el caso normal
         - Imprime mensajes de log en consola para debugging
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
-        users_collection = db["users"]
+        enrollments_collection = db["enrollments"]
         courses_collection = db["courses"]
 
-        # Verificar que el usuario existe y es estudiante
-        user = await users_collection.find_one({"_id": ObjectId(user_id)})
-        if not user or user.get("role") != "student":
-            print(f"Usuario no encontrado o no es estudiante: {user_id}")
-            return False
+        user_oid = ObjectId(user_id)
+        course_oid = ObjectId(course_id)
 
-        # Verificar que el curso existe
-        course = await courses_collection.find_one({"_id": ObjectId(course_id)})
-        if not course:
-            print(f"Curso no encontrado: {course_id}")
+        # Solo los estudiantes pueden inscribirse
+        student = await db["users"].find_one({"_id": user_oid, "role": "student"}, {"_id": 1})
+        if not student:
+            print(f"Usuario no es estudiante: {user_id}")
             return False
 
-        # Verificar si ya está inscrito
-        if "enrolledCourses" not in user:
-            user["enrolledCourses"] = []
-
-        for enrollment in user["enrolledCourses"]:
-            if str(enrollment.get("courseId")) == course_id:
-                print(f"Usuario ya inscrito en el curso: {course_id}")
+        async def operation(session):
+            enrollment = new_enrollment(user_oid, course_oid)
+            try:
+                await enrollments_collection.insert_one(enrollment, session=session)
+            except DuplicateKeyError:
+                raise _AlreadyEnrolled(course_id)
+
+            # Incrementar el contador de estudiantes en el curso
+            course_result = await courses_collection.update_one(
+                {"_id": course_oid},
+                {"$inc": {"studentsEnrolled": 1}},
+                session=session,
+            )
+            if course_result.matched_count == 0:
+                if session is not None:
+                    raise _CourseNotFound(course_id)
+                # Sin transacción: deshacer la inscripción manualmente
+                await enrollments_collection.delete_one({"_id": enrollment["_id"]})
+                print(f"Curso no encontrado: {course_id}")
                 return False
+            return True
 
-        # Crear la inscripción
-        enrollment = {
-            "courseId": ObjectId(course_id),
-            "enrolledAt": datetime.utcnow(),
-            "progress": 0,
-            "completedLessons": [],
-            "status": "active"
-        }
+        try:
+            enrolled = await _run_atomically(operation)
+        except _AlreadyEnrolled:
+            print(f"El usuario ya está inscrito: {user_id} en {course_id}")
+            return False
+        except _CourseNotFound:
+            print(f"Curso no encontrado: {course_id}")
+            return False
 
-        # Actualizar el usuario
-        result = await users_collection.update_one(
-            {"_id": ObjectId(user_id)},
-            {"$push": {"enrolledCourses": enrollment}}
-        )
+        if not enrolled:
+            return False
 
-        # Incrementar el contador de estudiantes en el curso
-        await courses_collection.update_one(
-            {"_id": ObjectId(course_id)},
-            {"$inc": {"studentsEnrolled": 1}}
-        )
+        await invalidate_course_cache(course_oid, catalog=False)
+        await update_platform_stats(inc={"totalEnrollments": 1})
 
         print(f"Inscripción exitosa: usuario {user_id} en curso {course_id}")
-        return result.modified_count > 0
+        return True
 
     except Exception as e:
         print(f"Error al inscribir estudiante: {e}")
         return False
 
 
+async def bulk_enroll(pairs: List[Tuple[str, str]]) -> dict:
+    """
+    Inscribe en bloque una lista de pares (user_id, course_id).
+
+    Pensado para importar cohortes: en lugar de llamar a enroll_student por
+    cada par, valida todos los usuarios, cursos e inscripciones existentes con
+    tres consultas $in y aplica las inscripciones con un único bulk_write no
+    ordenado de InsertOne sobre enrollments, seguido de un bulk_write con un
+    $inc agregado por curso para studentsEnrolled.
+
+    Args:
+        pairs: Lista de tuplas (user_id, course_id) como strings de ObjectId.
+               El llamador debe acotar su tamaño (p. ej. 1000 pares por llamada).
+
+    Returns:
+        dict: Resumen con las claves:
+            - enrolled (int): Inscripciones creadas
+            - skipped (int): Pares ya inscritos o repetidos en la entrada
+              (incluidas inscripciones concurrentes detectadas por el índice único)
+            - errors (list[dict]): Pares rechazados con index (posición en
+              pairs), user_id, course_id y error
+            - counter_errors (list[str]): Fallos al actualizar studentsEnrolled
+              o totalEnrollments después de escribir las inscripciones. Las
+              inscripciones sí se crearon (cuentan en enrolled); los contadores
+              se corrigen con scripts/rebuild_platform_stats.py
+
+    Ejemplos:
+        >>> await bulk_enroll([("507f1f77bcf86cd799439011", "507f191e810c19729de860ea")])
+        {'enrolled': 1, 'skipped': 0, 'errors': [], 'counter_errors': []}
+
+    Notas:
+        - Solo inscribe usuarios con rol "student" en cursos existentes
+        - studentsEnrolled y totalEnrollments solo se incrementan por los
+          InsertOne que el bulk_write aplicó: las posiciones que MongoDB
+          devuelve en writeErrors (duplicados por el índice único u otros
+          fallos) se excluyen, y result.inserted_count / nInserted lo confirma
+    """
+    summary = {"enrolled": 0, "skipped": 0, "errors": [], "counter_errors": []}
+
+    def reject(index, user_id, course_id, error):
+        summary["errors"].append(
+            {"index": index, "user_id": user_id, "course_id": course_id, "error": error}
+        )
+
+    # Validar formato de los IDs
+    parsed = []
+    for index, (user_id, course_id) in enumerate(pairs):
+        if not ObjectId.is_valid(user_id) or not ObjectId.is_valid(course_id):
+            reject(index, user_id, course_id, "ID con formato inválido")
+            continue
+        parsed.append((index, user_id, course_id, ObjectId(user_id), ObjectId(course_id)))
+
+    if not parsed:
+        return summary
+
+    try:
+        db = MongoDB.get_db()
+
+        enrollments_collection = db["enrollments"]
+        courses_collection = db["courses"]
+
+        user_oids = list({p[3] for p in parsed})
+        course_oids = list({p[4] for p in parsed})
+
+        # Validar usuarios, cursos e inscripciones existentes con tres consultas $in
+        students = {
+            user["_id"]
+            async for user in db["users"].find(
+                {"_id": {"$in": user_oids}, "role": "student"},
+                {"_id": 1},
+            )
+        }
+        existing_courses = {
+            course["_id"]
+            async for course in courses_collection.find(
+                {"_id": {"$in": course_oids}},
+                {"_id": 1},
+            )
+        }
+        already_enrolled = {
+            (enrollment["userId"], enrollment["courseId"])
+            async for enrollment in enrollments_collection.find(
+                {"userId": {"$in": user_oids}, "courseId": {"$in": course_oids}},
+                {"_id": 0, "userId": 1, "courseId": 1},
+            )
+        }
+
+        operations = []
+        operation_pairs = []
+        seen = set()
+        for index, user_id, course_id, user_oid, course_oid in parsed:
+            if user_oid not in students:
+                reject(index, user_id, course_id, "Usuario no encontrado o no es estudiante")
+            elif course_oid not in existing_courses:
+                reject(index, user_id, course_id, "Curso no encontrado")
+            elif (user_oid, course_oid) in seen or (user_oid, course_oid) in already_enrolled:
+                summary["skipped"] += 1
+            else:
+                seen.add((user_oid, course_oid))
+                operations.append(InsertOne(new_enrollment(user_oid, course_oid)))
+                operation_pairs.append((index, user_id, course_id, course_oid))
+
+        if not operations:
+            return summary
+
+        # Aplicar las inscripciones sin orden para que un fallo no detenga el resto
+        failed = set()
+        try:
+            inserted = (await enrollments_collection.bulk_write(operations, ordered=False)).inserted_count
+        except BulkWriteError as e:
+            inserted = e.details.get("nInserted", 0)
+            for write_error in e.details.get("writeErrors", []):
+                index, user_id, course_id, _ = operation_pairs[write_error["index"]]
+                failed.add(write_error["index"])
+                if write_error.get("code") == DUPLICATE_KEY_ERROR:
+                    # Inscrito por otra petición entre la validación y la escritura
+                    summary["skipped"] += 1
+                else:
+                    reject(index, user_id, course_id, write_error.get("errmsg", "Error de escritura"))
+
+        # Incremento agregado por curso, solo con las inscripciones escritas
+        per_course = Counter(
+            pair[3] for position, pair in enumerate(operation_pairs) if position not in failed
+        )
+        if sum(per_course.values()) != inserted:
+            print(f"bulk_enroll: {inserted} inserciones confirmadas y {sum(per_course.values())} contadas")
+        summary["enrolled"] = sum(per_course.values())
+
+        # Las inscripciones ya están escritas: un fallo en los contadores no las rechaza
+        if per_course:
+            try:
+                await courses_collection.bulk_write(
+                    [
+                        UpdateOne({"_id": course_oid}, {"$inc": {"studentsEnrolled": count}})
+                        for course_oid, count in per_course.items()
+                    ],
+                    ordered=False,
+                )
+                await invalidate_courses_cache(per_course, catalog=False)
+            except Exception as e:
+                print(f"Error actualizando studentsEnrolled en inscripción masiva: {e}")
+                summary["counter_errors"].append(f"studentsEnrolled: {e}")
+        if not await update_platform_stats(inc={"totalEnrollments": summary["enrolled"]}):
+            summary["counter_errors"].append("totalEnrollments: no se pudo actualizar platform_stats")
+
+        return summary
+
+    except Exception as e:
+        print(f"Error en inscripción masiva: {e}")
+        rejected = {error["index"] for error in summary["errors"]}
+        for index, user_id, course_id, *_ in parsed:
+            if index not in rejected:
+                reject(index, user_id, course_id, str(e))
+        return summary
+
+
 async def unenroll_student(user_id: str, course_id: str) -> bool:
     """
     Desinscribe un estudiante de un curso, eliminando su registro de inscripción.
 
-    Realiza las siguientes operaciones:
-    1. Elimina la inscripción del array enrolledCourses del usuario
-    2. Decrementa el contador studentsEnrolled del curso
+    Realiza las siguientes operaciones (en una transacción si el servidor lo permite):
+    1. Elimina el documento de la inscripción de la colección enrollments
+    2. Decrementa el contador studentsEnrolled del curso sin bajar de 0
     3. Elimina todo el progreso asociado a esa inscripción
 
     Args:
@@ -134,29 +371,39 @@ async def unenroll_student(user_id: str, course_id: str) -> bool:
 
     Notas:
         - Elimina permanentemente todo el progreso del estudiante en el curso
-        - Utiliza operador $pull de MongoDB para eliminar del array
-        - Solo decrementa el contador si se eliminó exitosamente la inscripción
+        - Solo decrementa el contador si se eliminó exitosamente la inscripción,
+          por lo que dos desinscripciones concurrentes no lo decrementan dos veces
         - Imprime mensajes de log en consola para debugging
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
-        users_collection = db["users"]
+        enrollments_collection = db["enrollments"]
         courses_collection = db["courses"]
 
-        # Eliminar la inscripción del usuario
-        result = await users_collection.update_one(
-            {"_id": ObjectId(user_id)},
-            {"$pull": {"enrolledCourses": {"courseId": ObjectId(course_id)}}}
-        )
+        user_oid = ObjectId(user_id)
+        course_oid = ObjectId(course_id)
+
+        async def operation(session):
+            # Eliminar la inscripción del usuario
+            result = await enrollments_collection.delete_one(
+                {"userId": user_oid, "courseId": course_oid},
+                session=session,
+            )
+            if result.deleted_count == 0:
+                return False
 
-        if result.modified_count > 0:
             # Decrementar el contador de estudiantes en el curso
             await courses_collection.update_one(
-                {"_id": ObjectId(course_id)},
-                {"$inc": {"studentsEnrolled": -1}}
+                {"_id": course_oid, "studentsEnrolled": {"$gt": 0}},
+                {"$inc": {"studentsEnrolled": -1}},
+                session=session,
             )
+            return True
+
+        if await _run_atomically(operation):
+            await invalidate_course_cache(course_oid, catalog=False)
+            await update_platform_stats(inc={"totalEnrollments": -1})
             print(f"Desinscripción exitosa: usuario {user_id} de curso {course_id}")
             return True
 
@@ -172,8 +419,8 @@ async def is_enrolled(user_id: str, course_id: str) -> bool:
     """
     Verifica si un estudiante está actualmente inscrito en un curso.
 
-    Busca en el array enrolledCourses del usuario para determinar
-    si existe una inscripción para el curso especificado.
+    Busca la inscripción en la colección enrollments con el índice único
+    (userId, courseId), proyectando solo el _id.
 
     Args:
         user_id: ID del usuario estudiante (formato ObjectId en string)
@@ -181,53 +428,77 @@ async def is_enrolled(user_id: str, course_id: str) -> bool:
 
     Returns:
         bool: True si el estudiante está inscrito en el curso,
-              False si no está inscrito, el usuario no existe,
-              o no tiene inscripciones
+              False si no está inscrito, el usuario no existe
+              o hay un error
 
     Ejemplos:
         >>> await is_enrolled("507f1f77bcf86cd799439011", "507f191e810c19729de860ea")
         True
 
     Notas:
-        - Retorna False si el usuario no tiene el campo enrolledCourses
-        - Compara el courseId usando string para evitar problemas de tipo
         - Útil para validar antes de inscribir o mostrar botones condicionales
         - Maneja excepciones y retorna False en caso de error
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
-        users_collection = db["users"]
-
-        user = await users_collection.find_one({"_id": ObjectId(user_id)})
-        if not user or "enrolledCourses" not in user:
-            return False
-
-        for enrollment in user["enrolledCourses"]:
-            if str(enrollment.get("courseId")) == course_id:
-                return True
-
-        return False
+        enrollment = await db["enrollments"].find_one(
+            {"userId": ObjectId(user_id), "courseId": ObjectId(course_id)},
+            {"_id": 1},
+        )
+        return enrollment is not None
 
     except Exception as e:
         print(f"Error al verificar inscripción: {e}")
         return False
 
 
-async def get_student_enrollments(user_id: str) -> List[dict]:
+def _enrolled_before(after: str) -> dict:
     """
-    Obtiene todas las inscripciones de un estudiante con información completa de cada curso.
+    Filtro de las inscripciones posteriores (en orden enrolledAt, _id descendente) a un cursor.
 
-    Para cada inscripción, realiza un lookup del curso en la colección de cursos
-    para obtener información detallada como título, descripción, instructor, etc.
-    Combina la información del curso con los datos de progreso de la inscripción.
+    El cursor es "<milisegundos de enrolledAt>:<_id>", tal como lo genera _enrollment_cursor.
+    """
+    millis, last_id = after.split(":")
+    enrolled_at = datetime.fromtimestamp(int(millis) / 1000, tz=timezone.utc)
+    return {
+        "$or": [
+            {"enrolledAt": {"$lt": enrolled_at}},
+            {"enrolledAt": enrolled_at, "_id": {"$lt": ObjectId(last_id)}},
+        ]
+    }
+
+
+def _enrollment_cursor(enrollment: dict) -> str:
+    """Cursor "<milisegundos de enrolledAt>:<_id>" que apunta a continuación de una inscripción."""
+    enrolled_at = enrollment["enrolledAt"]
+    if enrolled_at.tzinfo is None:
+        enrolled_at = enrolled_at.replace(tzinfo=timezone.utc)
+    return f"{int(enrolled_at.timestamp() * 1000)}:{enrollment['_id']}"
+
+
+async def get_student_enrollments(
+    user_id: str,
+    after: str = "",
+    page_size: int = STUDENT_ENROLLMENTS_PAGE_SIZE,
+) -> Tuple[List[dict], str]:
+    """
+    Obtiene una página de inscripciones de un estudiante con la información de cada curso.
+
+    Recorre las inscripciones del estudiante de la más reciente a la más
+    antigua con paginación por cursor sobre (enrolledAt, _id) (índice
+    userId + enrolledAt + _id) y obtiene los cursos de la página con una
+    única consulta $in proyectando solo los campos del dashboard: dos round
+    trips por página, independientemente del número total de inscripciones.
 
     Args:
         user_id: ID del usuario estudiante (formato ObjectId en string)
+        after: Cursor devuelto por la página anterior ("" para la primera)
+        page_size: Inscripciones por página. Por defecto STUDENT_ENROLLMENTS_PAGE_SIZE.
 
     Returns:
-        List[dict]: Lista de diccionarios con la siguiente estructura:
+        Tuple[List[dict], str]: Cursos de la página y cursor de la siguiente
+        ("" si no hay más). Cada curso tiene la siguiente estructura:
             - id: ID del curso (string)
             - title: Título del curso
             - description: Descripción del curso
@@ -240,69 +511,227 @@ async def get_student_enrollments(user_id: str) -> List[dict]:
             - status: Estado de la inscripción (active/completed)
 
     Ejemplos:
-        >>> enrollments = await get_student_enrollments("507f1f77bcf86cd799439011")
-        >>> print(len(enrollments))
-        3
+        >>> enrollments, cursor = await get_student_enrollments("507f1f77bcf86cd799439011")
         >>> print(enrollments[0]['title'])
         'Introducción a Python'
+        >>> more, cursor = await get_student_enrollments("507f1f77bcf86cd799439011", after=cursor)
 
     Notas:
-        - Retorna lista vacía si el usuario no existe o no tiene inscripciones
+        - Retorna ([], "") si el usuario no tiene inscripciones o hay un error
         - Solo incluye cursos que aún existen en la base de datos
         - Usa imagen placeholder si el curso no tiene imagen configurada
-        - Útil para mostrar el dashboard del estudiante con progreso
-        - Maneja excepciones y retorna lista vacía en caso de error
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
-        users_collection = db["users"]
-        courses_collection = db["courses"]
+        query = {"userId": ObjectId(user_id)}
+        if after:
+            query.update(_enrolled_before(after))
 
-        # Obtener el usuario
-        user = await users_collection.find_one({"_id": ObjectId(user_id)})
-        if not user or "enrolledCourses" not in user:
-            return []
+        # Pedir un documento extra para saber si existe una página siguiente
+        cursor = (
+            db["enrollments"].find(query, {"userId": 0, "completedLessons": 0})
+            .sort([("enrolledAt", -1), ("_id", -1)])
+            .limit(page_size + 1)
+        )
+        enrollments = await cursor.to_list(length=page_size + 1)
 
-        # Obtener información completa de cada curso
+        has_more = len(enrollments) > page_size
+        enrollments = enrollments[:page_size]
+        next_cursor = _enrollment_cursor(enrollments[-1]) if has_more else ""
+
+        # Obtener los cursos de la página en una sola consulta con $in
+        courses_cursor = db["courses"].find(
+            {"_id": {"$in": [e["courseId"] for e in enrollments]}},
+            STUDENT_DASHBOARD_PROJECTION,
+        )
+        courses_by_id = {course["_id"]: course async for course in courses_cursor}
+
+        # Combinar en el orden de la página, omitiendo cursos eliminados
         enrolled_courses = []
-        for enrollment in user["enrolledCourses"]:
-            course_id = enrollment.get("courseId")
-            if course_id:
-                course = await courses_collection.find_one({"_id": course_id})
-                if course:
-                    course_data = {
-                        "id": str(course["_id"]),
-                        "title": course.get("title", ""),
-                        "description": course.get("description", ""),
-                        "thumbnail": course.get("image", "/placeholder-course.jpg"),
-                        "instructor_name": course.get("instructor", {}).get("name", "Unknown"),
-                        "price": course.get("price", 0),
-                        "level": course.get("level", "beginner"),
-                        "progress": enrollment.get("progress", 0),
-                        "enrolledAt": str(enrollment.get("enrolledAt", "")),
-                        "status": enrollment.get("status", "active"),
-                    }
-                    enrolled_courses.append(course_data)
-
-        return enrolled_courses
+        for enrollment in enrollments:
+            course = courses_by_id.get(enrollment["courseId"])
+            if course:
+                course_data = {
+                    "id": str(course["_id"]),
+                    "title": course.get("title", ""),
+                    "description": course.get("description", ""),
+                    "thumbnail": course.get("image", "/placeholder-course.jpg"),
+                    "instructor_name": course.get("instructor", {}).get("name", "Unknown"),
+                    "price": course.get("price", 0),
+                    "level": course.get("level", "beginner"),
+                    "progress": enrollment.get("progress", 0),
+                    "enrolledAt": str(enrollment.get("enrolledAt", "")),
+                    "status": enrollment.get("status", "active"),
+                }
+                enrolled_courses.append(course_data)
+
+        return enrolled_courses, next_cursor
 
     except Exception as e:
         print(f"Error al obtener inscripciones: {e}")
-        return []
+        return [], ""
+
+
+async def get_student_enrollment_summary(user_id: str) -> dict:
+    """
+    Obtener las estadísticas de inscripción de un estudiante.
+
+    Calcula en el servidor, con una agregación sobre el índice userId + status,
+    los totales que muestra el dashboard sin cargar todas las inscripciones.
+
+    Args:
+        user_id: ID del usuario estudiante (formato ObjectId en string)
+
+    Returns:
+        dict: Resumen con las claves:
+            - total (int): Cursos inscritos
+            - completed (int): Cursos completados (progreso 100%)
+            - average_progress (float): Progreso medio redondeado a un decimal
+        Todos a 0 si no tiene inscripciones o hay un error.
+
+    Ejemplo:
+        >>> await get_student_enrollment_summary("507f1f77bcf86cd799439011")
+        {'total': 3, 'completed': 1, 'average_progress': 56.7}
+    """
+    summary = {"total": 0, "completed": 0, "average_progress": 0.0}
+    try:
+        db = MongoDB.get_db()
+
+        pipeline = [
+            {"$match": {"userId": ObjectId(user_id)}},
+            {
+                "$group": {
+                    "_id": None,
+                    "total": {"$sum": 1},
+                    "completed": {"$sum": {"$cond": [{"$gte": ["$progress", 100]}, 1, 0]}},
+                    "average_progress": {"$avg": "$progress"},
+                }
+            },
+        ]
+        result = await db["enrollments"].aggregate(pipeline).to_list(length=1)
+        if result:
+            summary["total"] = result[0]["total"]
+            summary["completed"] = result[0]["completed"]
+            summary["average_progress"] = round(result[0]["average_progress"] or 0, 1)
+
+        return summary
+
+    except Exception as e:
+        print(f"Error al obtener resumen de inscripciones: {e}")
+        return summary
+
+
+async def get_course_students(
+    course_id: str,
+    after: str = "",
+    page_size: int = COURSE_STUDENTS_PAGE_SIZE,
+) -> Tuple[List[dict], str]:
+    """
+    Obtener una página de inscripciones de un curso, de la más reciente a la más antigua.
+
+    Usa paginación por cursor sobre (enrolledAt, _id) con el índice
+    courseId + enrolledAt + _id, así que el coste de cada página no depende
+    del número de estudiantes del curso.
+
+    Args:
+        course_id: ID del curso (formato ObjectId en string)
+        after: Cursor devuelto por la página anterior ("" para la primera)
+        page_size: Inscripciones por página. Por defecto COURSE_STUDENTS_PAGE_SIZE.
+
+    Returns:
+        Tuple[List[dict], str]: Inscripciones de la página (user_id,
+        enrolledAt, progress, status) y cursor de la siguiente ("" si no hay
+        más). Retorna ([], "") si hay error.
+
+    Ejemplo:
+        >>> students, cursor = await get_course_students(course_id)
+        >>> more, cursor = await get_course_students(course_id, after=cursor)
+    """
+    try:
+        db = MongoDB.get_db()
+
+        query = {"courseId": ObjectId(course_id)}
+        if after:
+            query.update(_enrolled_before(after))
+
+        # Pedir un documento extra para saber si existe una página siguiente
+        cursor = (
+            db["enrollments"].find(query, {"userId": 1, "enrolledAt": 1, "progress": 1, "status": 1})
+            .sort([("enrolledAt", -1), ("_id", -1)])
+            .limit(page_size + 1)
+        )
+        enrollments = await cursor.to_list(length=page_size + 1)
+
+        has_more = len(enrollments) > page_size
+        enrollments = enrollments[:page_size]
+
+        next_cursor = _enrollment_cursor(enrollments[-1]) if has_more else ""
+
+        students = [
+            {
+                "user_id": str(enrollment["userId"]),
+                "enrolledAt": str(enrollment.get("enrolledAt", "")),
+                "progress": enrollment.get("progress", 0),
+                "status": enrollment.get("status", "active"),
+            }
+            for enrollment in enrollments
+        ]
+        return students, next_cursor
+
+    except Exception as e:
+        print(f"Error al obtener estudiantes del curso: {e}")
+        return [], ""
+
+
+async def count_unique_students(course_ids: List[str]) -> int:
+    """
+    Contar los estudiantes distintos inscritos en un conjunto de cursos.
+
+    Un estudiante inscrito en varios de los cursos cuenta una sola vez. La
+    agregación agrupa por userId en el servidor usando el índice por courseId,
+    sin transferir las inscripciones.
+
+    Args:
+        course_ids: IDs de los cursos (por ejemplo, los de un instructor)
+
+    Returns:
+        int: Número de estudiantes únicos. 0 si no hay cursos o hay un error.
+
+    Ejemplo:
+        >>> await count_unique_students(instructor.courses_created)
+        42
+    """
+    course_oids = [ObjectId(course_id) for course_id in course_ids if ObjectId.is_valid(str(course_id))]
+    if not course_oids:
+        return 0
+
+    try:
+        db = MongoDB.get_db()
+
+        pipeline = [
+            {"$match": {"courseId": {"$in": course_oids}}},
+            {"$group": {"_id": "$userId"}},
+            {"$count": "total"},
+        ]
+        result = await db["enrollments"].aggregate(pipeline).to_list(length=1)
+
+        return result[0]["total"] if result else 0
+
+    except Exception as e:
+        print(f"Error al contar estudiantes únicos: {e}")
+        return 0
 
 
 async def count_total_enrollments() -> int:
     """
-    Cuenta el total de inscripciones activas en toda la plataforma.
+    Cuenta el total de inscripciones en toda la plataforma.
 
-    Itera sobre todos los usuarios con rol "student" y suma la cantidad
-    de cursos en su array enrolledCourses para obtener el total global
-    de inscripciones.
+    Usa el número de documentos de la colección enrollments que mantiene
+    MongoDB en sus metadatos (estimated_document_count), sin recorrerla.
 
     Returns:
-        int: Número total de inscripciones activas en la plataforma.
+        int: Número total de inscripciones en la plataforma.
              Retorna 0 si no hay inscripciones o si hay un error.
 
     Ejemplos:
@@ -311,26 +740,14 @@ async def count_total_enrollments() -> int:
         Total de inscripciones: 156
 
     Notas:
-        - Solo cuenta inscripciones de usuarios con rol "student"
         - Cuenta todas las inscripciones sin importar su estado
         - Útil para estadísticas del dashboard de administrador
-        - Puede ser lento si hay muchos estudiantes (considera cachear)
         - Retorna 0 en caso de error y lo imprime en consola
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
-        users_collection = db["users"]
-
-        # Contar inscripciones de todos los estudiantes
-        total = 0
-        cursor = users_collection.find({"role": "student"})
-        async for user in cursor:
-            if "enrolledCourses" in user:
-                total += len(user["enrolledCourses"])
-
-        return total
+        return await db["enrollments"].estimated_document_count()
 
     except Exception as e:
         print(f"Error al contar inscripciones: {e}")
@@ -0,0 +1,131 @@
+"""
+Servicio de lecciones para operaciones de base de datos.
+
+El contenido de las lecciones se guarda en la colección lessons (un documento
+por lección, indexado por courseId y order) y el documento del curso solo
+conserva un índice ligero en su array lessons con _id, title, order y
+duration. Así los listados, dashboards e inscripciones no cargan cuerpos de
+lecciones que no muestran, y el documento del curso no crece con el
+contenido.
+
+Funciones principales:
+- split_lessons: Separar lecciones completas en índice del curso y documentos de lección
+- insert_course_lessons: Guardar en la colección lessons el contenido de un curso
+- get_lesson: Obtener una lección completa (contenido y vídeo)
+- delete_course_lessons: Eliminar las lecciones de un curso
+
+Colecciones MongoDB utilizadas:
+- lessons: Contenido de cada lección ({courseId, order, title, content, duration, video_url})
+"""
+
+from typing import List, Tuple
+from bson import ObjectId
+from E_Learning_JCB_Reflex.models.course import Lesson
+from E_Learning_JCB_Reflex.database import MongoDB
+
+
+# Campos de cada lección que se mantienen embebidos en el documento del curso
+LESSON_OUTLINE_FIELDS = ("_id", "title", "order", "duration")
+
+
+def split_lessons(lessons: List[dict]) -> Tuple[List[dict], List[dict]]:
+    """
+    Separar lecciones completas en el índice del curso y los documentos de lección.
+
+    Asigna un ObjectId a las lecciones que no lo tengan, de modo que cada
+    entrada del índice y su documento en lessons comparten el mismo _id.
+
+    Args:
+        lessons: Lecciones en formato MongoDB (con content, video_url, etc.)
+
+    Returns:
+        Tuple[List[dict], List[dict]]: (índice para el curso, documentos para
+        la colección lessons sin courseId)
+
+    Ejemplo:
+        >>> outline, bodies = split_lessons(course_data["lessons"])
+        >>> course_data["lessons"] = outline
+    """
+    outline = []
+    bodies = []
+    for position, lesson in enumerate(lessons):
+        body = dict(lesson)
+        body.setdefault("_id", ObjectId())
+        body.setdefault("order", position + 1)
+        bodies.append(body)
+        outline.append({field: body[field] for field in LESSON_OUTLINE_FIELDS if field in body})
+    return outline, bodies
+
+
+async def insert_course_lessons(course_id, bodies: List[dict], session=None) -> None:
+    """
+    Guardar en la colección lessons los documentos de lección de un curso.
+
+    Args:
+        course_id: ID del curso (string u ObjectId)
+        bodies: Documentos devueltos por split_lessons
+        session: Sesión de MongoDB opcional (para migraciones transaccionales)
+    """
+    if not bodies:
+        return
+
+    db = MongoDB.get_db()
+
+    course_oid = ObjectId(course_id)
+    await db["lessons"].insert_many(
+        [{**body, "courseId": course_oid} for body in bodies],
+        ordered=False,
+        session=session,
+    )
+
+
+async def get_lesson(course_id: str, lesson_id: str) -> Lesson | None:
+    """
+    Obtener una lección completa (con contenido y vídeo).
+
+    Filtra también por courseId para que no se pueda leer una lección de otro
+    curso cambiando solo el ID de la lección.
+
+    Args:
+        course_id: ID del curso
+        lesson_id: ID de la lección
+
+    Returns:
+        Lesson | None: Lección completa, None si no existe o hay error
+
+    Ejemplo:
+        >>> lesson = await get_lesson(course_id, "65a1f0c2e4b0a1b2c3d4e5f6")
+        >>> print(lesson.video_url)
+    """
+    try:
+        db = MongoDB.get_db()
+
+        lesson_data = await db["lessons"].find_one(
+            {"_id": ObjectId(lesson_id), "courseId": ObjectId(course_id)}
+        )
+        if lesson_data:
+            return Lesson.from_dict(lesson_data)
+        return None
+    except Exception as e:
+        print(f"Error fetching lesson: {e}")
+        return None
+
+
+async def delete_course_lessons(course_id) -> int:
+    """
+    Eliminar todas las lecciones de un curso.
+
+    Args:
+        course_id: ID del curso (string u ObjectId)
+
+    Returns:
+        int: Número de lecciones eliminadas (0 si hay error)
+    """
+    try:
+        db = MongoDB.get_db()
+
+        result = await db["lessons"].delete_many({"courseId": ObjectId(course_id)})
+        return result.deleted_count
+    except Exception as e:
+        print(f"Error deleting lessons: {e}")
+        return 0
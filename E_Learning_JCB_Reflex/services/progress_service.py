@@ -0,0 +1,201 @@
+"""
+Servicio de progreso de lecciones de los estudiantes.
+
+Registra qué lecciones ha completado cada estudiante en su documento de la
+colección enrollments ($addToSet sobre completedLessons) y recalcula en el
+servidor el porcentaje progress y el estado de la inscripción.
+
+Para que la navegación rápida entre lecciones no genere una escritura por
+clic, las lecciones completadas se acumulan en un buffer en memoria por
+(usuario, curso) y se escriben en bloque:
+- periódicamente, cada PROGRESS_FLUSH_INTERVAL_SECONDS (progress_flush_lifespan)
+- al salir del visor del curso (flush_lesson_progress desde on_unmount)
+- al apagar el backend
+
+Reflex no notifica a los estados la desconexión del websocket de un
+cliente, así que no hay flush al desconectarse: si el estudiante cierra la
+pestaña, on_unmount no llega y sus lecciones se escriben en el siguiente
+flush periódico. Solo si el worker termina de forma abrupta (sin pasar por
+el apagado del backend) se pierden, como máximo, las lecciones completadas
+en los últimos PROGRESS_FLUSH_INTERVAL_SECONDS. Reducir el intervalo acota
+esa ventana a cambio de más escrituras.
+
+Funciones principales:
+- get_enrollment: Obtener la inscripción de un estudiante en un curso
+- record_lesson_completion: Marcar una lección como completada (en el buffer)
+- flush_lesson_progress: Escribir las lecciones pendientes en MongoDB
+- save_lesson_completions: Escribir directamente un conjunto de lecciones completadas
+- progress_flush_lifespan: Tarea de ciclo de vida que vacía el buffer periódicamente
+
+Variables de entorno opcionales:
+- PROGRESS_FLUSH_INTERVAL_SECONDS: Intervalo de escritura del buffer (por defecto 10)
+"""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+from typing import Iterable, Optional
+from bson import ObjectId
+from pymongo import ReturnDocument
+from E_Learning_JCB_Reflex.database import MongoDB
+from E_Learning_JCB_Reflex.services.course_service import get_course_by_id
+
+
+PROGRESS_FLUSH_INTERVAL_SECONDS = float(os.getenv("PROGRESS_FLUSH_INTERVAL_SECONDS", "10"))
+
+# Lecciones completadas pendientes de escribir: {(user_id, course_id): {lesson_id, ...}}
+_pending_completions: dict[tuple[str, str], set[str]] = {}
+
+
+async def get_enrollment(user_id: str, course_id: str) -> Optional[dict]:
+    """
+    Obtener la inscripción de un estudiante en un curso.
+
+    Lee el documento de la colección enrollments con el índice único
+    (userId, courseId).
+
+    Args:
+        user_id: ID del usuario estudiante
+        course_id: ID del curso
+
+    Returns:
+        Optional[dict]: Inscripción (courseId, progress, completedLessons,
+        status...) o None si no está inscrito o hay error
+
+    Ejemplo:
+        >>> enrollment = await get_enrollment(user_id, course_id)
+        >>> print(enrollment["progress"])
+    """
+    try:
+        db = MongoDB.get_db()
+
+        return await db["enrollments"].find_one(
+            {"userId": ObjectId(user_id), "courseId": ObjectId(course_id)}
+        )
+    except Exception as e:
+        print(f"Error al obtener inscripción: {e}")
+        return None
+
+
+async def save_lesson_completions(user_id: str, course_id: str, lesson_ids: Iterable[str]) -> Optional[int]:
+    """
+    Registrar lecciones completadas y recalcular el progreso de la inscripción.
+
+    Añade las lecciones con $addToSet (sin duplicados) a la inscripción del
+    curso y, con el array resultante, fija progress
+    (porcentaje sobre las lecciones actuales del curso) y status
+    ("completed" al llegar al 100%).
+
+    Args:
+        user_id: ID del usuario estudiante
+        course_id: ID del curso
+        lesson_ids: IDs de las lecciones completadas
+
+    Returns:
+        Optional[int]: Nuevo porcentaje de progreso (0-100), o None si el
+        usuario no está inscrito o hay error
+
+    Ejemplo:
+        >>> await save_lesson_completions(user_id, course_id, ["65a1...", "65a2..."])
+        40
+    """
+    lesson_ids = [lesson_id for lesson_id in lesson_ids if lesson_id]
+    if not lesson_ids:
+        return None
+
+    try:
+        db = MongoDB.get_db()
+
+        enrollments_collection = db["enrollments"]
+
+        enrollment = await enrollments_collection.find_one_and_update(
+            {"userId": ObjectId(user_id), "courseId": ObjectId(course_id)},
+            {"$addToSet": {"completedLessons": {"$each": lesson_ids}}},
+            projection={"completedLessons": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if not enrollment:
+            return None
+
+        # Progreso respecto a las lecciones que el curso tiene ahora
+        course = await get_course_by_id(course_id)
+        course_lessons = {lesson.id for lesson in course.lessons} if course else set()
+        completed = set(enrollment.get("completedLessons", [])) & course_lessons
+        progress = round(len(completed) * 100 / len(course_lessons)) if course_lessons else 0
+
+        await enrollments_collection.update_one(
+            {"_id": enrollment["_id"]},
+            {"$set": {
+                "progress": progress,
+                "status": "completed" if progress >= 100 else "active",
+            }},
+        )
+        return progress
+    except Exception as e:
+        print(f"Error al guardar el progreso: {e}")
+        return None
+
+
+def record_lesson_completion(user_id: str, course_id: str, lesson_id: str) -> None:
+    """
+    Marcar una lección como completada sin escribir todavía en MongoDB.
+
+    La lección se guarda en el buffer del proceso y se escribe en el siguiente
+    flush, junto con el resto de lecciones pendientes de la misma inscripción.
+
+    Args:
+        user_id: ID del usuario estudiante
+        course_id: ID del curso
+        lesson_id: ID de la lección completada
+    """
+    if user_id and course_id and lesson_id:
+        _pending_completions.setdefault((user_id, course_id), set()).add(lesson_id)
+
+
+async def flush_lesson_progress(user_id: str = "", course_id: str = "") -> None:
+    """
+    Escribir en MongoDB las lecciones completadas pendientes.
+
+    Una escritura por inscripción, independientemente de cuántas lecciones se
+    hayan acumulado. Sin argumentos vacía el buffer completo.
+
+    Args:
+        user_id: Limitar el flush a este usuario (opcional)
+        course_id: Limitar el flush a este curso (opcional, junto con user_id)
+    """
+    if user_id and course_id:
+        keys = [(user_id, course_id)] if (user_id, course_id) in _pending_completions else []
+    else:
+        keys = list(_pending_completions)
+
+    for key in keys:
+        lesson_ids = _pending_completions.pop(key, None)
+        if lesson_ids:
+            await save_lesson_completions(key[0], key[1], lesson_ids)
+
+
+@asynccontextmanager
+async def progress_flush_lifespan():
+    """
+    Tarea de ciclo de vida de la app Reflex que vacía el buffer de progreso.
+
+    Escribe las lecciones pendientes cada PROGRESS_FLUSH_INTERVAL_SECONDS y
+    una última vez al apagar el backend. Se registra con
+    app.register_lifespan_task(progress_flush_lifespan).
+    """
+    async def flush_periodically():
+        while True:
+            await asyncio.sleep(PROGRESS_FLUSH_INTERVAL_SECONDS)
+            try:
+                await flush_lesson_progress()
+            except Exception as e:
+                print(f"Error flushing lesson progress: {e}")
+
+    flusher = asyncio.create_task(flush_periodically())
+    try:
+        yield
+    finally:
+        flusher.cancel()
+        with suppress(asyncio.CancelledError):
+            await flusher
+        await flush_lesson_progress()
@@ -0,0 +1,218 @@
+"""
+Servicio de reseñas de cursos.
+
+Las reseñas se guardan en la colección reviews (un documento por reseña,
+indexado por courseId y createdAt) en lugar de un array embebido en el curso.
+El curso mantiene de forma incremental sus agregados de valoración:
+
+- totalReviews: Número de reseñas
+- ratingSum: Suma de las calificaciones
+- ratingHistogram: Número de reseñas por estrella ({"1": n, ..., "5": n})
+- averageRating: ratingSum / totalReviews redondeado a un decimal
+
+Funciones principales:
+- submit_review: Publicar la reseña de un estudiante inscrito
+- get_course_reviews: Obtener una página de reseñas (paginación por cursor)
+- recompute_course_rating: Recalcular los agregados de un curso desde reviews
+
+Colecciones MongoDB utilizadas:
+- reviews: {courseId, student, rating, comment, createdAt}
+- courses: Agregados de valoración del curso
+"""
+
+from datetime import datetime, timezone
+from typing import List, Tuple
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from E_Learning_JCB_Reflex.models.course import Review
+from E_Learning_JCB_Reflex.database import MongoDB
+from E_Learning_JCB_Reflex.services.course_service import invalidate_course_cache
+from E_Learning_JCB_Reflex.services.enrollment_service import is_enrolled
+
+
+# Reseñas por página en el detalle del curso
+REVIEWS_PAGE_SIZE = 5
+
+
+def _average(rating_sum: float, total: int) -> float:
+    """Calcular la valoración media redondeada a un decimal."""
+    return round(rating_sum / total, 1) if total else 0
+
+
+async def submit_review(course_id: str, student_id: str, rating: int, comment: str = "") -> bool:
+    """
+    Publicar la reseña de un estudiante sobre un curso.
+
+    Inserta la reseña en la colección reviews y actualiza los agregados del
+    curso con un único $inc (totalReviews, ratingSum y la estrella del
+    histograma). Después fija averageRating condicionado al totalReviews que
+    devolvió ese $inc, de modo que si otra reseña llega a la vez prevalece el
+    cálculo más reciente.
+
+    Args:
+        course_id: ID del curso
+        student_id: ID del estudiante que escribe la reseña
+        rating: Calificación de 1 a 5 estrellas
+        comment: Comentario opcional
+
+    Returns:
+        bool: True si se publicó, False si la calificación no es válida, el
+              estudiante no está inscrito, ya había reseñado el curso o hay error
+
+    Ejemplo:
+        >>> await submit_review(course_id, user_id, 5, "¡Muy buen curso!")
+        True
+
+    Nota:
+        Cada estudiante solo puede publicar una reseña por curso (índice único
+        courseId + student).
+    """
+    if rating not in (1, 2, 3, 4, 5):
+        return False
+
+    try:
+        if not await is_enrolled(student_id, course_id):
+            print(f"Reseña rechazada: {student_id} no está inscrito en {course_id}")
+            return False
+
+        db = MongoDB.get_db()
+
+        course_oid = ObjectId(course_id)
+
+        try:
+            await db["reviews"].insert_one({
+                "courseId": course_oid,
+                "student": ObjectId(student_id),
+                "rating": rating,
+                "comment": comment.strip(),
+                "createdAt": datetime.now(timezone.utc),
+            })
+        except DuplicateKeyError:
+            print(f"El estudiante {student_id} ya ha reseñado el curso {course_id}")
+            return False
+
+        # Agregados incrementales de valoración
+        course = await db["courses"].find_one_and_update(
+            {"_id": course_oid},
+            {"$inc": {"totalReviews": 1, "ratingSum": rating, f"ratingHistogram.{rating}": 1}},
+            projection={"totalReviews": 1, "ratingSum": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if course:
+            await db["courses"].update_one(
+                {"_id": course_oid, "totalReviews": course["totalReviews"]},
+                {"$set": {"averageRating": _average(course["ratingSum"], course["totalReviews"])}},
+            )
+
+        await invalidate_course_cache(course_oid, catalog=False)
+        return True
+    except Exception as e:
+        print(f"Error submitting review: {e}")
+        return False
+
+
+async def get_course_reviews(
+    course_id: str,
+    after: str = "",
+    page_size: int = REVIEWS_PAGE_SIZE,
+) -> Tuple[List[Review], str]:
+    """
+    Obtener una página de reseñas de un curso, de la más reciente a la más antigua.
+
+    Usa paginación por cursor sobre (createdAt, _id) con el índice
+    courseId + createdAt + _id, así que el coste de cada página no depende del
+    número total de reseñas del curso.
+
+    Args:
+        course_id: ID del curso
+        after: Cursor devuelto por la página anterior ("" para la primera)
+        page_size: Reseñas por página. Por defecto REVIEWS_PAGE_SIZE.
+
+    Returns:
+        Tuple[List[Review], str]: Reseñas de la página y cursor de la siguiente
+        ("" si no hay más). Retorna ([], "") si hay error.
+
+    Ejemplo:
+        >>> reviews, cursor = await get_course_reviews(course_id)
+        >>> more, cursor = await get_course_reviews(course_id, after=cursor)
+    """
+    try:
+        db = MongoDB.get_db()
+
+        query = {"courseId": ObjectId(course_id)}
+        if after:
+            # El cursor es "<milisegundos de createdAt>:<_id>"
+            millis, last_id = after.split(":")
+            created_at = datetime.fromtimestamp(int(millis) / 1000, tz=timezone.utc)
+            query["$or"] = [
+                {"createdAt": {"$lt": created_at}},
+                {"createdAt": created_at, "_id": {"$lt": ObjectId(last_id)}},
+            ]
+
+        # Pedir un documento extra para saber si existe una página siguiente
+        cursor = (
+            db["reviews"].find(query)
+            .sort([("createdAt", -1), ("_id", -1)])
+            .limit(page_size + 1)
+        )
+        reviews_data = await cursor.to_list(length=page_size + 1)
+
+        has_more = len(reviews_data) > page_size
+        reviews_data = reviews_data[:page_size]
+
+        next_cursor = ""
+        if has_more:
+            last = reviews_data[-1]
+            created_at = last["createdAt"]
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            next_cursor = f"{int(created_at.timestamp() * 1000)}:{last['_id']}"
+
+        return [Review.from_dict(review) for review in reviews_data], next_cursor
+    except Exception as e:
+        print(f"Error fetching reviews: {e}")
+        return [], ""
+
+
+async def recompute_course_rating(course_id) -> dict:
+    """
+    Recalcular desde la colección reviews los agregados de valoración de un curso.
+
+    Útil tras migrar reseñas o si los contadores incrementales se han desviado.
+
+    Args:
+        course_id: ID del curso (string u ObjectId)
+
+    Returns:
+        dict: Agregados escritos en el curso (totalReviews, ratingSum,
+              ratingHistogram, averageRating). Vacío si hay error.
+    """
+    try:
+        db = MongoDB.get_db()
+
+        course_oid = ObjectId(course_id)
+        pipeline = [
+            {"$match": {"courseId": course_oid}},
+            {"$group": {"_id": "$rating", "count": {"$sum": 1}}},
+        ]
+        histogram = {
+            str(group["_id"]): group["count"]
+            async for group in db["reviews"].aggregate(pipeline)
+        }
+
+        total = sum(histogram.values())
+        rating_sum = sum(int(stars) * count for stars, count in histogram.items())
+        aggregates = {
+            "totalReviews": total,
+            "ratingSum": rating_sum,
+            "ratingHistogram": histogram,
+            "averageRating": _average(rating_sum, total),
+        }
+
+        await db["courses"].update_one({"_id": course_oid}, {"$set": aggregates})
+        await invalidate_course_cache(course_oid, catalog=False)
+        return aggregates
+    except Exception as e:
+        print(f"Error recomputing course rating: {e}")
+        return {}
@@ -0,0 +1,209 @@
+"""
+Servicio de estadísticas de la plataforma.
+
+Este módulo mantiene un documento materializado con las estadísticas globales
+(usuarios por rol, cursos, lecciones, inscripciones y categorías) en la colección
+platform_stats. Los servicios de escritura lo actualizan de forma incremental
+con $inc / $addToSet, y las páginas que muestran estadísticas (/about, dashboard
+de administración) solo leen ese documento.
+
+Funciones principales:
+- get_platform_stats: Leer el documento de estadísticas (lo reconstruye si no existe)
+- update_platform_stats: Aplicar un cambio incremental al documento
+- rebuild_platform_stats: Recalcular el documento desde cero con agregaciones
+- role_stats_field: Campo del contador correspondiente a un rol
+
+Esquema del documento (colección platform_stats, _id "global"):
+    totalStudents, totalInstructors, totalAdmins, totalCourses,
+    totalLessons, totalEnrollments (int), categories (list[str]), updatedAt
+"""
+
+from datetime import datetime, timezone
+from typing import List, Optional
+from E_Learning_JCB_Reflex.database import MongoDB
+
+
+PLATFORM_STATS_COLLECTION = "platform_stats"
+PLATFORM_STATS_ID = "global"
+
+# Campo del documento de estadísticas para cada rol de usuario
+_ROLE_FIELDS = {
+    "student": "totalStudents",
+    "instructor": "totalInstructors",
+    "admin": "totalAdmins",
+}
+
+
+def role_stats_field(role: str) -> Optional[str]:
+    """
+    Obtener el campo de platform_stats que cuenta los usuarios de un rol.
+
+    Args:
+        role: Rol del usuario ("student", "instructor" o "admin")
+
+    Returns:
+        str | None: Nombre del campo (p. ej. "totalStudents") o None si el rol no se cuenta
+    """
+    return _ROLE_FIELDS.get(role)
+
+
+def _stats_from_doc(doc: dict) -> dict:
+    """Convertir el documento de MongoDB (camelCase) al diccionario que usan los estados."""
+    stats = {
+        "total_students": doc.get("totalStudents", 0),
+        "total_instructors": doc.get("totalInstructors", 0),
+        "total_admins": doc.get("totalAdmins", 0),
+        "total_courses": doc.get("totalCourses", 0),
+        "total_lessons": doc.get("totalLessons", 0),
+        "total_enrollments": doc.get("totalEnrollments", 0),
+        "categories": sorted(doc.get("categories", [])),
+    }
+    stats["total_users"] = stats["total_students"] + stats["total_instructors"] + stats["total_admins"]
+    return stats
+
+
+async def get_platform_stats() -> dict:
+    """
+    Obtener las estadísticas generales de la plataforma.
+
+    Lee un único documento de platform_stats. Si todavía no existe (primera
+    ejecución o colección borrada) se reconstruye con rebuild_platform_stats.
+
+    Returns:
+        dict: Diccionario con las claves:
+            - total_students, total_instructors, total_admins, total_users
+            - total_courses, total_lessons
+            - total_enrollments: Suma de inscripciones de los estudiantes
+            - categories: Lista ordenada de categorías con al menos un curso
+        Todos los valores numéricos son 0 si hay error.
+
+    Ejemplo:
+        >>> stats = await get_platform_stats()
+        >>> print(stats["total_users"], stats["total_enrollments"])
+    """
+    try:
+        db = MongoDB.get_db()
+
+        doc = await db[PLATFORM_STATS_COLLECTION].find_one({"_id": PLATFORM_STATS_ID})
+        if doc is None:
+            return await rebuild_platform_stats()
+
+        return _stats_from_doc(doc)
+    except Exception as e:
+        print(f"Error fetching platform stats: {e}")
+        return _stats_from_doc({})
+
+
+async def update_platform_stats(
+    inc: Optional[dict] = None,
+    add_categories: Optional[List[str]] = None,
+    remove_categories: Optional[List[str]] = None,
+) -> bool:
+    """
+    Aplicar un cambio incremental al documento de estadísticas.
+
+    Lo llaman los servicios de escritura después de una operación exitosa.
+    No crea el documento si no existe (se reconstruirá en la siguiente
+    lectura) y nunca propaga errores: un fallo aquí no debe deshacer la
+    escritura principal; rebuild_platform_stats corrige cualquier desviación.
+
+    Args:
+        inc: Campos a incrementar, p. ej. {"totalCourses": 1, "totalLessons": 5}
+        add_categories: Categorías a añadir al conjunto ($addToSet)
+        remove_categories: Categorías a quitar del conjunto ($pull)
+
+    Returns:
+        bool: True si se aplicó el cambio, False si hubo un error (para que
+              el llamador pueda informar de que hace falta reconstruir)
+
+    Ejemplo:
+        >>> await update_platform_stats(inc={"totalEnrollments": 1})
+    """
+    update = {"$set": {"updatedAt": datetime.now(timezone.utc)}}
+    if inc:
+        update["$inc"] = inc
+    if add_categories:
+        update["$addToSet"] = {"categories": {"$each": [c for c in add_categories if c]}}
+    if remove_categories:
+        update["$pull"] = {"categories": {"$in": remove_categories}}
+
+    try:
+        db = MongoDB.get_db()
+
+        await db[PLATFORM_STATS_COLLECTION].update_one({"_id": PLATFORM_STATS_ID}, update)
+        return True
+    except Exception as e:
+        print(f"Error updating platform stats: {e}")
+        return False
+
+
+async def rebuild_platform_stats() -> dict:
+    """
+    Recalcular el documento de estadísticas desde cero.
+
+    Ejecuta dos agregaciones ($group por rol en users y $group de lecciones y
+    categorías en courses), cuenta los documentos de enrollments y reemplaza
+    el documento de platform_stats. Se usa la primera vez y desde el script
+    scripts/rebuild_platform_stats.py para corregir desviaciones.
+
+    Returns:
+        dict: Estadísticas recalculadas (mismo formato que get_platform_stats)
+    """
+    db = MongoDB.get_db()
+
+    doc = {
+        "_id": PLATFORM_STATS_ID,
+        "totalStudents": 0,
+        "totalInstructors": 0,
+        "totalAdmins": 0,
+        "totalCourses": 0,
+        "totalLessons": 0,
+        "totalEnrollments": 0,
+        "categories": [],
+        "updatedAt": datetime.now(timezone.utc),
+    }
+
+    # Usuarios por rol
+    users_pipeline = [
+        {"$group": {"_id": "$role", "count": {"$sum": 1}}},
+    ]
+    async for group in db["users"].aggregate(users_pipeline):
+        field = role_stats_field(group["_id"])
+        if field:
+            doc[field] = group["count"]
+
+    # Inscripciones
+    doc["totalEnrollments"] = await db["enrollments"].count_documents({})
+
+    # Cursos, lecciones y categorías únicas
+    courses_pipeline = [
+        {
+            "$group": {
+                "_id": None,
+                "count": {"$sum": 1},
+                "lessons": {"$sum": {"$size": {"$ifNull": ["$lessons", []]}}},
+                "categories": {"$addToSet": {"$ifNull": ["$categories", []]}},
+            }
+        },
+        {
+            "$project": {
+                "count": 1,
+                "lessons": 1,
+                "categories": {
+                    "$reduce": {
+                        "input": "$categories",
+                        "initialValue": [],
+                        "in": {"$setUnion": ["$$value", "$$this"]},
+                    }
+                },
+            }
+        },
+    ]
+    async for group in db["courses"].aggregate(courses_pipeline):
+        doc["totalCourses"] = group["count"]
+        doc["totalLessons"] = group["lessons"]
+        doc["categories"] = [c for c in group["categories"] if c]
+
+    await db[PLATFORM_STATS_COLLECTION].replace_one({"_id": PLATFORM_STATS_ID}, doc, upsert=True)
+
+    return _stats_from_doc(doc)
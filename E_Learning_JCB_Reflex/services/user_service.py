@@ -12,17 +12,59 @@ Funciones principales:
 - update_user: Actualizar datos de usuario
 - delete_user: Eliminar usuario
 - change_password: Cambiar contraseña de usuario
+- rehash_password_if_needed: Actualizar el coste de bcrypt tras un login
 - get_all_students/instructors/admins: Obtener usuarios por rol
+
+Conjuntos de campos (parámetro fields de las lecturas, ver USER_FIELD_SETS):
+- "card": Nombre y apellido (autores de reseñas, nombres en listados)
+- "summary": Datos de cuenta para listados de administración
+- "profile": Perfil público de instructor (incluye coursesCreated)
+- "full": Documento completo, incluido el hash de la contraseña
+
+Solo "full" carga el hash de la contraseña y las inscripciones embebidas;
+los listados usan conjuntos parciales por defecto.
 """
 
 from typing import List, Dict
 from bson import ObjectId
+from pymongo import UpdateOne
 from E_Learning_JCB_Reflex.models.user import User
 from E_Learning_JCB_Reflex.database import MongoDB
-from E_Learning_JCB_Reflex.utils.password import hash_password, verify_password
-
-
-async def get_user_by_id(user_id: str) -> User | None:
+from E_Learning_JCB_Reflex.services.course_service import invalidate_courses_cache
+from E_Learning_JCB_Reflex.services.stats_service import role_stats_field, update_platform_stats
+from E_Learning_JCB_Reflex.utils.password import (
+    PasswordHashingBusy,
+    hash_password_async,
+    needs_rehash,
+    verify_password_async,
+)
+
+
+# Proyección de cada conjunto de campos; None carga el documento completo
+USER_FIELD_SETS = {
+    "card": {"firstName": 1, "lastName": 1},
+    "summary": {"firstName": 1, "lastName": 1, "email": 1, "role": 1, "createdAt": 1},
+    "profile": {
+        "firstName": 1,
+        "lastName": 1,
+        "email": 1,
+        "role": 1,
+        "createdAt": 1,
+        "instructorProfile": 1,
+        "coursesCreated": 1,
+    },
+    "full": None,
+}
+
+
+def _user_projection(fields: str) -> dict | None:
+    """Proyección del conjunto de campos `fields` (ValueError si no existe)."""
+    if fields not in USER_FIELD_SETS:
+        raise ValueError(f"Unknown user field set: {fields}")
+    return USER_FIELD_SETS[fields]
+
+
+async def get_user_by_id(user_id: str, fields: str = "full") -> User | None:
     """
     Obtener un usuario por su ID.
 
@@ -30,6 +72,7 @@ async def get_user_by_id(user_id: str) -> User | None:
 
     Args:
         user_id: ID del usuario (string del ObjectId de MongoDB)
+        fields: Conjunto de campos (ver USER_FIELD_SETS). Por defecto "full"
 
     Returns:
         User | None: Objeto User si se encuentra, None si no existe o hay error
@@ -40,14 +83,14 @@ async def get_user_by_id(user_id: str) -> User | None:
         ...     print(user.get_full_name())
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
-        user_data = await users_collection.find_one({"_id": ObjectId(user_id)})
+        projection = _user_projection(fields)
+        user_data = await users_collection.find_one({"_id": ObjectId(user_id)}, projection)
 
         if user_data:
-            return User.from_dict(user_data)
+            return User.from_dict(user_data, partial=projection is not None)
         return None
 
     except Exception as e:
@@ -55,7 +98,7 @@ async def get_user_by_id(user_id: str) -> User | None:
         return None
 
 
-async def get_users_by_ids(user_ids: List[str]) -> Dict[str, User]:
+async def get_users_by_ids(user_ids: List[str], fields: str = "card") -> Dict[str, User]:
     """
     Obtener múltiples usuarios por sus IDs en una sola consulta.
 
@@ -65,6 +108,8 @@ async def get_users_by_ids(user_ids: List[str]) -> Dict[str, User]:
 
     Args:
         user_ids: Lista de IDs de usuarios (strings de ObjectIds)
+        fields: Conjunto de campos (ver USER_FIELD_SETS). Por defecto "card"
+                (solo nombre y apellido)
 
     Returns:
         Dict[str, User]: Diccionario con ID como clave y objeto User como valor.
@@ -77,7 +122,6 @@ async def get_users_by_ids(user_ids: List[str]) -> Dict[str, User]:
         ...     print(f"{user_id}: {user.get_full_name()}")
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
@@ -86,13 +130,14 @@ async def get_users_by_ids(user_ids: List[str]) -> Dict[str, User]:
         object_ids = [ObjectId(uid) for uid in user_ids if uid]
 
         # Obtener todos los usuarios en una sola consulta usando $in
-        cursor = users_collection.find({"_id": {"$in": object_ids}})
+        projection = _user_projection(fields)
+        cursor = users_collection.find({"_id": {"$in": object_ids}}, projection)
         users_data = await cursor.to_list(length=None)
 
         # Crear diccionario con ID (string) como clave para fácil acceso
         users_dict = {}
         for user_data in users_data:
-            user = User.from_dict(user_data)
+            user = User.from_dict(user_data, partial=projection is not None)
             users_dict[user.id] = user
 
         return users_dict
@@ -109,40 +154,40 @@ async def get_user_name(user_id: str) -> str:
     Helper function que retorna el nombre completo directamente.
     Si no encuentra el usuario, retorna "Usuario Desconocido".
     """
-    user = await get_user_by_id(user_id)
+    user = await get_user_by_id(user_id, fields="card")
     if user:
         return user.get_full_name()
     return "Usuario Desconocido"
 
 
-async def get_all_students() -> List[User]:
-    """Obtener todos los usuarios con role='student'."""
+async def get_all_students(fields: str = "summary") -> List[User]:
+    """Obtener todos los usuarios con role='student' (conjunto de campos "summary" por defecto)."""
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
-        cursor = users_collection.find({"role": "student"})
+        projection = _user_projection(fields)
+        cursor = users_collection.find({"role": "student"}, projection)
         users_data = await cursor.to_list(length=None)
 
-        return [User.from_dict(user_data) for user_data in users_data]
+        return [User.from_dict(user_data, partial=projection is not None) for user_data in users_data]
 
     except Exception as e:
         print(f"Error fetching students: {e}")
         return []
 
 
-async def get_all_instructors() -> List[User]:
-    """Obtener todos los usuarios con role='instructor'."""
+async def get_all_instructors(fields: str = "profile") -> List[User]:
+    """Obtener todos los usuarios con role='instructor' (conjunto de campos "profile" por defecto)."""
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
-        cursor = users_collection.find({"role": "instructor"})
+        projection = _user_projection(fields)
+        cursor = users_collection.find({"role": "instructor"}, projection)
         users_data = await cursor.to_list(length=None)
 
-        return [User.from_dict(user_data) for user_data in users_data]
+        return [User.from_dict(user_data, partial=projection is not None) for user_data in users_data]
 
     except Exception as e:
         print(f"Error fetching instructors: {e}")
@@ -152,7 +197,6 @@ async def get_all_instructors() -> List[User]:
 async def get_user_by_email(email: str) -> User | None:
     """Obtener un usuario por email."""
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
@@ -167,17 +211,17 @@ async def get_user_by_email(email: str) -> User | None:
         return None
 
 
-async def get_all_admins() -> List[User]:
-    """Obtener todos los usuarios con role='admin'."""
+async def get_all_admins(fields: str = "summary") -> List[User]:
+    """Obtener todos los usuarios con role='admin' (conjunto de campos "summary" por defecto)."""
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
-        cursor = users_collection.find({"role": "admin"})
+        projection = _user_projection(fields)
+        cursor = users_collection.find({"role": "admin"}, projection)
         users_data = await cursor.to_list(length=None)
 
-        return [User.from_dict(user_data) for user_data in users_data]
+        return [User.from_dict(user_data, partial=projection is not None) for user_data in users_data]
 
     except Exception as e:
         print(f"Error fetching admins: {e}")
@@ -208,6 +252,10 @@ async def create_user(
     Returns:
         bool: True si el usuario se creó exitosamente, False si hubo error
 
+    Raises:
+        PasswordHashingBusy: Si el pool de bcrypt está saturado (no se crea el
+            usuario; el llamador debe pedir que se reintente)
+
     Ejemplo:
         >>> success = await create_user(
         ...     first_name="Juan",
@@ -224,13 +272,12 @@ async def create_user(
         hacerse antes de llamar a esta función.
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
 
         # Hashear la contraseña con bcrypt para seguridad
-        hashed_password = hash_password(password)
+        hashed_password = await hash_password_async(password)
 
         # Crear el objeto de usuario con password hasheado
         user = User(
@@ -251,8 +298,15 @@ async def create_user(
         # Insertar en la base de datos
         result = await users_collection.insert_one(user_dict)
 
+        # Actualizar el contador de usuarios del rol en platform_stats
+        if result.acknowledged and role_stats_field(role):
+            await update_platform_stats(inc={role_stats_field(role): 1})
+
         return result.acknowledged
 
+    except PasswordHashingBusy:
+        raise
+
     except Exception as e:
         print(f"Error creating user: {e}")
         return False
@@ -283,19 +337,32 @@ async def update_user(user_id: str, update_data: dict) -> bool:
         - NO actualiza la contraseña. Usar change_password() para eso.
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
 
-        result = await users_collection.update_one(
+        # Recuperar el rol anterior para mantener los contadores de platform_stats
+        previous = await users_collection.find_one_and_update(
             {"_id": ObjectId(user_id)},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection={"role": 1},
         )
 
-        # Retornar True si se encontró el usuario (matched_count > 0)
-        # No importa si se modificó o no (modified_count puede ser 0 si los valores son iguales)
-        return result.matched_count > 0
+        if previous is None:
+            return False
+
+        new_role = update_data.get("role")
+        old_role = previous.get("role")
+        if new_role and new_role != old_role:
+            inc = {}
+            if role_stats_field(old_role):
+                inc[role_stats_field(old_role)] = -1
+            if role_stats_field(new_role):
+                inc[role_stats_field(new_role)] = 1
+            await update_platform_stats(inc=inc)
+
+        # Retornar True si se encontró el usuario, aunque los valores fueran iguales
+        return True
 
     except Exception as e:
         print(f"Error updating user: {e}")
@@ -320,6 +387,11 @@ async def change_password(user_id: str, current_password: str, new_password: str
               - La contraseña actual es incorrecta
               - Ocurrió un error
 
+    Raises:
+        PasswordHashingBusy: Si el pool de bcrypt está saturado; el llamador
+            debe pedir que se reintente en lugar de informar de una
+            contraseña incorrecta
+
     Ejemplo:
         >>> success = await change_password(
         ...     user_id="507f1f77bcf86cd799439011",
@@ -332,7 +404,6 @@ async def change_password(user_id: str, current_password: str, new_password: str
         ...     print("Contraseña actual incorrecta")
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
@@ -344,11 +415,11 @@ async def change_password(user_id: str, current_password: str, new_password: str
             return False
 
         # Verificar la contraseña actual con bcrypt
-        if not verify_password(current_password, user_data.get("password", "")):
+        if not await verify_password_async(current_password, user_data.get("password", "")):
             return False
 
         # Hashear la nueva contraseña con bcrypt
-        hashed_new_password = hash_password(new_password)
+        hashed_new_password = await hash_password_async(new_password)
 
         # Actualizar la contraseña en la base de datos
         result = await users_collection.update_one(
@@ -358,6 +429,9 @@ async def change_password(user_id: str, current_password: str, new_password: str
 
         return result.modified_count > 0
 
+    except PasswordHashingBusy:
+        raise
+
     except Exception as e:
         print(f"Error changing password: {e}")
         return False
@@ -378,6 +452,9 @@ async def admin_change_password(user_id: str, new_password: str) -> bool:
     Returns:
         bool: True si se encontró y actualizó el usuario, False si no existe o hay error
 
+    Raises:
+        PasswordHashingBusy: Si el pool de bcrypt está saturado (reintentar más tarde)
+
     Ejemplo:
         >>> # Solo llamar si el usuario autenticado es admin
         >>> if current_user.is_admin:
@@ -388,13 +465,12 @@ async def admin_change_password(user_id: str, new_password: str) -> bool:
         hacerse en la capa de estado/controlador antes de llamar a esta función.
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
 
         # Hashear la nueva contraseña con bcrypt
-        hashed_new_password = hash_password(new_password)
+        hashed_new_password = await hash_password_async(new_password)
 
         # Actualizar la contraseña sin verificar la actual
         result = await users_collection.update_one(
@@ -404,11 +480,53 @@ async def admin_change_password(user_id: str, new_password: str) -> bool:
 
         return result.matched_count > 0
 
+    except PasswordHashingBusy:
+        raise
+
     except Exception as e:
         print(f"Error changing password (admin): {e}")
         return False
 
 
+async def rehash_password_if_needed(user_id: str, plain_password: str, hashed_password: str) -> bool:
+    """
+    Volver a hashear la contraseña si su coste de bcrypt no es el configurado.
+
+    Se llama tras un login correcto, único momento en que se conoce la
+    contraseña en texto plano. Así un cambio de PASSWORD_BCRYPT_ROUNDS se
+    aplica a cada usuario en su siguiente login.
+
+    Args:
+        user_id: ID del usuario
+        plain_password: Contraseña ya verificada
+        hashed_password: Hash almacenado con el que se verificó
+
+    Returns:
+        bool: True si se guardó un hash nuevo, False si no hacía falta o hubo error
+
+    Nota:
+        El update filtra también por el hash anterior para no pisar un
+        cambio de contraseña que haya ocurrido mientras tanto.
+    """
+    if not needs_rehash(hashed_password):
+        return False
+
+    try:
+        db = MongoDB.get_db()
+
+        new_hash = await hash_password_async(plain_password)
+        result = await db["users"].update_one(
+            {"_id": ObjectId(user_id), "password": hashed_password},
+            {"$set": {"password": new_hash}}
+        )
+
+        return result.modified_count > 0
+
+    except Exception as e:
+        print(f"Error rehashing password: {e}")
+        return False
+
+
 async def delete_user(user_id: str) -> bool:
     """
     Eliminar un usuario del sistema permanentemente.
@@ -429,19 +547,49 @@ async def delete_user(user_id: str) -> bool:
 
     Advertencia:
         - Esta operación es IRREVERSIBLE
-        - NO elimina automáticamente las referencias del usuario en otras colecciones
-          (como inscripciones a cursos). Eso debe manejarse manualmente si es necesario.
+        - Elimina las inscripciones del usuario (colección enrollments) y
+          decrementa el contador studentsEnrolled de sus cursos
+        - NO elimina las reseñas ni los cursos creados por el usuario
         - Verificar permisos de admin antes de llamar a esta función
     """
     try:
-        await MongoDB.connect()
         db = MongoDB.get_db()
 
         users_collection = db["users"]
 
-        result = await users_collection.delete_one({"_id": ObjectId(user_id)})
+        # Recuperar el rol del usuario borrado para las estadísticas
+        user_oid = ObjectId(user_id)
+        deleted = await users_collection.find_one_and_delete(
+            {"_id": user_oid},
+            projection={"role": 1},
+        )
+        if deleted is None:
+            return False
 
-        return result.deleted_count > 0
+        inc = {}
+        if role_stats_field(deleted.get("role")):
+            inc[role_stats_field(deleted.get("role"))] = -1
+
+        # Eliminar sus inscripciones y descontarlas de cada curso
+        course_oids = [
+            enrollment["courseId"]
+            async for enrollment in db["enrollments"].find({"userId": user_oid}, {"courseId": 1})
+        ]
+        if course_oids:
+            await db["enrollments"].delete_many({"userId": user_oid})
+            await db["courses"].bulk_write(
+                [
+                    UpdateOne({"_id": course_oid, "studentsEnrolled": {"$gt": 0}}, {"$inc": {"studentsEnrolled": -1}})
+                    for course_oid in course_oids
+                ],
+                ordered=False,
+            )
+            # Una sola invalidación para todos sus cursos (el orden de populares puede cambiar)
+            await invalidate_courses_cache(course_oids)
+            inc["totalEnrollments"] = -len(course_oids)
+        await update_platform_stats(inc=inc)
+
+        return True
 
     except Exception as e:
         print(f"Error deleting user: {e}")
@@ -464,24 +612,24 @@ class UserService:
     """
 
     @staticmethod
-    async def get_user_by_id(user_id: str) -> User | None:
-        return await get_user_by_id(user_id)
+    async def get_user_by_id(user_id: str, fields: str = "full") -> User | None:
+        return await get_user_by_id(user_id, fields)
 
     @staticmethod
-    async def get_users_by_ids(user_ids: List[str]) -> Dict[str, User]:
-        return await get_users_by_ids(user_ids)
+    async def get_users_by_ids(user_ids: List[str], fields: str = "card") -> Dict[str, User]:
+        return await get_users_by_ids(user_ids, fields)
 
     @staticmethod
     async def get_user_name(user_id: str) -> str:
         return await get_user_name(user_id)
 
     @staticmethod
-    async def get_all_students() -> List[User]:
-        return await get_all_students()
+    async def get_all_students(fields: str = "summary") -> List[User]:
+        return await get_all_students(fields)
 
     @staticmethod
-    async def get_all_instructors() -> List[User]:
-        return await get_all_instructors()
+    async def get_all_instructors(fields: str = "profile") -> List[User]:
+        return await get_all_instructors(fields)
 
     @staticmethod
     async def get_user_by_email(email: str) -> User | None:
@@ -500,8 +648,8 @@ class UserService:
         return await change_password(user_id, current_password, new_password)
 
     @staticmethod
-    async def get_all_admins() -> List[User]:
-        return await get_all_admins()
+    async def get_all_admins(fields: str = "summary") -> List[User]:
+        return await get_all_admins(fields)
 
     @staticmethod
     async def admin_change_password(user_id: str, new_password: str) -> bool:
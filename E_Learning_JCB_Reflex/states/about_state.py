@@ -1,11 +1,12 @@
 """
 Estado para la página Sobre Nosotros.
 
-Carga estadísticas reales de la plataforma desde MongoDB.
+Carga estadísticas reales de la plataforma desde el documento materializado
+platform_stats de MongoDB.
 """
 
 import reflex as rx
-from E_Learning_JCB_Reflex.database.mongodb import MongoDB
+from E_Learning_JCB_Reflex.services.stats_service import get_platform_stats
 
 
 class AboutState(rx.State):
@@ -22,27 +23,15 @@ class AboutState(rx.State):
     async def load_stats(self):
         self.loading = True
         try:
-            await MongoDB.connect()
-            db = MongoDB.get_db()
-
-            # Cursos
-            courses = await db["courses"].find({}).to_list(length=None)
-            self.total_courses = len(courses)
-            self.total_lessons = sum(len(c.get("lessons", [])) for c in courses)
-            self.total_enrollments = sum(len(c.get("students", [])) for c in courses)
-
-            # Categorías únicas
-            cats = set()
-            for c in courses:
-                for cat in c.get("categories", []):
-                    if cat:
-                        cats.add(cat)
-            self.categories = sorted(cats)
-
-            # Usuarios
-            users = await db["users"].find({}, {"role": 1}).to_list(length=None)
-            self.total_instructors = sum(1 for u in users if u.get("role") == "instructor")
-            self.total_students = sum(1 for u in users if u.get("role") == "student")
+            # Un único documento mantenido de forma incremental por los servicios
+            stats = await get_platform_stats()
+
+            self.total_courses = stats["total_courses"]
+            self.total_lessons = stats["total_lessons"]
+            self.total_enrollments = stats["total_enrollments"]
+            self.categories = stats["categories"]
+            self.total_instructors = stats["total_instructors"]
+            self.total_students = stats["total_students"]
 
         except Exception as e:
             print(f"[AboutState] Error cargando stats: {e}")
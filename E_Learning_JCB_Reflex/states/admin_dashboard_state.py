@@ -14,9 +14,7 @@ Funcionalidades principales:
 
 import reflex as rx
 from E_Learning_JCB_Reflex.states.auth_state import AuthState
-from E_Learning_JCB_Reflex.services.user_service import user_service
-from E_Learning_JCB_Reflex.services.course_service import get_all_courses
-from E_Learning_JCB_Reflex.services.enrollment_service import count_total_enrollments
+from E_Learning_JCB_Reflex.services.stats_service import get_platform_stats
 
 
 class AdminDashboardState(AuthState):
@@ -62,7 +60,9 @@ class AdminDashboardState(AuthState):
         """
         Cargar todas las estadísticas del dashboard administrativo.
 
-        Realiza múltiples consultas a la base de datos para obtener:
+        Lee el documento materializado de la colección platform_stats
+        (get_platform_stats), que los servicios de escritura mantienen de
+        forma incremental; no recorre las colecciones en cada carga:
         1. Conteo de usuarios por rol (estudiantes, instructores, admins)
         2. Total de cursos disponibles en la plataforma
         3. Total de inscripciones activas de estudiantes
@@ -88,22 +88,14 @@ class AdminDashboardState(AuthState):
         self.loading = True
 
         try:
-            # Cargar usuarios por rol
-            students = await user_service.get_all_students()
-            instructors = await user_service.get_all_instructors()
-            admins = await user_service.get_all_admins()
-
-            self.total_students = len(students)
-            self.total_instructors = len(instructors)
-            self.total_admins = len(admins)
-            self.total_users = self.total_students + self.total_instructors + self.total_admins
-
-            # Cargar cursos
-            courses = await get_all_courses()
-            self.total_courses = len(courses)
-
-            # Cargar inscripciones
-            self.total_enrollments = await count_total_enrollments()
+            stats = await get_platform_stats()
+
+            self.total_students = stats["total_students"]
+            self.total_instructors = stats["total_instructors"]
+            self.total_admins = stats["total_admins"]
+            self.total_users = stats["total_users"]
+            self.total_courses = stats["total_courses"]
+            self.total_enrollments = stats["total_enrollments"]
 
         except Exception as e:
             print(f"Error loading admin statistics: {e}")
@@ -7,6 +7,7 @@ gestión del usuario actual.
 
 Características:
 - Autenticación con email y contraseña
+- Limitación de intentos de login por email y por IP
 - Registro de nuevos usuarios con validación
 - Manejo de sesión de usuario
 - Propiedades computadas para verificar roles
@@ -14,9 +15,15 @@ Características:
 - Manejo de errores y mensajes de éxito
 """
 
+import math
+
 import reflex as rx
 from E_Learning_JCB_Reflex.services import user_service
-from E_Learning_JCB_Reflex.utils.password import verify_password
+from E_Learning_JCB_Reflex.utils.password import PasswordHashingBusy, verify_password_async
+from E_Learning_JCB_Reflex.utils.rate_limit import check_login_attempt
+
+# Mensaje cuando el pool de bcrypt está saturado (login y registro)
+PASSWORD_HASHING_BUSY_MESSAGE = "El servidor está ocupado. Por favor, inténtalo de nuevo en unos segundos."
 
 
 class AuthState(rx.State):
@@ -159,9 +166,12 @@ class AuthState(rx.State):
         Este método realiza las siguientes operaciones:
         1. Valida que se hayan ingresado email y contraseña
         2. Valida el formato del email
-        3. Busca el usuario en la base de datos por email
-        4. Verifica la contraseña usando bcrypt
-        5. Si es exitoso, establece la sesión y redirige al dashboard correspondiente
+        3. Comprueba el límite de intentos por email y por IP (antes de tocar
+           la base de datos o bcrypt)
+        4. Busca el usuario en la base de datos por email
+        5. Verifica la contraseña usando bcrypt (en el pool de bcrypt, sin bloquear el event loop)
+        6. Si es exitoso, actualiza el hash si su coste no es el configurado,
+           establece la sesión y redirige al dashboard correspondiente
 
         El método maneja los estados de loading, error y success automáticamente
         para que la UI pueda mostrar retroalimentación al usuario.
@@ -181,8 +191,10 @@ class AuthState(rx.State):
         Manejo de errores:
             - Email o contraseña vacíos
             - Email con formato inválido
+            - Demasiados intentos (limitación por email o IP)
             - Usuario no encontrado
             - Contraseña incorrecta
+            - Pool de bcrypt saturado (PasswordHashingBusy)
             - Errores de base de datos
         """
         # Validación de campos obligatorios
@@ -195,6 +207,15 @@ class AuthState(rx.State):
             self.error = "Por favor, introduce un email válido"
             return
 
+        # Limitar intentos antes de consultar la base de datos y ejecutar bcrypt
+        retry_after = await check_login_attempt(self.login_email, self.router.session.client_ip)
+        if retry_after:
+            self.error = (
+                "Demasiados intentos de inicio de sesión. "
+                f"Inténtalo de nuevo en {math.ceil(retry_after)} segundos."
+            )
+            return
+
         # Resetear estados de UI para nueva operación
         self.loading = True
         self.error = ""
@@ -211,11 +232,14 @@ class AuthState(rx.State):
                 return
 
             # Verificar password con bcrypt (compara hash almacenado)
-            if not verify_password(self.login_password, user.password):
+            if not await verify_password_async(self.login_password, user.password):
                 self.error = "Email o contraseña incorrectos"
                 self.loading = False
                 return
 
+            # Actualizar el coste del hash si PASSWORD_BCRYPT_ROUNDS ha cambiado
+            await user_service.rehash_password_if_needed(user.id, self.login_password, user.password)
+
             # Login exitoso: establecer sesión
             self.is_authenticated = True
             self.current_user = user.to_dict()  # Convertir a dict para serialización
@@ -233,6 +257,9 @@ class AuthState(rx.State):
             else:  # student (rol por defecto)
                 yield rx.redirect("/student/dashboard")
 
+        except PasswordHashingBusy:
+            self.error = PASSWORD_HASHING_BUSY_MESSAGE
+
         except Exception as e:
             # Capturar cualquier error inesperado
             print(f"Error during login: {e}")
@@ -298,6 +325,9 @@ class AuthState(rx.State):
             else:
                 self.error = "Error al crear la cuenta. Por favor, inténtalo de nuevo."
 
+        except PasswordHashingBusy:
+            self.error = PASSWORD_HASHING_BUSY_MESSAGE
+
         except Exception as e:
             print(f"Error during registration: {e}")
             self.error = "Error al registrar usuario. Por favor, inténtalo de nuevo."
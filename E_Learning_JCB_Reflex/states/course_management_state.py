@@ -9,14 +9,15 @@ Funcionalidades principales:
 - Crear nuevos cursos con información del instructor
 - Editar cursos existentes
 - Eliminar cursos del sistema (operación irreversible)
-- Buscar y filtrar cursos por título, descripción o nivel
+- Buscar y filtrar cursos en el servidor (índice de texto de MongoDB) por texto y nivel
 - Validar campos del formulario de cursos
 """
 
 import reflex as rx
 from E_Learning_JCB_Reflex.states.auth_state import AuthState
 from E_Learning_JCB_Reflex.services.course_service import (
-    get_all_courses,
+    search_courses,
+    count_courses,
     create_course,
     update_course,
     delete_course,
@@ -32,11 +33,14 @@ class CourseManagementState(AuthState):
 
     Atributos de estado:
         # Listas de cursos
-        courses (list[dict]): Todos los cursos del sistema
-        filtered_courses (list[dict]): Cursos filtrados por búsqueda/nivel
+        total_courses (int): Número total de cursos del sistema
+        filtered_courses (list[dict]): Páginas cargadas de cursos filtrados por búsqueda/nivel
+        filtered_total (int): Total de cursos que cumplen la búsqueda/nivel (no solo los cargados)
+        search_page (int): Última página de resultados cargada
+        has_more_results (bool): Indica si quedan más resultados por cargar
 
         # Búsqueda y filtros
-        search_query (str): Texto de búsqueda (título, descripción, categoría)
+        search_query (str): Texto de búsqueda (título, descripción, instructor, categoría)
         level_filter (str): Filtro por nivel ("all", "beginner", "intermediate", "advanced")
 
         # Formulario de curso
@@ -64,8 +68,11 @@ class CourseManagementState(AuthState):
     """
 
     # Lista de cursos
-    courses: list[dict] = []
+    total_courses: int = 0
     filtered_courses: list[dict] = []
+    filtered_total: int = 0
+    search_page: int = 1
+    has_more_results: bool = False
 
     # Búsqueda y filtros
     search_query: str = ""
@@ -133,66 +140,64 @@ class CourseManagementState(AuthState):
         self.course_instructor_email = value
 
     async def load_courses(self):
-        """Cargar todos los cursos del sistema."""
+        """Cargar el total de cursos y la primera página de resultados filtrados."""
         if not self.is_authenticated or self.current_user.get("role") != "admin":
             return rx.toast.error("No tienes permisos para acceder a esta página")
 
         self.loading = True
         try:
-            courses = await get_all_courses()
-
-            all_courses = []
-            for course in courses:
-                all_courses.append({
-                    "_id": course.id,
-                    "title": course.title,
-                    "description": course.description,
-                    "price": course.price,
-                    "level": course.level,
-                    "category": course.category,
-                    "image": course.thumbnail,
-                    "instructorName": course.instructor.name,
-                    "instructorEmail": course.instructor.email,
-                    "studentsEnrolled": len(course.students) if course.students else 0,
-                })
-
-            self.courses = all_courses
-            self.apply_filters()
+            self.total_courses = await count_courses()
+            await self.apply_filters()
         except Exception as e:
             print(f"Error loading courses: {e}")
             return rx.toast.error(f"Error al cargar cursos: {str(e)}")
         finally:
             self.loading = False
 
-    def apply_filters(self):
-        """Aplicar filtros de búsqueda y nivel."""
-        filtered = self.courses
-
-        # Filtro de búsqueda
-        if self.search_query:
-            query = self.search_query.lower()
-            filtered = [
-                c for c in filtered
-                if query in c["title"].lower()
-                or query in c["description"].lower()
-                or query in c["category"].lower()
-            ]
+    async def _search_page(self, page: int) -> list[dict]:
+        """Consultar una página de search_courses y convertirla a filas de la tabla."""
+        courses, self.has_more_results, self.filtered_total = await search_courses(
+            self.search_query,
+            level=self.level_filter,
+            page=page,
+            fields="summary",
+        )
+        self.search_page = page
+        return [
+            {
+                "_id": course.id,
+                "title": course.title,
+                "description": course.description,
+                "price": course.price,
+                "level": course.level,
+                "category": course.category,
+                "image": course.thumbnail,
+                "instructorName": course.instructor.name,
+                "instructorEmail": course.instructor.email,
+                "studentsEnrolled": course.students_enrolled,
+            }
+            for course in courses
+        ]
 
-        # Filtro de nivel
-        if self.level_filter != "all":
-            filtered = [c for c in filtered if c["level"] == self.level_filter]
+    async def apply_filters(self):
+        """Aplicar filtros de búsqueda y nivel consultando la primera página en MongoDB."""
+        self.filtered_courses = await self._search_page(1)
 
-        self.filtered_courses = filtered
+    async def load_more_results(self):
+        """Añadir la siguiente página de resultados a la tabla."""
+        if not self.has_more_results:
+            return
+        self.filtered_courses = self.filtered_courses + await self._search_page(self.search_page + 1)
 
-    def on_search_change(self, value: str):
-        """Manejar cambio en búsqueda."""
+    async def on_search_change(self, value: str):
+        """Manejar cambio en búsqueda (el input aplica debounce)."""
         self.search_query = value
-        self.apply_filters()
+        await self.apply_filters()
 
-    def on_level_filter_change(self, value: str):
+    async def on_level_filter_change(self, value: str):
         """Manejar cambio en filtro de nivel."""
         self.level_filter = value
-        self.apply_filters()
+        await self.apply_filters()
 
     def open_create_course_dialog(self):
         """Abrir diálogo para crear curso."""
@@ -300,6 +305,11 @@ class CourseManagementState(AuthState):
                 success = await create_course(course_data)
                 message = "Curso creado exitosamente" if success else "Error al crear curso"
             else:
+                # Actualizar solo nombre y email: reemplazar el subdocumento borraría
+                # instructor.userId, con el que get_courses_by_instructor busca sus cursos
+                instructor = course_data.pop("instructor")
+                course_data["instructor.name"] = instructor["name"]
+                course_data["instructor.email"] = instructor["email"]
                 success = await update_course(self.selected_course_id, course_data)
                 message = "Curso actualizado exitosamente" if success else "Error al actualizar curso"
 
@@ -7,21 +7,38 @@ y la visualización de información del instructor y reseñas.
 
 Funcionalidades principales:
 - Cargar cursos populares para mostrar en homepage
-- Cargar catálogo completo de cursos
-- Cargar detalles de un curso específico con lecciones y reseñas
+- Cargar el catálogo de cursos por páginas ("cargar más")
+- Buscar cursos en el servidor con el índice de texto de MongoDB
+- Cargar detalles de un curso específico con lecciones y la primera página de reseñas
+- Cargar más reseñas bajo demanda ("ver más")
 - Extraer IDs de cursos desde URLs dinámicas
 """
 
 import reflex as rx
 from E_Learning_JCB_Reflex.services.course_service import (
     get_popular_courses,
-    get_all_courses,
+    get_course_catalog_page,
+    search_courses,
     get_course_by_id,
 )
+from E_Learning_JCB_Reflex.services.review_service import get_course_reviews
 from E_Learning_JCB_Reflex.services.user_service import get_users_by_ids
 from E_Learning_JCB_Reflex.utils.route_helpers import get_dynamic_id
 
 
+def _course_card_dict(course) -> dict:
+    """Convertir un Course a los campos que usa course_card."""
+    return {
+        "id": course.id,
+        "title": course.title,
+        "description": course.description,
+        "instructor_name": course.instructor_name,
+        "price": course.price,
+        "level": course.level,
+        "thumbnail": course.thumbnail,
+    }
+
+
 class CourseState(rx.State):
     """
     Estado para gestión de cursos en Reflex.
@@ -33,7 +50,13 @@ class CourseState(rx.State):
 
     Atributos de estado:
         courses (list[dict]): Lista de cursos (para catálogo y homepage)
+        search_query (str): Texto de búsqueda del catálogo
+        next_cursor (str): Cursor de la siguiente página del catálogo ("" si no hay más)
+        search_page (int): Página actual de resultados de búsqueda
+        search_has_more (bool): Indica si hay más resultados de búsqueda
+        search_total (int): Total de cursos que coinciden con la búsqueda (no solo los cargados)
         loading (bool): Indicador de carga en progreso
+        loading_more (bool): Indicador de carga de la página siguiente del catálogo
         error (str): Mensaje de error si la operación falla
 
         # Información del curso seleccionado
@@ -52,37 +75,58 @@ class CourseState(rx.State):
 
         # Estadísticas del curso
         students_count (int): Número de estudiantes inscritos
-        average_rating (int): Calificación promedio (1-5)
+        average_rating (float): Calificación promedio (1-5)
         total_reviews (int): Número total de reseñas
 
         # Listas anidadas
         categories (list[str]): Categorías del curso
-        lessons (list[dict]): Lecciones del curso con título, contenido, orden y duración
-        reviews (list[dict]): Reseñas con estudiante, calificación y comentario
+        lessons (list[dict]): Índice de lecciones del curso con título, orden y duración
+        reviews (list[dict]): Reseñas cargadas con estudiante, calificación y comentario
+        reviews_cursor (str): Cursor de la siguiente página de reseñas ("" si no hay más)
+        loading_reviews (bool): Indicador de carga de más reseñas
     """
 
     courses: list[dict] = []
     search_query: str = ""
+    next_cursor: str = ""
+    search_page: int = 1
+    search_has_more: bool = False
+    search_total: int = 0
     loading: bool = False
+    loading_more: bool = False
     error: str = ""
 
     @rx.var
-    def filtered_courses(self) -> list[dict]:
-        """Cursos filtrados según el texto de búsqueda."""
-        if not self.search_query:
-            return self.courses
-        query = self.search_query.lower()
-        return [
-            c for c in self.courses
-            if query in c.get("title", "").lower()
-            or query in c.get("description", "").lower()
-            or query in c.get("instructor_name", "").lower()
-            or query in c.get("level", "").lower()
-        ]
+    def has_more_courses(self) -> bool:
+        """Indica si quedan páginas del catálogo o de la búsqueda por cargar."""
+        if self.search_query.strip():
+            return self.search_has_more
+        return self.next_cursor != ""
 
-    def set_search_query(self, value: str):
-        """Actualizar el texto de búsqueda."""
+    async def set_search_query(self, value: str):
+        """
+        Actualizar el texto de búsqueda y consultar la primera página de resultados.
+
+        La búsqueda se ejecuta en MongoDB (search_courses) y el input de la página
+        aplica debounce, así que no se lanza una consulta por cada tecla. Con el
+        texto vacío se vuelve al catálogo paginado.
+        """
         self.search_query = value
+        if not value.strip():
+            await self.load_courses()
+            return
+
+        self.loading = True
+        self.error = ""
+        try:
+            results, self.search_has_more, self.search_total = await search_courses(value)
+            self.search_page = 1
+            self.courses = [_course_card_dict(course) for course in results]
+        except Exception as e:
+            self.error = f"Error searching courses: {str(e)}"
+            print(f"Error in set_search_query: {e}")
+        finally:
+            self.loading = False
 
     # Información básica del curso seleccionado
     current_course_id: str = ""
@@ -101,13 +145,20 @@ class CourseState(rx.State):
 
     # Estadísticas
     students_count: int = 0
-    average_rating: int = 0
+    average_rating: float = 0
     total_reviews: int = 0
 
     # Listas
     categories: list[str] = []
     lessons: list[dict] = []
     reviews: list[dict] = []
+    reviews_cursor: str = ""
+    loading_reviews: bool = False
+
+    @rx.var
+    def has_more_reviews(self) -> bool:
+        """Indica si quedan reseñas del curso por cargar."""
+        return self.reviews_cursor != ""
 
     async def load_popular_courses(self):
         """
@@ -131,18 +182,7 @@ class CourseState(rx.State):
         try:
             some_courses = await get_popular_courses()
             # Convertir objetos Course a diccionarios para el estado de Reflex
-            self.courses = [
-                {
-                    "id": course.id,
-                    "title": course.title,
-                    "description": course.description,
-                    "instructor_name": course.instructor_name,
-                    "price": course.price,
-                    "level": course.level,
-                    "thumbnail": course.thumbnail,
-                }
-                for course in some_courses
-            ]
+            self.courses = [_course_card_dict(course) for course in some_courses]
             if not self.courses:
                 self.error = "No courses found in database"
         except Exception as e:
@@ -153,37 +193,28 @@ class CourseState(rx.State):
             
     async def load_courses(self):
         """
-        Cargar el catálogo completo de cursos desde la base de datos.
+        Cargar la primera página del catálogo de cursos.
 
-        A diferencia de load_popular_courses, esta función carga TODOS los
-        cursos disponibles sin límite. Se utiliza para mostrar el catálogo
-        completo en la página de cursos.
+        Reinicia la lista y la búsqueda y obtiene la primera página con
+        get_course_catalog_page, que solo trae los campos de la tarjeta.
+        Las páginas siguientes se cargan con load_more_courses.
 
         Actualiza el estado:
-            - courses: Lista completa de diccionarios con información de todos los cursos
+            - courses: Cursos de la primera página
+            - next_cursor: Cursor para pedir la página siguiente
             - loading: True durante la carga, False al terminar
             - error: Mensaje de error si la operación falla
-
-        Nota:
-            Para catálogos muy grandes, considerar implementar paginación.
         """
         self.loading = True
         self.error = ""
+        self.search_query = ""
         try:
-            all_courses = await get_all_courses()
-            # Convertir objetos Course a diccionarios para el estado de Reflex
-            self.courses = [
-                {
-                    "id": course.id,
-                    "title": course.title,
-                    "description": course.description,
-                    "instructor_name": course.instructor_name,
-                    "price": course.price,
-                    "level": course.level,
-                    "thumbnail": course.thumbnail,
-                }
-                for course in all_courses
-            ]
+            result = await get_course_catalog_page()
+            if result is None:
+                self.error = "Error loading courses"
+                return
+            page, self.next_cursor = result
+            self.courses = [_course_card_dict(course) for course in page]
             if not self.courses:
                 self.error = "No courses found in database"
         except Exception as e:
@@ -192,6 +223,38 @@ class CourseState(rx.State):
         finally:
             self.loading = False
 
+    async def load_more_courses(self):
+        """
+        Cargar la siguiente página del catálogo (o de la búsqueda activa) y añadirla a la lista.
+
+        No hace nada si no quedan páginas o si ya hay una carga en curso
+        (evita pedir la misma página dos veces con clics rápidos).
+        """
+        if not self.has_more_courses or self.loading_more:
+            return
+
+        self.loading_more = True
+        self.error = ""
+        try:
+            if self.search_query.strip():
+                page, self.search_has_more, self.search_total = await search_courses(
+                    self.search_query, page=self.search_page + 1
+                )
+                self.search_page += 1
+            else:
+                result = await get_course_catalog_page(after=self.next_cursor)
+                if result is None:
+                    # Conservar next_cursor para que "cargar más" pueda reintentar
+                    self.error = "Error loading courses"
+                    return
+                page, self.next_cursor = result
+            self.courses = self.courses + [_course_card_dict(course) for course in page]
+        except Exception as e:
+            self.error = f"Error loading courses: {str(e)}"
+            print(f"Error in load_more_courses: {e}")
+        finally:
+            self.loading_more = False
+
     async def load_course_by_id(self, course_id: str):
         """
         Cargar todos los detalles de un curso específico por ID.
@@ -200,7 +263,7 @@ class CourseState(rx.State):
         - Datos básicos del curso (título, descripción, precio, nivel, etc.)
         - Información completa del instructor (nombre, email, avatar, bio)
         - Estadísticas (estudiantes inscritos, calificación promedio, total de reseñas)
-        - Lista de lecciones con contenido y duración
+        - Índice de lecciones con título y duración (el contenido se carga en el visor)
         - Reseñas de estudiantes con sus nombres
 
         Args:
@@ -214,8 +277,9 @@ class CourseState(rx.State):
             - error: Mensaje si el curso no existe
 
         Nota:
-            Las reseñas requieren una consulta adicional a la base de datos
-            para obtener los nombres de los estudiantes que las escribieron.
+            Solo se carga la primera página de reseñas (y los nombres de sus
+            autores), así que el coste no depende del número de reseñas del
+            curso. El resto se carga con load_more_reviews.
         """
         self.loading = True
         self.error = ""
@@ -238,7 +302,7 @@ class CourseState(rx.State):
                 self.instructor_bio = course.instructor.bio
 
                 # Estadísticas
-                self.students_count = len(course.students)
+                self.students_count = course.students_enrolled
                 self.average_rating = course.average_rating if course.average_rating else 0
                 self.total_reviews = course.total_reviews if course.total_reviews else 0
 
@@ -248,27 +312,16 @@ class CourseState(rx.State):
                     {
                         "id": lesson.id,
                         "title": lesson.title,
-                        "content": lesson.content,
                         "order": lesson.order,
                         "duration": lesson.duration,
                     }
                     for lesson in course.lessons
                 ]
 
-                # Obtener nombres de estudiantes para las reviews
-                student_ids = [review.student for review in course.reviews if review.student]
-                students_dict = await get_users_by_ids(student_ids) if student_ids else {}
-
-                self.reviews = [
-                    {
-                        "id": review.id,
-                        "student": students_dict[review.student].get_full_name() if review.student in students_dict else "Usuario Desconocido",
-                        "rating": review.rating,
-                        "comment": review.comment,
-                        "created_at": str(review.created_at),
-                    }
-                    for review in course.reviews
-                ]
+                # Primera página de reseñas
+                self.reviews = []
+                self.reviews_cursor = ""
+                await self._load_reviews_page()
             else:
                 self.error = "Curso no encontrado"
                 # Limpiar variables
@@ -280,6 +333,45 @@ class CourseState(rx.State):
         finally:
             self.loading = False
 
+    async def _load_reviews_page(self):
+        """
+        Cargar la siguiente página de reseñas del curso actual.
+
+        Obtiene los nombres de los autores de la página con una sola consulta
+        y añade las reseñas a la lista.
+        """
+        reviews, self.reviews_cursor = await get_course_reviews(
+            self.current_course_id, after=self.reviews_cursor
+        )
+
+        # Obtener nombres de estudiantes para las reviews de esta página
+        student_ids = [review.student for review in reviews if review.student]
+        students_dict = await get_users_by_ids(student_ids) if student_ids else {}
+
+        self.reviews = self.reviews + [
+            {
+                "id": review.id,
+                "student": students_dict[review.student].get_full_name() if review.student in students_dict else "Usuario Desconocido",
+                "rating": review.rating,
+                "comment": review.comment,
+                "created_at": str(review.created_at),
+            }
+            for review in reviews
+        ]
+
+    async def load_more_reviews(self):
+        """Cargar la siguiente página de reseñas ("ver más")."""
+        if not self.reviews_cursor or self.loading_reviews:
+            return
+
+        self.loading_reviews = True
+        try:
+            await self._load_reviews_page()
+        except Exception as e:
+            print(f"Error in load_more_reviews: {e}")
+        finally:
+            self.loading_reviews = False
+
     async def load_course_from_url(self):
         """
         Cargar curso usando el ID extraído de la URL actual.
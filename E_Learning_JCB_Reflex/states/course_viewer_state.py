@@ -7,6 +7,8 @@ estudiantes inscritos ver las lecciones del curso con videos de YouTube embebido
 Funcionalidades:
 - Cargar información del curso desde la URL
 - Gestionar la lección actualmente seleccionada
+- Cargar el contenido de cada lección solo cuando se selecciona
+- Registrar las lecciones completadas y el progreso del estudiante
 - Navegar entre lecciones (anterior/siguiente)
 - Reproducir videos de YouTube
 - Validar que el usuario esté inscrito en el curso
@@ -15,9 +17,15 @@ Hereda de AuthState para acceder a la información del usuario autenticado.
 """
 
 import reflex as rx
+from bson import ObjectId
 from E_Learning_JCB_Reflex.states.auth_state import AuthState
 from E_Learning_JCB_Reflex.services.course_service import get_course_by_id
-from E_Learning_JCB_Reflex.services.enrollment_service import is_enrolled
+from E_Learning_JCB_Reflex.services.lesson_service import get_lesson
+from E_Learning_JCB_Reflex.services.progress_service import (
+    flush_lesson_progress,
+    get_enrollment,
+    record_lesson_completion,
+)
 from E_Learning_JCB_Reflex.utils.route_helpers import get_dynamic_id
 
 
@@ -35,8 +43,11 @@ class CourseViewerState(AuthState):
         course_thumbnail (str): URL de la imagen del curso
 
         # Lecciones
-        lessons (list[dict]): Lista de todas las lecciones del curso
+        lessons (list[dict]): Índice de lecciones del curso (id, title, order, duration)
         current_lesson_index (int): Índice de la lección actual
+        current_lesson_detail (dict): Contenido y vídeo de la lección actual
+        completed_lesson_ids (list[str]): IDs de las lecciones ya completadas
+        _lesson_bodies (dict): Lecciones ya cargadas en esta sesión (solo backend)
 
         # Estados de UI
         loading (bool): Indicador de carga
@@ -48,6 +59,7 @@ class CourseViewerState(AuthState):
         current_video_url (str): URL del video de YouTube para embed
         has_previous_lesson (bool): Si existe una lección anterior
         has_next_lesson (bool): Si existe una lección siguiente
+        current_lesson_completed (bool): Si la lección actual ya está completada
         progress_percentage (float): Porcentaje de progreso en el curso
     """
 
@@ -59,6 +71,9 @@ class CourseViewerState(AuthState):
     # Lecciones
     lessons: list[dict] = []
     current_lesson_index: int = 0
+    current_lesson_detail: dict = {}
+    completed_lesson_ids: list[str] = []
+    _lesson_bodies: dict[str, dict] = {}
 
     # Estados de UI
     loading: bool = False
@@ -71,11 +86,17 @@ class CourseViewerState(AuthState):
         """
         Obtener la lección actualmente seleccionada.
 
+        Combina la entrada del índice con el contenido cargado por
+        _load_current_lesson (vacío mientras se carga).
+
         Returns:
             dict: Diccionario con los datos de la lección actual
         """
         if 0 <= self.current_lesson_index < len(self.lessons):
-            return self.lessons[self.current_lesson_index]
+            lesson = self.lessons[self.current_lesson_index]
+            if self.current_lesson_detail.get("id") == lesson["id"]:
+                return {**lesson, **self.current_lesson_detail}
+            return {**lesson, "content": "", "video_url": ""}
         return {}
 
     @rx.var
@@ -120,17 +141,29 @@ class CourseViewerState(AuthState):
         """Verificar si existe una lección siguiente."""
         return self.current_lesson_index < len(self.lessons) - 1
 
+    @rx.var
+    def current_lesson_completed(self) -> bool:
+        """Verificar si la lección actual ya está marcada como completada."""
+        if 0 <= self.current_lesson_index < len(self.lessons):
+            return self.lessons[self.current_lesson_index]["id"] in self.completed_lesson_ids
+        return False
+
     @rx.var
     def progress_percentage(self) -> float:
         """
         Calcular el porcentaje de progreso en el curso.
 
+        Usa las lecciones completadas (las mismas que se guardan en la
+        inscripción), no la posición de la lección actual.
+
         Returns:
-            float: Porcentaje de lecciones vistas (0-100)
+            float: Porcentaje de lecciones completadas (0-100)
         """
         if len(self.lessons) == 0:
             return 0.0
-        return ((self.current_lesson_index + 1) / len(self.lessons)) * 100
+        lesson_ids = {lesson["id"] for lesson in self.lessons}
+        completed = lesson_ids.intersection(self.completed_lesson_ids)
+        return (len(completed) / len(self.lessons)) * 100
 
     @rx.var
     def total_lessons(self) -> int:
@@ -178,9 +211,14 @@ class CourseViewerState(AuthState):
 
             print("[VIEWER] User is a student")
 
-            # Verificar que el estudiante esté inscrito en el curso
+            # Verificar que el estudiante esté inscrito en el curso y recuperar su progreso
             user_id = self.current_user.get("_id", "")
-            self.is_enrolled = await is_enrolled(str(user_id), str(course_id))
+            enrollment = await get_enrollment(str(user_id), str(course_id))
+            self.is_enrolled = enrollment is not None
+            self.completed_lesson_ids = (
+                [str(lesson_id) for lesson_id in enrollment.get("completedLessons", [])]
+                if enrollment else []
+            )
 
             print(f"[VIEWER] Enrollment status: {self.is_enrolled}")
 
@@ -206,8 +244,24 @@ class CourseViewerState(AuthState):
             self.course_title = course.title
             self.course_thumbnail = course.thumbnail or "/default-course.png"
 
-            # Cargar lecciones
-            self.lessons = [lesson.to_dict() for lesson in course.lessons]
+            # Cargar el índice de lecciones; el contenido se carga al seleccionar cada una
+            self.lessons = []
+            self._lesson_bodies = {}
+            for position, lesson in enumerate(course.lessons):
+                lesson_key = lesson.id or str(position)
+                self.lessons.append({
+                    "id": lesson_key,
+                    "title": lesson.title,
+                    "order": lesson.order,
+                    "duration": lesson.duration,
+                })
+                # Cursos aún no migrados a la colección lessons: el contenido ya viene embebido
+                if lesson.content or lesson.video_url:
+                    self._lesson_bodies[lesson_key] = {
+                        "id": lesson_key,
+                        "content": lesson.content,
+                        "video_url": lesson.video_url,
+                    }
 
             print(f"[VIEWER] Found {len(self.lessons)} lessons")
 
@@ -221,10 +275,11 @@ class CourseViewerState(AuthState):
             # Ordenar lecciones por order
             self.lessons.sort(key=lambda x: x.get("order", 0))
 
-            print(f"[VIEWER] First lesson video_url: {self.lessons[0].get('video_url', 'NO URL')}")
-
             # Iniciar en la primera lección
             self.current_lesson_index = 0
+            await self._load_current_lesson()
+
+            print(f"[VIEWER] First lesson video_url: {self.current_lesson_detail.get('video_url') or 'NO URL'}")
 
             print(f"[VIEWER] Successfully loaded! Course viewer ready.")
             print(f"[VIEWER] is_enrolled: {self.is_enrolled}, loading: {self.loading}, error: {self.error}")
@@ -236,25 +291,80 @@ class CourseViewerState(AuthState):
             self.loading = False
             print(f"[VIEWER] Final state - is_enrolled: {self.is_enrolled}, loading: {self.loading}, error: '{self.error}'")
 
-    def select_lesson(self, index: int):
+    async def _load_current_lesson(self):
+        """
+        Cargar el contenido y el vídeo de la lección actual.
+
+        Solo consulta la colección lessons la primera vez que se abre cada
+        lección; las siguientes se sirven desde _lesson_bodies.
+        """
+        if not 0 <= self.current_lesson_index < len(self.lessons):
+            return
+
+        lesson_key = self.lessons[self.current_lesson_index]["id"]
+        detail = self._lesson_bodies.get(lesson_key)
+
+        if detail is None:
+            lesson = await get_lesson(self.current_course_id, lesson_key)
+            detail = {
+                "id": lesson_key,
+                "content": lesson.content if lesson else "",
+                "video_url": lesson.video_url if lesson else "",
+            }
+            self._lesson_bodies[lesson_key] = detail
+
+        self.current_lesson_detail = detail
+
+    def _mark_lesson_completed(self, lesson_key: str):
+        """
+        Marcar una lección como completada.
+
+        Solo se llama al avanzar con go_to_next_lesson o con la acción
+        explícita mark_current_lesson_completed: abrir una lección (también
+        desde la barra lateral) no la completa. La escritura se acumula en el
+        buffer de progress_service, de modo que avanzar rápido por varias
+        lecciones produce una sola escritura por flush.
+        """
+        if lesson_key in self.completed_lesson_ids or not ObjectId.is_valid(lesson_key):
+            return
+
+        self.completed_lesson_ids = self.completed_lesson_ids + [lesson_key]
+        record_lesson_completion(
+            str(self.current_user.get("_id", "")), self.current_course_id, lesson_key
+        )
+
+    def mark_current_lesson_completed(self):
+        """Marcar como completada la lección actual (botón "Marcar como completada")."""
+        if 0 <= self.current_lesson_index < len(self.lessons):
+            self._mark_lesson_completed(self.lessons[self.current_lesson_index]["id"])
+
+    async def flush_progress(self):
+        """Guardar inmediatamente el progreso pendiente al salir del visor."""
+        await flush_lesson_progress(str(self.current_user.get("_id", "")), self.current_course_id)
+
+    async def select_lesson(self, index: int):
         """
-        Seleccionar una lección específica por su índice.
+        Seleccionar una lección específica por su índice y cargar su contenido.
 
         Args:
             index: Índice de la lección a seleccionar (0-based)
         """
         if 0 <= index < len(self.lessons):
             self.current_lesson_index = index
+            await self._load_current_lesson()
 
-    def go_to_previous_lesson(self):
+    async def go_to_previous_lesson(self):
         """Ir a la lección anterior si existe."""
         if self.has_previous_lesson:
             self.current_lesson_index -= 1
+            await self._load_current_lesson()
 
-    def go_to_next_lesson(self):
-        """Ir a la lección siguiente si existe."""
+    async def go_to_next_lesson(self):
+        """Completar la lección actual e ir a la siguiente si existe."""
         if self.has_next_lesson:
+            self.mark_current_lesson_completed()
             self.current_lesson_index += 1
+            await self._load_current_lesson()
 
     def toggle_sidebar(self):
         """Alternar visibilidad de la sidebar."""
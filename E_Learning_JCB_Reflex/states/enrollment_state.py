@@ -29,7 +29,14 @@ class EnrollmentState(AuthState):
     Atributos de estado:
         # Listas de cursos
         available_courses (list[dict]): Todos los cursos disponibles para inscripción
-        enrolled_courses (list[dict]): Cursos en los que el estudiante está inscrito
+        enrolled_courses (list[dict]): Páginas cargadas de cursos en los que el estudiante está inscrito
+        enrolled_courses_cursor (str): Cursor de la siguiente página ("" si no hay más)
+        loading_more_courses (bool): Indicador de carga de más cursos inscritos
+
+        # Resumen del dashboard (calculado en MongoDB sobre todas las inscripciones)
+        total_enrolled_courses (int): Número total de cursos inscritos
+        completed_courses (int): Cursos con progreso 100%
+        average_progress (float): Progreso promedio en todos los cursos
 
         # Estados de UI
         loading (bool): Indicador de operación en progreso
@@ -47,16 +54,21 @@ class EnrollmentState(AuthState):
         enrollment_course_id (str): ID del curso en el que se intentó inscribir
 
     Propiedades computadas:
-        total_enrolled_courses (int): Número total de cursos inscritos
-        completed_courses (int): Cursos con progreso 100%
-        average_progress (float): Progreso promedio en todos los cursos
+        has_more_enrolled_courses (bool): Si quedan páginas de cursos inscritos por cargar
     """
 
     # Cursos disponibles para inscripción
     available_courses: list[dict] = []
 
-    # Cursos en los que el estudiante está inscrito
+    # Cursos en los que el estudiante está inscrito (paginados)
     enrolled_courses: list[dict] = []
+    enrolled_courses_cursor: str = ""
+    loading_more_courses: bool = False
+
+    # Resumen de inscripciones del estudiante
+    total_enrolled_courses: int = 0
+    completed_courses: int = 0
+    average_progress: float = 0.0
 
     # Estados de la UI
     loading: bool = False
@@ -92,7 +104,7 @@ class EnrollmentState(AuthState):
         self.loading = True
         self.error = ""
         try:
-            all_courses = await get_all_courses()
+            all_courses = await get_all_courses(fields="card")
 
             # Convertir objetos Course a diccionarios
             self.available_courses = [
@@ -120,12 +132,15 @@ class EnrollmentState(AuthState):
         """
         Cargar cursos en los que el estudiante está inscrito.
 
-        Obtiene de la base de datos todos los cursos en los que el usuario
-        actual está inscrito, incluyendo información de progreso y estado
-        de inscripción. Solo funciona si el usuario está autenticado.
+        Obtiene de la base de datos la primera página de cursos en los que el
+        usuario actual está inscrito, incluyendo información de progreso y
+        estado de inscripción, y el resumen de todas sus inscripciones. Solo
+        funciona si el usuario está autenticado.
 
         Actualiza el estado:
-            - enrolled_courses: Lista con cursos inscritos y datos de progreso
+            - enrolled_courses: Primera página de cursos inscritos con datos de progreso
+            - enrolled_courses_cursor: Cursor de la siguiente página
+            - total_enrolled_courses, completed_courses, average_progress: Resumen
             - loading: True durante carga, False al terminar
             - error: Mensaje si el usuario no está identificado o hay error
 
@@ -145,15 +160,40 @@ class EnrollmentState(AuthState):
                 self.loading = False
                 return
 
-            enrolled = await enrollment_service.get_student_enrollments(user_id)
+            enrolled, self.enrolled_courses_cursor = await enrollment_service.get_student_enrollments(user_id)
             self.enrolled_courses = enrolled
 
+            summary = await enrollment_service.get_student_enrollment_summary(user_id)
+            self.total_enrolled_courses = summary["total"]
+            self.completed_courses = summary["completed"]
+            self.average_progress = summary["average_progress"]
+
         except Exception as e:
             self.error = f"Error al cargar cursos inscritos: {str(e)}"
             print(f"Error in load_enrolled_courses: {e}")
         finally:
             self.loading = False
 
+    async def load_more_enrolled_courses(self):
+        """Cargar la siguiente página de cursos inscritos ("ver más")."""
+        if not self.enrolled_courses_cursor or self.loading_more_courses:
+            return
+
+        user_id = self.current_user.get("_id") if self.current_user else None
+        if not user_id:
+            return
+
+        self.loading_more_courses = True
+        try:
+            enrolled, self.enrolled_courses_cursor = await enrollment_service.get_student_enrollments(
+                user_id, after=self.enrolled_courses_cursor
+            )
+            self.enrolled_courses = self.enrolled_courses + enrolled
+        except Exception as e:
+            print(f"Error in load_more_enrolled_courses: {e}")
+        finally:
+            self.loading_more_courses = False
+
     async def enroll_in_course(self, course_id: str):
         """
         Inscribir al estudiante autenticado en un curso específico.
@@ -333,20 +373,6 @@ class EnrollmentState(AuthState):
             self.is_enrolled_in_current_course = False
 
     @rx.var
-    def total_enrolled_courses(self) -> int:
-        """Número total de cursos en los que está inscrito."""
-        return len(self.enrolled_courses)
-
-    @rx.var
-    def completed_courses(self) -> int:
-        """Número de cursos completados (progreso 100%)."""
-        return sum(1 for course in self.enrolled_courses if course.get("progress", 0) >= 100)
-
-    @rx.var
-    def average_progress(self) -> float:
-        """Progreso promedio en todos los cursos inscritos."""
-        if not self.enrolled_courses:
-            return 0.0
-
-        total_progress = sum(course.get("progress", 0) for course in self.enrolled_courses)
-        return round(total_progress / len(self.enrolled_courses), 1)
+    def has_more_enrolled_courses(self) -> bool:
+        """Si quedan páginas de cursos inscritos por cargar."""
+        return self.enrolled_courses_cursor != ""
@@ -7,7 +7,7 @@ Permite al instructor crear, editar y eliminar sus propios cursos.
 import reflex as rx
 from E_Learning_JCB_Reflex.states.auth_state import AuthState
 from E_Learning_JCB_Reflex.services.course_service import (
-    get_all_courses,
+    get_courses_by_instructor,
     create_course,
     update_course,
     delete_course,
@@ -69,7 +69,7 @@ class InstructorCourseState(AuthState):
                 self.error = "No hay usuario autenticado"
                 return
 
-            all_courses = await get_all_courses()
+            my_courses = await get_courses_by_instructor(user_id)
             self.courses = [
                 {
                     "id": c.id,
@@ -79,10 +79,9 @@ class InstructorCourseState(AuthState):
                     "level": c.level,
                     "category": c.category,
                     "thumbnail": c.thumbnail,
-                    "students_count": len(c.students),
+                    "students_count": c.students_enrolled,
                 }
-                for c in all_courses
-                if c.instructor.user_id and str(c.instructor.user_id) == str(user_id)
+                for c in my_courses
             ]
         except Exception as e:
             self.error = f"Error al cargar cursos: {str(e)}"
@@ -235,7 +234,6 @@ class InstructorCourseState(AuthState):
         """Añadir el último curso creado al array coursesCreated del instructor."""
         try:
             from bson import ObjectId
-            await MongoDB.connect()
             db = MongoDB.get_db()
             # Obtener el último curso insertado por este instructor
             courses_col = db["courses"]
@@ -297,7 +295,6 @@ class InstructorCourseState(AuthState):
         """Eliminar curso del array coursesCreated del instructor."""
         try:
             from bson import ObjectId
-            await MongoDB.connect()
             db = MongoDB.get_db()
             await db["users"].update_one(
                 {"_id": ObjectId(user_id)},
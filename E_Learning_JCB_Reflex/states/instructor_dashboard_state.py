@@ -8,7 +8,8 @@ la carga de estadísticas y cursos del instructor autenticado.
 import reflex as rx
 from E_Learning_JCB_Reflex.states.auth_state import AuthState
 from E_Learning_JCB_Reflex.services.user_service import get_user_by_id
-from E_Learning_JCB_Reflex.services.course_service import get_all_courses
+from E_Learning_JCB_Reflex.services.course_service import get_courses_by_ids
+from E_Learning_JCB_Reflex.services.enrollment_service import count_unique_students
 
 
 class InstructorDashboardState(AuthState):
@@ -57,7 +58,7 @@ class InstructorDashboardState(AuthState):
             user_id = self.current_user.get("_id")
             print(f"   user_id: {user_id}")
 
-            instructor = await get_user_by_id(user_id)
+            instructor = await get_user_by_id(user_id, fields="profile")
             print(f"   Instructor: {instructor.get_full_name() if instructor else 'None'}")
             print(f"   courses_created: {instructor.courses_created if instructor else 'None'}")
 
@@ -66,38 +67,30 @@ class InstructorDashboardState(AuthState):
                 print(f"   ❌ Usuario no es instructor")
                 return
 
-            # Obtener todos los cursos
-            all_courses = await get_all_courses()
-            print(f"   Total cursos en BD: {len(all_courses)}")
-
-            # Filtrar cursos del instructor
-            instructor_courses = [
-                course for course in all_courses
-                if course.id in instructor.courses_created
-            ]
+            # Obtener solo los cursos del instructor
+            instructor_courses = await get_courses_by_ids(instructor.courses_created)
             print(f"   Cursos del instructor: {len(instructor_courses)}")
 
             # Calcular estadísticas
             self.total_courses = len(instructor_courses)
             print(f"   ✅ total_courses actualizado: {self.total_courses}")
 
-            # Calcular estudiantes únicos
-            unique_students = set()
+            # Estudiantes únicos (agregación sobre la colección enrollments)
+            self.total_students = await count_unique_students(
+                [course.id for course in instructor_courses]
+            )
+
             total_ratings = []
             total_revenue = 0.0
 
             for course in instructor_courses:
-                # Estudiantes únicos
-                unique_students.update(course.students)
-
                 # Ratings
                 if course.average_rating:
                     total_ratings.append(course.average_rating)
 
                 # Ingresos (precio * número de estudiantes)
-                total_revenue += course.price * len(course.students)
+                total_revenue += course.price * course.students_enrolled
 
-            self.total_students = len(unique_students)
             self.average_rating = (
                 sum(total_ratings) / len(total_ratings)
                 if total_ratings
@@ -114,7 +107,7 @@ class InstructorDashboardState(AuthState):
                     "thumbnail": course.thumbnail,
                     "price": course.price,
                     "level": course.level,
-                    "students_count": len(course.students),
+                    "students_count": course.students_enrolled,
                     "average_rating": course.average_rating if course.average_rating else 0,
                 }
                 for course in instructor_courses
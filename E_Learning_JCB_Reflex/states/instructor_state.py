@@ -17,7 +17,8 @@ from E_Learning_JCB_Reflex.services.user_service import (
     get_all_instructors,
     get_user_by_id,
 )
-from E_Learning_JCB_Reflex.services.course_service import get_all_courses
+from E_Learning_JCB_Reflex.services.course_service import get_courses_by_ids
+from E_Learning_JCB_Reflex.services.enrollment_service import count_unique_students
 from E_Learning_JCB_Reflex.utils.route_helpers import get_dynamic_id
 
 
@@ -131,13 +132,13 @@ class InstructorState(rx.State):
             - error: Mensaje si el instructor no existe o no tiene rol instructor
 
         Nota:
-            Los estudiantes únicos se calculan usando un set para evitar
-            contar duplicados (un estudiante puede estar en varios cursos).
+            Los estudiantes únicos se cuentan en MongoDB agrupando las
+            inscripciones por estudiante (un estudiante puede estar en varios cursos).
         """
         self.loading = True
         self.error = ""
         try:
-            instructor = await get_user_by_id(instructor_id)
+            instructor = await get_user_by_id(instructor_id, fields="profile")
             if instructor and instructor.is_instructor:
                 # Asignar a variables de estado planas
                 self.current_instructor_id = instructor.id
@@ -148,20 +149,15 @@ class InstructorState(rx.State):
                 self.instructor_expertise = instructor.instructor_profile.get("expertise", "")
 
                 # Obtener los cursos del instructor
-                all_courses = await get_all_courses()
-                instructor_courses = [
-                    course for course in all_courses
-                    if course.id in instructor.courses_created
-                ]
+                instructor_courses = await get_courses_by_ids(instructor.courses_created)
 
                 # Estadísticas
                 self.total_courses = len(instructor_courses)
 
                 # Calcular total de estudiantes únicos
-                unique_students = set()
-                for course in instructor_courses:
-                    unique_students.update(course.students)
-                self.total_students = len(unique_students)
+                self.total_students = await count_unique_students(
+                    [course.id for course in instructor_courses]
+                )
 
                 # Convertir cursos a diccionarios
                 self.courses = [
@@ -172,7 +168,7 @@ class InstructorState(rx.State):
                         "thumbnail": course.thumbnail,
                         "price": course.price,
                         "level": course.level,
-                        "students_count": len(course.students),
+                        "students_count": course.students_enrolled,
                         "average_rating": course.average_rating if course.average_rating else 0,
                     }
                     for course in instructor_courses
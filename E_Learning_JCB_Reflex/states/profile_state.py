@@ -14,6 +14,7 @@ Funcionalidades principales:
 import reflex as rx
 from E_Learning_JCB_Reflex.states.auth_state import AuthState
 from E_Learning_JCB_Reflex.services.user_service import user_service
+from E_Learning_JCB_Reflex.utils.password import PasswordHashingBusy
 
 
 class ProfileState(AuthState):
@@ -221,6 +222,9 @@ class ProfileState(AuthState):
             else:
                 return rx.toast.error("Contraseña actual incorrecta")
 
+        except PasswordHashingBusy:
+            return rx.toast.error("El servidor está ocupado. Por favor, inténtalo de nuevo en unos segundos.")
+
         except Exception as e:
             print(f"Error in change_password: {e}")
             return rx.toast.error(f"Error al cambiar contraseña: {str(e)}")
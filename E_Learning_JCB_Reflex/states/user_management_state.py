@@ -16,6 +16,7 @@ Funcionalidades principales:
 import reflex as rx
 from E_Learning_JCB_Reflex.states.auth_state import AuthState
 from E_Learning_JCB_Reflex.services.user_service import user_service
+from E_Learning_JCB_Reflex.utils.password import PasswordHashingBusy
 
 
 class UserManagementState(AuthState):
@@ -142,7 +143,7 @@ class UserManagementState(AuthState):
         try:
             # Obtener todos los usuarios
             students = await user_service.get_all_students()
-            instructors = await user_service.get_all_instructors()
+            instructors = await user_service.get_all_instructors(fields="summary")
 
             # Convertir a diccionarios
             all_users = []
@@ -256,13 +257,18 @@ class UserManagementState(AuthState):
                 result = await user_service.update_user(self.selected_user_id, update_data)
 
                 # Si se proporcionó una nueva contraseña, actualizarla
+                password_changed = True
                 if self.form_password:
-                    await user_service.admin_change_password(self.selected_user_id, self.form_password)
+                    password_changed = await user_service.admin_change_password(
+                        self.selected_user_id, self.form_password
+                    )
 
-                if result:
+                if result and password_changed:
                     self.close_user_dialog()
                     await self.load_users()
                     return rx.toast.success("Usuario actualizado exitosamente")
+                elif result:
+                    return rx.toast.error("Usuario actualizado, pero no se pudo cambiar la contraseña")
                 else:
                     return rx.toast.error("No se pudo actualizar el usuario")
             else:
@@ -282,6 +288,13 @@ class UserManagementState(AuthState):
                 else:
                     return rx.toast.error("No se pudo crear el usuario")
 
+        except PasswordHashingBusy:
+            # El diálogo sigue abierto: volver a guardar reintenta la creación o el cambio de contraseña
+            return rx.toast.error(
+                "El servidor está ocupado y no se guardó la contraseña. "
+                "Por favor, vuelve a guardar en unos segundos."
+            )
+
         except Exception as e:
             print(f"Error saving user: {e}")
             return rx.toast.error(f"Error al guardar usuario: {str(e)}")
@@ -0,0 +1,192 @@
+"""
+Caché en memoria con expiración (TTL) y política LRU para servicios asíncronos.
+
+Este módulo proporciona AsyncTTLCache, una caché acotada por proceso pensada
+para colocarse delante de lecturas frecuentes a MongoDB (por ejemplo, cursos
+consultados miles de veces por hora). Es segura para asyncio: las lecturas
+concurrentes de una misma clave que fallan en caché comparten una sola
+consulta a la base de datos (single-flight).
+
+Clases:
+- AsyncTTLCache: Caché LRU con TTL, single-flight y contadores de monitorización
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class AsyncTTLCache:
+    """
+    Caché LRU con expiración por entrada y deduplicación de cargas concurrentes.
+
+    Cada entrada guarda el valor y su instante de expiración. Al superar
+    max_size se descarta la entrada usada hace más tiempo. get_or_load()
+    ejecuta el loader solo una vez por clave aunque varias corrutinas fallen
+    en caché a la vez; las demás esperan el mismo resultado.
+
+    Los valores None no se almacenan (un curso inexistente no ocupa caché y
+    puede aparecer en cuanto se cree).
+
+    Atributos:
+        max_size (int): Número máximo de entradas
+        ttl (float): Segundos de vida de cada entrada
+        hits, misses, evictions, expirations, invalidations (int): Contadores
+
+    Ejemplo:
+        >>> cache = AsyncTTLCache(max_size=512, ttl=60)
+        >>> course = await cache.get_or_load(course_id, lambda: load_course(course_id))
+        >>> cache.invalidate(course_id)
+
+    Nota:
+        Los valores se comparten entre todos los que los leen: no deben
+        modificarse in situ.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        """
+        Obtener un valor vigente de la caché sin cargarlo.
+
+        Args:
+            key: Clave a buscar
+
+        Returns:
+            Any | None: Valor almacenado, o None si no existe o ha expirado
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Guardar un valor en la caché, descartando la entrada LRU si está llena.
+
+        Args:
+            key: Clave del valor
+            value: Valor a guardar (None no se almacena)
+        """
+        if value is None or self.max_size <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any | None:
+        """
+        Obtener un valor de la caché o cargarlo con loader() si no está.
+
+        Si ya hay una carga en curso para la misma clave, espera su resultado
+        en lugar de lanzar otra consulta.
+
+        Args:
+            key: Clave a buscar
+            loader: Función sin argumentos que devuelve un awaitable con el valor
+
+        Returns:
+            Any | None: Valor de la caché o el devuelto por loader()
+        """
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.hits += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # La corrutina que cargaba fue cancelada: reintentar la carga
+                if not inflight.cancelled():
+                    raise
+                return await self.get_or_load(key, loader)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Evitar el aviso "exception was never retrieved" si nadie esperaba
+            future.exception()
+            raise
+        else:
+            # Si se invalidó durante la carga, el valor puede ser anterior a la escritura
+            if self._inflight.get(key) is future:
+                self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Eliminar una clave de la caché.
+
+        Una carga en curso para esa clave se completa para quien la esperaba,
+        pero su resultado no se guarda porque puede ser anterior a la escritura.
+
+        Args:
+            key: Clave a invalidar
+        """
+        self._inflight.pop(key, None)
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Vaciar la caché por completo."""
+        self.invalidations += len(self._entries)
+        self._entries.clear()
+        self._inflight.clear()
+
+    def stats(self) -> dict:
+        """
+        Obtener los contadores de la caché para monitorización.
+
+        Returns:
+            dict: size, max_size, ttl, hits, misses, evictions, expirations,
+                  invalidations y hit_ratio (0.0 - 1.0)
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
@@ -6,16 +6,51 @@ de forma segura utilizando el algoritmo bcrypt. Todas las contraseñas
 se almacenan hasheadas en la base de datos para proteger la información
 de los usuarios.
 
+bcrypt es lento a propósito (~250 ms por operación con coste 12): llamado
+directamente desde un manejador async bloquea el event loop y con él los
+websockets de todos los usuarios del worker. Los servicios y estados usan
+las variantes async, que ejecutan bcrypt en un pool de hilos dedicado y
+acotado (bcrypt libera el GIL mientras calcula). Si hay demasiadas
+operaciones pendientes se rechazan con PasswordHashingBusy en lugar de
+acumular una cola sin límite.
+
+Configuración (variables de entorno):
+- PASSWORD_BCRYPT_ROUNDS: Coste de bcrypt para hashes nuevos (por defecto 12)
+- PASSWORD_HASH_WORKERS: Hilos del pool de bcrypt (por defecto 4)
+- PASSWORD_HASH_MAX_PENDING: Operaciones en curso o en cola antes de
+  rechazar nuevas (por defecto 64)
+
 Funciones:
 - hash_password: Hashea una contraseña con bcrypt
 - verify_password: Verifica una contraseña contra su hash
+- needs_rehash: Indica si un hash usa un coste distinto al configurado
+- hash_password_async / verify_password_async: Variantes que no bloquean el event loop
+- get_password_hashing_stats: Contadores del pool de bcrypt
 - is_password_strong: Valida requisitos de seguridad de contraseña
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import bcrypt
 
+# Coste de bcrypt (log2 de las iteraciones) para los hashes nuevos
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+# Pool dedicado: un pico de logins no ocupa el executor por defecto del loop
+_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_pending = 0
+_rejected = 0
 
-def hash_password(password: str) -> str:
+
+class PasswordHashingBusy(RuntimeError):
+    """Demasiadas operaciones de bcrypt pendientes en este proceso."""
+
+
+def hash_password(password: str, rounds: int | None = None) -> str:
     """
     Hashea una contraseña usando el algoritmo bcrypt.
 
@@ -25,6 +60,7 @@ def hash_password(password: str) -> str:
 
     Args:
         password: Contraseña en texto plano a hashear
+        rounds: Coste de bcrypt. Por defecto PASSWORD_BCRYPT_ROUNDS
 
     Returns:
         str: Contraseña hasheada en formato string (listo para guardar en MongoDB)
@@ -36,12 +72,13 @@ def hash_password(password: str) -> str:
     Nota:
         El hash generado incluye el salt y puede almacenarse directamente
         como string en MongoDB. No es necesario almacenar el salt por separado.
+        Bloquea el hilo que la llama: desde código async usar hash_password_async.
     """
     # Convertir la contraseña a bytes (requerido por bcrypt)
     password_bytes = password.encode('utf-8')
 
     # Generar salt automático y hashear la contraseña
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=rounds or PASSWORD_BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
 
     # Retornar como string para almacenar en MongoDB
@@ -86,6 +123,103 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Indicar si un hash bcrypt usa un coste distinto de PASSWORD_BCRYPT_ROUNDS.
+
+    Permite subir (o bajar) el coste sin forzar un cambio de contraseña:
+    tras un login correcto se vuelve a hashear la contraseña con el coste
+    configurado (ver user_service.rehash_password_if_needed).
+
+    Args:
+        hashed_password: Hash bcrypt almacenado ("$2b$12$...")
+
+    Returns:
+        bool: True si el coste del hash no coincide con el configurado.
+              False si coincide o el hash no tiene formato bcrypt
+
+    Ejemplo:
+        >>> needs_rehash(hash_password("secreto", rounds=10))  # con PASSWORD_BCRYPT_ROUNDS=12
+        True
+    """
+    try:
+        return int(hashed_password.split("$")[2]) != PASSWORD_BCRYPT_ROUNDS
+    except (AttributeError, IndexError, ValueError):
+        return False
+
+
+async def _run_in_pool(func, *args):
+    """Ejecutar func en el pool de bcrypt respetando PASSWORD_HASH_MAX_PENDING."""
+    global _pending, _rejected
+
+    if _pending >= PASSWORD_HASH_MAX_PENDING:
+        _rejected += 1
+        raise PasswordHashingBusy(f"{_pending} bcrypt operations pending")
+
+    _pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_executor, func, *args)
+    finally:
+        _pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hashear una contraseña en el pool de bcrypt sin bloquear el event loop.
+
+    Args:
+        password: Contraseña en texto plano a hashear
+
+    Returns:
+        str: Hash bcrypt con coste PASSWORD_BCRYPT_ROUNDS
+
+    Raises:
+        PasswordHashingBusy: Si ya hay PASSWORD_HASH_MAX_PENDING operaciones pendientes
+
+    Ejemplo:
+        >>> hashed = await hash_password_async("micontraseña123")
+    """
+    return await _run_in_pool(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verificar una contraseña en el pool de bcrypt sin bloquear el event loop.
+
+    Args:
+        plain_password: Contraseña en texto plano a verificar
+        hashed_password: Hash bcrypt almacenado en la base de datos
+
+    Returns:
+        bool: True si la contraseña es correcta, False si es incorrecta o hay error
+
+    Raises:
+        PasswordHashingBusy: Si ya hay PASSWORD_HASH_MAX_PENDING operaciones pendientes
+
+    Ejemplo:
+        >>> if await verify_password_async(password, user.password):
+        ...     print("Login correcto")
+    """
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
+
+
+def get_password_hashing_stats() -> dict:
+    """
+    Obtener el estado del pool de bcrypt de este proceso.
+
+    Returns:
+        dict: rounds, workers, max_pending, pending (en curso o en cola) y
+              rejected (rechazadas por PasswordHashingBusy desde el arranque)
+    """
+    return {
+        "rounds": PASSWORD_BCRYPT_ROUNDS,
+        "workers": PASSWORD_HASH_WORKERS,
+        "max_pending": PASSWORD_HASH_MAX_PENDING,
+        "pending": _pending,
+        "rejected": _rejected,
+    }
+
+
 def is_password_strong(password: str) -> tuple[bool, str]:
     """
     Valida si una contraseña cumple con los requisitos mínimos de seguridad.
@@ -0,0 +1,175 @@
+"""
+Limitación de frecuencia con cubos de tokens (token bucket).
+
+Cada clave (un email, una IP) tiene un cubo con `capacity` tokens que se
+rellena a `refill_per_second` tokens por segundo. Cada operación consume un
+token; con el cubo vacío la operación se rechaza y se informa de cuántos
+segundos faltan para el siguiente token. Así se permite una ráfaga corta
+(capacity) y después un ritmo sostenido (refill_per_second).
+
+Con REDIS_URL configurada los cubos viven en Redis y los comparten todos los
+workers (RedisCache.take_token). Sin Redis, o si Redis falla, cada worker
+usa sus propios cubos en memoria: el límite efectivo se multiplica por el
+número de workers, pero la protección sigue activa.
+
+El caso principal es el login: cada intento cuesta una verificación bcrypt
+completa, así que una avalancha de intentos fallidos (credential stuffing)
+puede saturar la CPU de todos los workers. check_login_attempt se llama
+antes de consultar el usuario y verificar la contraseña.
+
+Configuración del login (variables de entorno; capacidad 0 desactiva el límite):
+- LOGIN_EMAIL_BURST / LOGIN_EMAIL_PER_MINUTE: Intentos por email (por defecto 5 y 5/min)
+- LOGIN_IP_BURST / LOGIN_IP_PER_MINUTE: Intentos por dirección IP (por defecto 50 y 60/min,
+  holgado porque un aula o una empresa comparten IP)
+
+Clases y funciones:
+- TokenBucketLimiter: Limitador por clave, en Redis con respaldo en memoria
+- check_login_attempt: Consumir un intento de login para un email y una IP
+- get_login_throttle_stats: Contadores de intentos permitidos y rechazados
+"""
+
+import os
+import time
+from collections import OrderedDict
+
+from E_Learning_JCB_Reflex.database.redis_cache import RedisCache
+
+LOGIN_EMAIL_BURST = float(os.getenv("LOGIN_EMAIL_BURST", "5"))
+LOGIN_EMAIL_PER_MINUTE = float(os.getenv("LOGIN_EMAIL_PER_MINUTE", "5"))
+LOGIN_IP_BURST = float(os.getenv("LOGIN_IP_BURST", "50"))
+LOGIN_IP_PER_MINUTE = float(os.getenv("LOGIN_IP_PER_MINUTE", "60"))
+
+# Prefijo de las claves de los cubos en Redis
+RATE_LIMIT_KEY_PREFIX = "elearning:v1:ratelimit"
+
+
+class TokenBucketLimiter:
+    """
+    Limitador de frecuencia por clave con cubos de tokens.
+
+    Los cubos en memoria se guardan en un OrderedDict acotado a max_keys: al
+    superarlo se descarta el usado hace más tiempo, que al volver empieza
+    con el cubo lleno (lo mismo que le ocurriría tras esperar).
+
+    Atributos:
+        name (str): Nombre del limitador, parte de la clave en Redis
+        capacity (float): Tokens máximos por clave. 0 desactiva el limitador
+        refill_per_second (float): Tokens recuperados por segundo
+        allowed, throttled (int): Contadores de este proceso
+
+    Ejemplo:
+        >>> limiter = TokenBucketLimiter("login_email", capacity=5, refill_per_second=5 / 60)
+        >>> retry_after = await limiter.acquire("juan@email.com")
+        >>> if retry_after:
+        ...     print(f"Reintentar en {retry_after:.0f} s")
+    """
+
+    def __init__(self, name: str, capacity: float, refill_per_second: float, max_keys: int = 100_000):
+        self.name = name
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self.allowed = 0
+        self.throttled = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Indica si el limitador está activo (capacidad y ritmo positivos)."""
+        return self.capacity > 0 and self.refill_per_second > 0
+
+    def _take_local(self, key: str) -> float:
+        """Consumir un token del cubo en memoria de key."""
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.pop(key, (self.capacity, now))
+        tokens = min(self.capacity, tokens + (now - updated_at) * self.refill_per_second)
+
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / self.refill_per_second
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+    async def acquire(self, key: str) -> float:
+        """
+        Consumir un token para key.
+
+        Args:
+            key: Clave a limitar (email, IP...)
+
+        Returns:
+            float: 0.0 si la operación está permitida, o los segundos que
+                   faltan para el siguiente token si se debe rechazar
+        """
+        if not self.enabled:
+            return 0.0
+
+        wait = await RedisCache.take_token(
+            f"{RATE_LIMIT_KEY_PREFIX}:{self.name}:{key}", self.capacity, self.refill_per_second
+        )
+        if wait is None:
+            wait = self._take_local(key)
+
+        if wait > 0:
+            self.throttled += 1
+        else:
+            self.allowed += 1
+        return wait
+
+
+_login_email_limiter = TokenBucketLimiter("login_email", LOGIN_EMAIL_BURST, LOGIN_EMAIL_PER_MINUTE / 60)
+_login_ip_limiter = TokenBucketLimiter("login_ip", LOGIN_IP_BURST, LOGIN_IP_PER_MINUTE / 60)
+
+
+async def check_login_attempt(email: str, client_ip: str = "") -> float:
+    """
+    Registrar un intento de login y decidir si se permite.
+
+    Consume un token del cubo del email y otro del de la IP del cliente. Se
+    debe llamar antes de buscar el usuario y verificar la contraseña, para
+    que los intentos rechazados no cuesten ni una consulta ni un bcrypt.
+
+    Args:
+        email: Email introducido (se normaliza a minúsculas)
+        client_ip: IP del cliente (router.session.client_ip). Vacía para no limitar por IP
+
+    Returns:
+        float: 0.0 si el intento está permitido, o los segundos que faltan
+               para poder reintentar
+
+    Ejemplo:
+        >>> retry_after = await check_login_attempt("juan@email.com", "203.0.113.7")
+        >>> if retry_after:
+        ...     print(f"Demasiados intentos, reintentar en {math.ceil(retry_after)} s")
+
+    Nota:
+        La IP proviene de X-Forwarded-For cuando existe, que el cliente
+        puede falsear si no hay un proxy delante. El límite por email sigue
+        aplicándose en cualquier caso.
+    """
+    wait = await _login_email_limiter.acquire(email.strip().lower())
+    if client_ip:
+        wait = max(wait, await _login_ip_limiter.acquire(client_ip))
+    return wait
+
+
+def get_login_throttle_stats() -> dict:
+    """
+    Obtener los contadores de la limitación de login de este proceso.
+
+    Returns:
+        dict: Intentos permitidos y rechazados por email y por IP, y si los
+              cubos están en Redis (compartidos) o solo en memoria
+    """
+    return {
+        "email_allowed": _login_email_limiter.allowed,
+        "email_throttled": _login_email_limiter.throttled,
+        "ip_allowed": _login_ip_limiter.allowed,
+        "ip_throttled": _login_ip_limiter.throttled,
+        "shared": RedisCache.enabled(),
+    }
@@ -1,17 +1,44 @@
 """
 Script para agregar URLs de videos de YouTube a las lecciones existentes.
 
-Este script actualiza todas las lecciones en la base de datos para agregar
-el campo video_url con videos de ejemplo de YouTube.
+Este script agrega el campo video_url con videos de ejemplo de YouTube a las
+lecciones que no lo tienen. Se ejecuta con el sistema de migraciones
+(E_Learning_JCB_Reflex/database/migrations.py): recorre las colecciones por
+lotes, escribe solo el campo video_url con bulk_write y guarda un checkpoint
+en la colección migrations después de cada lote, así que si se interrumpe la
+siguiente ejecución continúa donde se quedó.
+
+Migraciones:
+- lesson_video_urls: Lecciones de la colección lessons
+- embedded_lesson_video_urls: Lecciones todavía embebidas con contenido en
+  cursos sin migrar (scripts/migrate_lessons_to_collection.py); actualiza
+  solo los elementos del array lessons sin vídeo mediante array_filters e
+  invalida la caché de los cursos de cada lote antes de su checkpoint. Las
+  lecciones sin _id se identifican por título; si el título se repite en el
+  curso no se pueden distinguir y se omiten (migrar antes el curso con
+  scripts/migrate_lessons_to_collection.py, que les asigna _id)
+
+Uso:
+    python scripts/add_video_urls_to_lessons.py
+    python scripts/add_video_urls_to_lessons.py --batch-size 1000
+    python scripts/add_video_urls_to_lessons.py --dry-run
+    python scripts/add_video_urls_to_lessons.py --restart
 """
+
+import argparse
 import asyncio
-import os
-from dotenv import load_dotenv
-from motor.motor_asyncio import AsyncIOMotorClient
+import sys
+from collections import Counter
+from pathlib import Path
+
+from pymongo import UpdateOne
 
-load_dotenv()
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
 
-MONGODB_URI = os.getenv("MONGODB_URI")
+from E_Learning_JCB_Reflex.database import MongoDB, Migration, run_migration
+from E_Learning_JCB_Reflex.services.course_service import invalidate_courses_cache
 
 # Videos de ejemplo de YouTube para desarrollo web
 EXAMPLE_VIDEOS = [
@@ -28,66 +55,120 @@ EXAMPLE_VIDEOS = [
     "https://www.youtube.com/watch?v=JnEH9tYLxLk",  # Deployment Tutorial
 ]
 
+# video_url ausente, nulo, vacío o solo espacios
+MISSING_VIDEO = {"$not": {"$regex": r"\S"}}
 
-async def update_lessons_with_videos():
-    """Actualiza todas las lecciones agregando video_url."""
 
-    client = AsyncIOMotorClient(MONGODB_URI)
-    db = client.get_default_database()
-    courses_collection = db["courses"]
+def example_video(position: int) -> str:
+    """Video de ejemplo para la lección en la posición indicada (cíclico)."""
+    return EXAMPLE_VIDEOS[position % len(EXAMPLE_VIDEOS)]
 
-    print("🔍 Buscando cursos en la base de datos...")
 
-    # Obtener todos los cursos
-    courses = await courses_collection.find({}).to_list(length=None)
+def has_video(lesson: dict) -> bool:
+    """Indicar si la lección ya tiene un video_url no vacío."""
+    return bool(str(lesson.get("video_url") or "").strip())
 
-    print(f"✓ Encontrados {len(courses)} cursos")
 
-    for course in courses:
-        course_id = course["_id"]
-        course_title = course.get("title", "Sin título")
-        lessons = course.get("lessons", [])
+class LessonVideoUrls(Migration):
+    """Agregar video_url a los documentos de la colección lessons."""
 
-        if not lessons:
-            print(f"  ⚠ Curso '{course_title}' no tiene lecciones")
-            continue
+    name = "lesson_video_urls"
+    collection = "lessons"
+    query = {"video_url": MISSING_VIDEO}
+    projection = {"order": 1, "video_url": 1}
+    description = "Videos de ejemplo para lecciones sin video_url"
+
+    def build_updates(self, document):
+        position = max(int(document.get("order") or 1) - 1, 0)
+        return [
+            UpdateOne(
+                {"_id": document["_id"], "video_url": MISSING_VIDEO},
+                {"$set": {"video_url": example_video(position)}},
+            )
+        ]
 
-        print(f"\n📚 Procesando curso: {course_title}")
-        print(f"  Lecciones encontradas: {len(lessons)}")
 
-        # Actualizar cada lección con una URL de video
-        updated_lessons = []
-        for i, lesson in enumerate(lessons):
-            # Asignar un video de ejemplo (cíclico si hay más lecciones que videos)
-            video_url = EXAMPLE_VIDEOS[i % len(EXAMPLE_VIDEOS)]
+class EmbeddedLessonVideoUrls(Migration):
+    """Agregar video_url a las lecciones embebidas de cursos sin migrar."""
 
-            # Agregar video_url a la lección (forzar actualización)
-            current_url = lesson.get("video_url", "")
-            if not current_url or current_url.strip() == "":
-                lesson["video_url"] = video_url
-                print(f"  ✓ Lección {i+1}: '{lesson.get('title', 'Sin título')}' -> Video agregado: {video_url}")
+    name = "embedded_lesson_video_urls"
+    collection = "courses"
+    query = {"lessons": {"$elemMatch": {"content": {"$exists": True}, "video_url": MISSING_VIDEO}}}
+    projection = {"lessons._id": 1, "lessons.title": 1, "lessons.video_url": 1}
+    description = "Videos de ejemplo para lecciones embebidas sin video_url"
+
+    def build_updates(self, document):
+        lessons = document.get("lessons", [])
+        titles = Counter(lesson.get("title") for lesson in lessons)
+
+        updates = {}
+        array_filters = []
+        for position, lesson in enumerate(lessons):
+            if has_video(lesson):
+                continue
+            # Identificar el elemento por _id o, en lecciones antiguas sin _id, por
+            # título si es único (con títulos repetidos los filtros se solaparían)
+            if "_id" in lesson:
+                match = {f"l{position}._id": lesson["_id"]}
+            elif lesson.get("title") and titles[lesson["title"]] == 1:
+                match = {f"l{position}.title": lesson["title"]}
             else:
-                print(f"  ⚠ Lección {i+1}: '{lesson.get('title', 'Sin título')}' -> Ya tiene video: {current_url}")
+                continue
+            updates[f"lessons.$[l{position}].video_url"] = example_video(position)
+            array_filters.append({**match, f"l{position}.video_url": MISSING_VIDEO})
+
+        if not updates:
+            return []
+        return [UpdateOne({"_id": document["_id"]}, {"$set": updates}, array_filters=array_filters)]
 
-            updated_lessons.append(lesson)
+    async def after_write(self, documents):
+        # Los cursos en caché contienen las lecciones embebidas actualizadas
+        await invalidate_courses_cache([document["_id"] for document in documents], catalog=False)
 
-        # Actualizar el curso en la base de datos
-        result = await courses_collection.update_one(
-            {"_id": course_id},
-            {"$set": {"lessons": updated_lessons}}
+
+def print_progress(report: dict):
+    """Mostrar el avance de un lote."""
+    print(f"  📦 {report['processed']} documentos, {report['updates']} actualizaciones "
+          f"({report['docs_per_second']:.0f} docs/s)")
+
+
+async def update_lessons_with_videos(batch_size: int, dry_run: bool, restart: bool):
+    """Ejecutar las migraciones de video_url."""
+    for migration in (LessonVideoUrls(), EmbeddedLessonVideoUrls()):
+        print(f"\n📚 {migration.name}: {migration.description}")
+
+        report = await run_migration(
+            migration,
+            batch_size=batch_size,
+            dry_run=dry_run,
+            restart=restart,
+            on_batch=print_progress,
         )
 
-        if result.modified_count > 0:
-            print(f"  ✅ Curso actualizado exitosamente")
-        else:
-            print(f"  ℹ️  Curso no requería actualizaciones")
+        if report["status"] == "already_completed":
+            print("  ℹ️  Ya completada (usa --restart para volver a ejecutarla)")
+            continue
+        if report["resumed_from"]:
+            print(f"  ↪️  Reanudada desde _id {report['resumed_from']}")
+
+        action = "Se aplicarían" if dry_run else "Aplicadas"
+        print(f"  ✅ {action} {report['updates']} actualizaciones, {report['modified']} documentos modificados "
+              f"en {report['elapsed']:.1f}s ({report['docs_per_second']:.0f} docs/s)")
 
     print("\n✅ Proceso completado!")
-    client.close()
+    await MongoDB.disconnect()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Agregar videos de ejemplo a las lecciones sin video_url")
+    parser.add_argument("--batch-size", type=int, default=500,
+                        help="Documentos por lote (por defecto 500)")
+    parser.add_argument("--dry-run", action="store_true", help="Mostrar qué se actualizaría sin escribir nada")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignorar el checkpoint guardado y empezar desde el principio")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("ACTUALIZACIÓN DE VIDEOS EN LECCIONES")
     print("=" * 60)
-    asyncio.run(update_lessons_with_videos())
+    asyncio.run(update_lessons_with_videos(args.batch_size, args.dry_run, args.restart))
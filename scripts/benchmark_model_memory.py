@@ -0,0 +1,158 @@
+"""
+Benchmark de memoria de los modelos al cargar un catálogo grande.
+
+Reproduce un listado al estilo de get_all_courses: genera --courses
+documentos de curso con la forma que devuelve MongoDB (ObjectId, datetime,
+índice de lecciones embebido y reseñas), los convierte con Course.from_dict,
+descarta los documentos y lee solo los campos de tarjeta (title, price).
+Cada escenario se ejecuta en un proceso nuevo para que la memoria residente
+(RSS) de uno no contamine la del siguiente.
+
+Escenarios:
+- full: documentos completos, solo se leen title y price
+- full+lessons: documentos completos y además se recorren course.lessons y course.reviews
+- summary: documentos con COURSE_SUMMARY_PROJECTION (fields="summary")
+
+La medición empieza antes de generar los documentos. Para cada escenario se
+informa de la memoria Python que queda retenida al terminar (los objetos
+Course y los datos del documento que siguen referenciando), del pico
+(documentos y objetos a la vez), ambos con tracemalloc, y del incremento de
+RSS del proceso.
+Para comparar con otra versión de los modelos, ejecutar el script en ambas
+y comparar las columnas.
+
+Uso:
+    python scripts/benchmark_model_memory.py
+    python scripts/benchmark_model_memory.py --courses 50000 --lessons 20 --reviews 5
+
+No necesita base de datos. El RSS se lee de /proc (Linux).
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from bson import ObjectId
+
+from E_Learning_JCB_Reflex.models.course import Course
+
+SCENARIOS = ["full", "full+lessons", "summary"]
+
+
+def rss_bytes() -> int:
+    """Memoria residente actual del proceso."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def build_documents(courses: int, lessons: int, reviews: int, summary: bool = False) -> list:
+    """Generar documentos de curso con la forma que devuelve Motor (summary: sin arrays embebidos)."""
+    now = datetime(2026, 1, 1)
+    documents = []
+    for i in range(courses):
+        documents.append({
+            "_id": ObjectId(),
+            "title": f"Curso de programación número {i}",
+            "description": f"Descripción del curso {i}: aprende paso a paso con ejercicios prácticos.",
+            "image": f"https://cdn.elearningjcb.test/courses/{i}.jpg",
+            "price": float(i % 100),
+            "level": ("beginner", "intermediate", "advanced")[i % 3],
+            "category": "Programación",
+            "categories": ["Programación", "Python"],
+            "instructor": {"name": f"Instructor {i % 500}", "userId": ObjectId(), "email": f"i{i % 500}@x.test"},
+            "lessons": [
+                {"_id": ObjectId(), "title": f"Lección {j + 1}", "order": j + 1, "duration": 10 + j,
+                 "video_url": f"https://www.youtube.com/watch?v={i:06d}{j:04d}"}
+                for j in range(lessons)
+            ],
+            "reviews": [
+                {"_id": ObjectId(), "student": ObjectId(), "rating": 1 + (i + j) % 5,
+                 "comment": "Muy buen curso", "createdAt": now + timedelta(days=j)}
+                for j in range(reviews)
+            ],
+            "studentsEnrolled": i % 1000,
+            "averageRating": 4,
+            "totalReviews": reviews,
+            "createdAt": now + timedelta(minutes=i),
+        })
+        if summary:
+            del documents[-1]["lessons"], documents[-1]["reviews"]
+    return documents
+
+
+def run_scenario(scenario: str, args) -> dict:
+    """Ejecutar un escenario en este proceso y devolver sus mediciones."""
+    gc.collect()
+    rss_before = rss_bytes()
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    documents = build_documents(args.courses, args.lessons, args.reviews, summary=scenario == "summary")
+    courses = [Course.from_dict(doc, partial=scenario == "summary") for doc in documents]
+    del documents
+    checksum = sum(course.price for course in courses) + sum(len(course.title) for course in courses)
+    if scenario == "full+lessons":
+        checksum += sum(len(course.lessons) + len(course.reviews) for course in courses)
+    gc.collect()
+
+    result = {"scenario": scenario, "courses": len(courses), "checksum": checksum}
+    if args.tracemalloc:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result.update(retained=current, peak=peak)
+    else:
+        result["rss"] = rss_bytes() - rss_before
+    return result
+
+
+def run_in_subprocess(scenario: str, args, use_tracemalloc: bool) -> dict:
+    """Lanzar un escenario en un proceso nuevo y leer su resultado en JSON."""
+    command = [
+        sys.executable, __file__, "--run", scenario,
+        "--courses", str(args.courses), "--lessons", str(args.lessons), "--reviews", str(args.reviews),
+    ]
+    if use_tracemalloc:
+        command.append("--tracemalloc")
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args):
+    print(f"\n📦 {args.courses:,} cursos con {args.lessons} lecciones y {args.reviews} reseñas embebidas\n")
+    print(f"{'escenario':<14} {'retenido MB':>12} {'pico MB':>10} {'RSS MB':>10} {'bytes/curso':>12}")
+
+    for scenario in SCENARIOS:
+        traced = run_in_subprocess(scenario, args, use_tracemalloc=True)
+        rss = run_in_subprocess(scenario, args, use_tracemalloc=False)
+        mb = 1024 * 1024
+        print(f"{scenario:<14} {traced['retained'] / mb:>12.1f} {traced['peak'] / mb:>10.1f} "
+              f"{rss['rss'] / mb:>10.1f} {traced['retained'] / args.courses:>12.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memoria de los modelos al cargar un catálogo grande")
+    parser.add_argument("--courses", type=int, default=50000, help="Cursos a generar (por defecto 50000)")
+    parser.add_argument("--lessons", type=int, default=12, help="Lecciones embebidas por curso (por defecto 12)")
+    parser.add_argument("--reviews", type=int, default=3, help="Reseñas embebidas por curso (por defecto 3)")
+    parser.add_argument("--run", choices=SCENARIOS, help=argparse.SUPPRESS)
+    parser.add_argument("--tracemalloc", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print(json.dumps(run_scenario(args.run, args)))
+    else:
+        main(args)
@@ -0,0 +1,118 @@
+"""
+Benchmark del retraso del event loop durante una ráfaga de logins.
+
+Simula --logins verificaciones de contraseña concurrentes (lo que hace
+AuthState.handle_login) mientras una corrutina "latido" se despierta cada
+--tick-ms milisegundos y mide cuánto tarda de más en despertarse. Ese
+retraso es lo que perciben los websockets de los demás usuarios del worker.
+
+Se comparan dos modos:
+- sync: bcrypt llamado directamente en la corrutina (bloquea el event loop)
+- async: verify_password_async (pool de bcrypt acotado de utils/password.py)
+
+Con bcrypt en el event loop el retraso máximo crece con el tamaño de la
+ráfaga. Con el pool se mantiene plano en unos pocos milisegundos.
+
+Uso:
+    python scripts/benchmark_password_hashing.py
+    python scripts/benchmark_password_hashing.py --logins 50 --rounds 12
+
+El tamaño del pool y la cola se configuran con PASSWORD_HASH_WORKERS y
+PASSWORD_HASH_MAX_PENDING. No necesita base de datos.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.utils.password import (
+    PasswordHashingBusy,
+    get_password_hashing_stats,
+    hash_password,
+    verify_password,
+    verify_password_async,
+)
+
+PASSWORD = "benchmark123"
+
+
+async def heartbeat(tick: float, lags: list, stop: asyncio.Event):
+    """Dormir tick segundos en bucle y anotar cuánto se retrasa cada despertar."""
+    while not stop.is_set():
+        expected = time.perf_counter() + tick
+        await asyncio.sleep(tick)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def login_sync(hashed: str) -> bool:
+    """Login con bcrypt dentro de la corrutina (comportamiento anterior)."""
+    await asyncio.sleep(0)
+    return verify_password(PASSWORD, hashed)
+
+
+async def login_async(hashed: str) -> bool:
+    """Login con bcrypt en el pool dedicado."""
+    return await verify_password_async(PASSWORD, hashed)
+
+
+async def run_burst(mode: str, logins: int, hashed: str, tick: float):
+    """Lanzar la ráfaga en un modo y devolver (duración, lags, rechazados)."""
+    login = login_sync if mode == "sync" else login_async
+    lags = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(tick, lags, stop))
+    await asyncio.sleep(tick * 3)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login(hashed) for _ in range(logins)), return_exceptions=True)
+    duration = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+
+    rejected = sum(1 for result in results if isinstance(result, PasswordHashingBusy))
+    failed = sum(1 for result in results if result is not True and not isinstance(result, PasswordHashingBusy))
+    if failed:
+        print(f"⚠️  {failed} verificaciones fallaron en modo {mode}")
+    return duration, lags, rejected
+
+
+def report(mode: str, logins: int, duration: float, lags: list, rejected: int):
+    """Imprimir una fila de resultados."""
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(int(len(lags_ms) * 0.99), len(lags_ms) - 1)]
+    print(f"{mode:<6} {logins:>7} {duration:>9.2f} {logins / duration:>9.1f} "
+          f"{statistics.median(lags_ms):>10.1f} {p99:>10.1f} {lags_ms[-1]:>10.1f} {rejected:>9}")
+
+
+async def main(args):
+    hashed = hash_password(PASSWORD, rounds=args.rounds)
+    stats = get_password_hashing_stats()
+
+    print(f"\n🔐 bcrypt coste {args.rounds}, pool de {stats['workers']} hilos, "
+          f"máximo {stats['max_pending']} pendientes, latido cada {args.tick_ms} ms\n")
+    print(f"{'modo':<6} {'logins':>7} {'total s':>9} {'login/s':>9} "
+          f"{'lag p50 ms':>10} {'lag p99 ms':>10} {'lag max ms':>10} {'rechazos':>9}")
+
+    modes = ["sync", "async"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        duration, lags, rejected = await run_burst(mode, args.logins, hashed, args.tick_ms / 1000)
+        report(mode, args.logins, duration, lags, rejected)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Retraso del event loop durante una ráfaga de logins")
+    parser.add_argument("--logins", type=int, default=20, help="Logins concurrentes en la ráfaga (por defecto 20)")
+    parser.add_argument("--rounds", type=int, default=12, help="Coste de bcrypt del hash verificado (por defecto 12)")
+    parser.add_argument("--tick-ms", type=float, default=10, help="Intervalo del latido en ms (por defecto 10)")
+    parser.add_argument("--mode", choices=["sync", "async", "both"], default="both", help="Modo a medir")
+    args = parser.parse_args()
+
+    asyncio.run(main(args))
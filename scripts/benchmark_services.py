@@ -0,0 +1,176 @@
+"""
+Microbenchmark de servicios sobre el backend de base de datos en memoria.
+
+Ejecuta course_service y enrollment_service contra la base de datos en
+memoria (DATABASE_BACKEND=memory, ver E_Learning_JCB_Reflex/database/memory.py)
+para medir el coste de la lógica de los servicios sin red ni servidor
+MongoDB. Crea los índices declarados, genera cursos, estudiantes e
+inscripciones y ejecuta cada operación --iterations veces, mostrando
+operaciones por segundo y latencia media y p95 en microsegundos.
+
+La salida de los servicios (por ejemplo, el mensaje de cada inscripción) se
+descarta durante las mediciones para que no tape la tabla; el coste de
+formatearla sigue incluido, como en producción.
+
+Los números no sustituyen a una medición contra MongoDB (no incluyen red,
+BSON ni planificación de consultas del servidor): sirven para comparar
+cambios en la lógica de servicios y estados entre versiones.
+
+Uso:
+    python scripts/benchmark_services.py
+    python scripts/benchmark_services.py --courses 5000 --students 2000 --iterations 5000
+
+No necesita MONGODB_URI.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# El backend se elige al importar database/mongodb.py
+os.environ["DATABASE_BACKEND"] = "memory"
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from bson import ObjectId
+
+from E_Learning_JCB_Reflex.database import MongoDB, ensure_indexes
+from E_Learning_JCB_Reflex.services import course_service, enrollment_service
+
+
+async def seed(db, courses: int, students: int, enrollments_per_student: int):
+    """Generar cursos, estudiantes e inscripciones con el esquema de la aplicación."""
+    now = datetime.now(timezone.utc)
+    instructor_id = ObjectId()
+    levels = ["beginner", "intermediate", "advanced"]
+    topics = ["Python", "JavaScript", "React", "MongoDB", "Docker", "SQL", "Java", "Go"]
+
+    course_docs = [
+        {
+            "_id": ObjectId(),
+            "title": f"Curso de {topics[i % len(topics)]} {i}",
+            "description": f"Aprende {topics[i % len(topics)]} desde cero",
+            "image": "",
+            "price": float(i % 100),
+            "level": levels[i % len(levels)],
+            "category": topics[i % len(topics)],
+            "categories": [topics[i % len(topics)]],
+            "instructor": {"name": "Instructor Benchmark", "userId": instructor_id},
+            "lessons": [{"_id": ObjectId(), "title": f"Lección {j + 1}", "order": j + 1} for j in range(10)],
+            "studentsEnrolled": 0,
+            "createdAt": now - timedelta(minutes=i),
+        }
+        for i in range(courses)
+    ]
+    await db["courses"].insert_many(course_docs)
+
+    student_docs = [
+        {"_id": ObjectId(), "firstName": f"Estudiante {i}", "lastName": "Benchmark",
+         "email": f"student{i}@benchmark.test", "role": "student"}
+        for i in range(students)
+    ]
+    await db["users"].insert_many(student_docs)
+
+    course_ids = [course["_id"] for course in course_docs]
+    enrollments = []
+    for student in student_docs:
+        for course_id in random.sample(course_ids, min(enrollments_per_student, len(course_ids))):
+            enrollments.append(enrollment_service.new_enrollment(student["_id"], course_id))
+    await db["enrollments"].insert_many(enrollments, ordered=False)
+
+    return [str(course_id) for course_id in course_ids], [str(student["_id"]) for student in student_docs]
+
+
+async def measure(name: str, iterations: int, operation):
+    """Ejecutar operation(i) iterations veces e imprimir ops/s, media y p95."""
+    timings = []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        start = time.perf_counter()
+        for i in range(iterations):
+            begin = time.perf_counter()
+            await operation(i)
+            timings.append(time.perf_counter() - begin)
+        total = time.perf_counter() - start
+
+    timings.sort()
+    mean_us = total / iterations * 1e6
+    p95_us = timings[min(int(iterations * 0.95), iterations - 1)] * 1e6
+    print(f"{name:<42} {iterations / total:>10.0f} {mean_us:>10.1f} {p95_us:>10.1f}")
+
+
+async def run_benchmark(args):
+    """Preparar los datos y medir cada operación de los servicios."""
+    random.seed(args.seed)
+    db = MongoDB.get_db()
+    await ensure_indexes()
+
+    start = time.perf_counter()
+    course_ids, student_ids = await seed(db, args.courses, args.students, args.enrollments_per_student)
+    print(f"\n🌱 {args.courses} cursos, {args.students} estudiantes y "
+          f"{args.students * args.enrollments_per_student} inscripciones en {time.perf_counter() - start:.1f}s\n")
+
+    _, second_page_cursor = await course_service.get_course_catalog_page()
+    iterations = args.iterations
+
+    def random_student(i):
+        return student_ids[i % len(student_ids)]
+
+    def random_course(i):
+        return course_ids[(i * 7919) % len(course_ids)]
+
+    async def uncached_course(i):
+        await course_service.invalidate_course_cache(random_course(i))
+        await course_service.get_course_by_id(random_course(i))
+
+    async def enroll_cycle(i):
+        # Estudiante sin inscripciones previas en el curso: inscribir y desinscribir
+        student_id, course_id = enroll_student_id, random_course(i)
+        await enrollment_service.enroll_student(student_id, course_id)
+        await enrollment_service.unenroll_student(student_id, course_id)
+
+    enroll_student_id = str((await db["users"].insert_one(
+        {"firstName": "Nuevo", "lastName": "Benchmark", "email": "new@benchmark.test", "role": "student"}
+    )).inserted_id)
+
+    print(f"{'operación':<42} {'ops/s':>10} {'media µs':>10} {'p95 µs':>10}")
+    cases = [
+        ("get_course_catalog_page (primera)", lambda i: course_service.get_course_catalog_page()),
+        ("get_course_catalog_page (siguiente)",
+         lambda i: course_service.get_course_catalog_page(after=second_page_cursor)),
+        ("get_course_by_id (caché)", lambda i: course_service.get_course_by_id(random_course(i))),
+        ("get_course_by_id (sin caché)", uncached_course),
+        ("search_courses (página + total)", lambda i: course_service.search_courses("python", level="beginner")),
+        ("is_enrolled", lambda i: enrollment_service.is_enrolled(random_student(i), random_course(i))),
+        ("get_student_enrollments", lambda i: enrollment_service.get_student_enrollments(random_student(i))),
+        ("get_student_enrollment_summary",
+         lambda i: enrollment_service.get_student_enrollment_summary(random_student(i))),
+        ("get_course_students", lambda i: enrollment_service.get_course_students(random_course(i))),
+        ("count_unique_students (10 cursos)",
+         lambda i: enrollment_service.count_unique_students(course_ids[i % 50:i % 50 + 10])),
+        ("enroll_student + unenroll_student", enroll_cycle),
+    ]
+    for name, operation in cases:
+        await measure(name, iterations, operation)
+
+    await MongoDB.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmark de servicios con la base de datos en memoria")
+    parser.add_argument("--courses", type=int, default=2000, help="Cursos a generar (por defecto 2000)")
+    parser.add_argument("--students", type=int, default=1000, help="Estudiantes a generar (por defecto 1000)")
+    parser.add_argument("--enrollments-per-student", type=int, default=5,
+                        help="Inscripciones por estudiante (por defecto 5)")
+    parser.add_argument("--iterations", type=int, default=2000, help="Repeticiones de cada operación")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla aleatoria")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args))
@@ -0,0 +1,102 @@
+"""
+Benchmark de round trips de get_student_enrollments.
+
+Crea cursos y un estudiante temporales, inscribe al estudiante en N cursos
+(colección enrollments) y cuenta, mediante la monitorización de comandos de
+PyMongo, cuántos comandos envía get_student_enrollments a MongoDB al pedir
+una página de N cursos. El número de round trips debe ser constante (2) sea
+cual sea N. Al terminar elimina los datos temporales.
+
+Uso:
+    python scripts/benchmark_student_enrollments.py [N1 N2 ...]
+
+Requiere MONGODB_URI apuntando a una base de datos de pruebas.
+"""
+
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pymongo import monitoring
+from motor.motor_asyncio import AsyncIOMotorClient
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB
+from E_Learning_JCB_Reflex.database.mongodb import MONGODB_URI
+from E_Learning_JCB_Reflex.services.enrollment_service import get_student_enrollments
+
+
+class CommandCounter(monitoring.CommandListener):
+    """Cuenta los comandos de lectura enviados al servidor."""
+
+    def __init__(self):
+        self.commands = []
+
+    def started(self, event):
+        if event.command_name in ("find", "aggregate", "getMore"):
+            self.commands.append(event.command_name)
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+async def run_benchmark(sizes):
+    """Medir round trips y latencia para cada número de inscripciones."""
+    counter = CommandCounter()
+
+    # Sustituir el cliente compartido por uno con el listener registrado
+    MongoDB.client = AsyncIOMotorClient(MONGODB_URI, event_listeners=[counter])
+    MongoDB.db = MongoDB.client.get_default_database()
+    db = MongoDB.db
+
+    tag = f"benchmark-enrollments-{int(time.time())}"
+    max_size = max(sizes)
+
+    courses = [
+        {"title": f"Curso {i}", "description": tag, "price": 0, "level": "beginner", "instructor": {"name": "Bench"}}
+        for i in range(max_size)
+    ]
+    course_ids = (await db["courses"].insert_many(courses)).inserted_ids
+
+    print(f"{'inscripciones':>14} {'comandos':>9} {'ms':>8}")
+    try:
+        for size in sizes:
+            student = {
+                "firstName": "Bench",
+                "lastName": tag,
+                "email": f"{tag}-{size}@example.com",
+                "role": "student",
+            }
+            user_id = (await db["users"].insert_one(student)).inserted_id
+            await db["enrollments"].insert_many([
+                {"userId": user_id, "courseId": cid, "enrolledAt": datetime.now(timezone.utc),
+                 "progress": 0, "completedLessons": [], "status": "active"}
+                for cid in course_ids[:size]
+            ])
+
+            counter.commands.clear()
+            start = time.perf_counter()
+            result, _ = await get_student_enrollments(str(user_id), page_size=size)
+            elapsed = (time.perf_counter() - start) * 1000
+
+            assert len(result) == size, f"esperadas {size} inscripciones, obtenidas {len(result)}"
+            print(f"{size:>14} {len(counter.commands):>9} {elapsed:>8.1f}")
+
+            await db["users"].delete_one({"_id": user_id})
+            await db["enrollments"].delete_many({"userId": user_id})
+    finally:
+        await db["courses"].delete_many({"description": tag})
+        await MongoDB.disconnect()
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1, 10, 40, 100]
+    asyncio.run(run_benchmark(sizes))
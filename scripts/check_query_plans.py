@@ -0,0 +1,333 @@
+"""
+Comprobación de planes de consulta de los servicios (regresiones a COLLSCAN).
+
+Crea una base de datos temporal con datos de prueba y sus índices
+(database/indexes.py), ejecuta cada función pública de course_service,
+user_service, enrollment_service y contact_service, captura con la
+monitorización de comandos de PyMongo las consultas que envían y vuelve a
+ejecutar cada una con explain("executionStats"). La comprobación falla si:
+
+- algún plan usa COLLSCAN (salvo las funciones que leen la colección entera
+  por diseño, listadas en FULL_SCAN_ALLOWED), o
+- algún plan examina más de --max-ratio documentos por documento devuelto, o
+- alguna función pública no tiene caso definido en build_cases().
+
+Las agregaciones que reducen documentos ($group, $count) no se evalúan por
+ratio, ya que devuelven un único resultado por diseño.
+
+Al terminar elimina la base de datos temporal.
+
+Uso:
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --max-ratio 5 --db elearning_query_plans
+
+Requiere MONGODB_URI apuntando a un servidor de pruebas (por ejemplo un mongod local).
+"""
+
+import argparse
+import asyncio
+import inspect
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from bson import ObjectId
+from pymongo import monitoring
+from motor.motor_asyncio import AsyncIOMotorClient
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB, ensure_indexes
+from E_Learning_JCB_Reflex.database.mongodb import MONGODB_URI
+from E_Learning_JCB_Reflex.services import (
+    contact_service,
+    course_service,
+    enrollment_service,
+    user_service,
+)
+from E_Learning_JCB_Reflex.services.stats_service import rebuild_platform_stats
+from E_Learning_JCB_Reflex.utils.password import hash_password
+
+SERVICES = [course_service, user_service, enrollment_service, contact_service]
+
+# Comandos con plan de consulta que se pueden pasar a explain
+EXPLAINABLE = {"find", "aggregate", "count", "distinct", "update", "delete", "findAndModify"}
+
+# Campos de sesión y transporte que explain no acepta
+SESSION_FIELDS = {
+    "$db", "lsid", "$clusterTime", "txnNumber", "autocommit", "startTransaction",
+    "$readPreference", "readConcern", "writeConcern", "ordered",
+}
+
+# Funciones que leen toda la colección por diseño
+FULL_SCAN_ALLOWED = {"get_all_courses", "get_popular_courses", "count_courses"}
+
+# Funciones que no consultan MongoDB
+NO_QUERIES = {"get_course_cache_stats", "course_cache_lifespan", "invalidate_course_cache",
+              "invalidate_courses_cache", "invalidate_catalog_cache"}
+
+PASSWORD = "query-plans-123"
+
+
+class CommandRecorder(monitoring.CommandListener):
+    """Guarda los comandos enviados mientras la grabación está activa."""
+
+    def __init__(self):
+        self.active = False
+        self.commands = []
+
+    def started(self, event):
+        if self.active and event.command_name in EXPLAINABLE:
+            self.commands.append((event.command_name, dict(event.command)))
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+async def seed(db) -> dict:
+    """Insertar datos de prueba y devolver IDs de referencia para los casos."""
+    now = datetime.now(timezone.utc)
+    hashed = hash_password(PASSWORD)
+
+    instructors = [
+        {"_id": ObjectId(), "firstName": "Instructor", "lastName": str(i), "email": f"instructor{i}@plans.test",
+         "password": hashed, "role": "instructor", "coursesCreated": []}
+        for i in range(10)
+    ]
+    courses = []
+    for i in range(200):
+        instructor = instructors[i % len(instructors)]
+        course = {
+            "_id": ObjectId(),
+            "title": f"Curso {i} de {'python' if i % 5 == 0 else 'diseño'}",
+            "description": "Descripción del curso de prueba",
+            "instructor": {"name": f"Instructor {i % 10}", "userId": instructor["_id"]},
+            "price": 10 + i,
+            "level": ["beginner", "intermediate", "advanced"][i % 3],
+            "category": f"cat{i % 8}",
+            "categories": [f"cat{i % 8}"],
+            "lessons": [{"title": f"Lección {n}", "content": "..."} for n in range(5)],
+            "studentsEnrolled": 0,
+            "createdAt": now - timedelta(days=i),
+        }
+        instructor["coursesCreated"].append(course["_id"])
+        courses.append(course)
+
+    students = []
+    enrollments = []
+    for i in range(500):
+        student = {
+            "_id": ObjectId(), "firstName": "Alumno", "lastName": str(i), "email": f"student{i}@plans.test",
+            "password": hashed, "role": "student",
+        }
+        students.append(student)
+        for c in random.sample(courses, 3):
+            enrollments.append({
+                "userId": student["_id"], "courseId": c["_id"], "enrolledAt": now - timedelta(minutes=i),
+                "progress": 0, "completedLessons": [], "status": "active",
+            })
+            c["studentsEnrolled"] += 1
+    admins = [{"_id": ObjectId(), "firstName": "Admin", "lastName": "0", "email": "admin@plans.test",
+               "password": hashed, "role": "admin"}]
+    contacts = [
+        {"name": f"Contacto {i}", "email": f"contact{i % 50}@plans.test", "message": "Hola", "createdAt": now - timedelta(hours=i)}
+        for i in range(300)
+    ]
+
+    await db["users"].insert_many(instructors + students + admins)
+    await db["courses"].insert_many(courses)
+    await db["contacts"].insert_many(contacts)
+    await db["enrollments"].insert_many(enrollments)
+
+    return {
+        "student": str(students[0]["_id"]),
+        "student_enrolled_course": str(enrollments[0]["courseId"]),
+        "student_enrollments_cursor": f"{int(enrollments[0]['enrolledAt'].timestamp() * 1000)}:{enrollments[0]['_id']}",
+        "other_student": str(students[1]["_id"]),
+        "instructor": str(instructors[0]["_id"]),
+        "course": str(courses[0]["_id"]),
+        "other_course": str(courses[1]["_id"]),
+        "disposable_course": str(courses[-1]["_id"]),
+        "disposable_user": str(students[-1]["_id"]),
+        "course_ids": [str(c["_id"]) for c in courses[:20]],
+        "user_ids": [str(s["_id"]) for s in students[:20]],
+    }
+
+
+def build_cases(ids: dict) -> dict:
+    """Argumentos de cada función pública (los casos se ejecutan en este orden)."""
+    return {
+        # course_service
+        "get_popular_courses": lambda: ((), {}),
+        "get_all_courses": lambda: ((), {}),
+        "get_course_catalog_page": lambda: ((), {"after": ids["course"]}),
+        "search_courses": lambda: (("python",), {"level": "beginner"}),
+        "count_courses": lambda: ((), {}),
+        "get_course_by_id": lambda: ((ids["course"],), {}),
+        "get_courses_by_ids": lambda: ((ids["course_ids"],), {}),
+        "get_courses_by_instructor": lambda: ((ids["instructor"],), {}),
+        "create_course": lambda: (({"title": "Nuevo", "description": "", "instructor": {"name": "X"},
+                                    "categories": ["cat1"], "lessons": []},), {}),
+        "update_course": lambda: ((ids["course"], {"price": 99}), {}),
+        "delete_course": lambda: ((ids["disposable_course"],), {}),
+        # user_service
+        "get_user_by_id": lambda: ((ids["student"],), {}),
+        "get_users_by_ids": lambda: ((ids["user_ids"],), {}),
+        "get_user_name": lambda: ((ids["student"],), {}),
+        "get_all_students": lambda: ((), {}),
+        "get_all_instructors": lambda: ((), {}),
+        "get_user_by_email": lambda: (("student3@plans.test",), {}),
+        "get_all_admins": lambda: ((), {}),
+        "create_user": lambda: (("Nuevo", "Usuario", "nuevo@plans.test", PASSWORD), {}),
+        "update_user": lambda: ((ids["student"], {"firstName": "Cambio"}), {}),
+        "change_password": lambda: ((ids["student"], PASSWORD, PASSWORD), {}),
+        "admin_change_password": lambda: ((ids["student"], PASSWORD), {}),
+        "delete_user": lambda: ((ids["disposable_user"],), {}),
+        # enrollment_service
+        "enroll_student": lambda: ((ids["other_student"], ids["course"]), {}),
+        "bulk_enroll": lambda: (([(ids["other_student"], ids["other_course"])],), {}),
+        "unenroll_student": lambda: ((ids["other_student"], ids["course"]), {}),
+        "is_enrolled": lambda: ((ids["student"], ids["student_enrolled_course"]), {}),
+        "get_student_enrollments": lambda: ((ids["student"],), {"after": ids["student_enrollments_cursor"]}),
+        "get_student_enrollment_summary": lambda: ((ids["student"],), {}),
+        "get_course_students": lambda: ((ids["student_enrolled_course"],), {}),
+        "count_unique_students": lambda: ((ids["course_ids"],), {}),
+        "count_total_enrollments": lambda: ((), {}),
+        # contact_service
+        "create_contact": lambda: (("Nuevo", "contact1@plans.test", "Hola"), {}),
+        "get_all_contacts": lambda: ((), {}),
+        "get_contact_by_email": lambda: (("contact1@plans.test",), {}),
+    }
+
+
+def public_functions() -> dict:
+    """Funciones asíncronas públicas definidas en cada servicio."""
+    functions = {}
+    for module in SERVICES:
+        for name, function in inspect.getmembers(module, inspect.iscoroutinefunction):
+            if not name.startswith("_") and function.__module__ == module.__name__ and name not in NO_QUERIES:
+                functions[name] = function
+    return functions
+
+
+def explain_commands(command_name: str, command: dict) -> list:
+    """Preparar el comando (o uno por sentencia si es una escritura múltiple) para explain."""
+    command = {k: v for k, v in command.items() if k not in SESSION_FIELDS}
+    if command_name in ("update", "delete"):
+        statements_field = "updates" if command_name == "update" else "deletes"
+        return [{**command, statements_field: [statement]} for statement in command[statements_field]]
+    return [command]
+
+
+def walk_plan(node, stages: set, stats: list):
+    """Recorrer la salida de explain recogiendo etapas y executionStats (sin planes rechazados)."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "rejectedPlans":
+                continue
+            if key == "stage" and isinstance(value, str):
+                stages.add(value)
+            if key == "executionStats" and isinstance(value, dict) and "totalDocsExamined" in value:
+                stats.append(value)
+            walk_plan(value, stages, stats)
+    elif isinstance(node, list):
+        for item in node:
+            walk_plan(item, stages, stats)
+
+
+async def check_plans(db_name: str, max_ratio: float) -> bool:
+    """Sembrar la base de datos temporal, ejecutar los casos y analizar los planes."""
+    recorder = CommandRecorder()
+
+    # Sustituir el cliente compartido por uno con el listener y la base de datos temporal
+    MongoDB.client = AsyncIOMotorClient(MONGODB_URI, event_listeners=[recorder])
+    default_db = MongoDB.client.get_default_database("elearning")
+    if db_name == default_db.name:
+        print(f"❌ La base de datos {db_name} es la de la aplicación; usa otra con --db")
+        return False
+    MongoDB.db = MongoDB.client[db_name]
+    db = MongoDB.db
+
+    await MongoDB.client.drop_database(db_name)
+    ids = await seed(db)
+    if await ensure_indexes():
+        print("❌ No se pudieron crear los índices")
+        return False
+    await rebuild_platform_stats()
+
+    cases = build_cases(ids)
+    functions = public_functions()
+    failures = []
+
+    print(f"🔍 Comprobando planes de consulta en {db_name} (ratio máximo {max_ratio})\n")
+
+    for name in sorted(set(functions) - set(cases)):
+        failures.append(f"{name}: sin caso definido en build_cases()")
+
+    for name, make_args in cases.items():
+        if name not in functions:
+            continue
+
+        args, kwargs = make_args()
+        course_service._course_cache.clear()
+        recorder.commands.clear()
+        recorder.active = True
+        await functions[name](*args, **kwargs)
+        recorder.active = False
+
+        for command_name, command in list(recorder.commands):
+            collection = str(command.get(command_name))
+            reduces = command_name == "aggregate" and any(
+                "$group" in stage or "$count" in stage for stage in command.get("pipeline", [])
+            )
+            for explain_target in explain_commands(command_name, command):
+                explain = await db.command({"explain": explain_target, "verbosity": "executionStats"})
+
+                stages, stats = set(), []
+                walk_plan(explain, stages, stats)
+                examined = sum(s.get("totalDocsExamined", 0) for s in stats)
+                returned = sum(s.get("nReturned", 0) for s in stats)
+                ratio = examined / max(returned, 1)
+
+                problems = []
+                if "COLLSCAN" in stages and name not in FULL_SCAN_ALLOWED:
+                    problems.append("COLLSCAN")
+                if ratio > max_ratio and not reduces and name not in FULL_SCAN_ALLOWED:
+                    problems.append(f"ratio {ratio:.1f} > {max_ratio}")
+
+                status = "❌" if problems else "✅"
+                print(
+                    f"  {status} {name:<26} {command_name:<14} {collection:<16} "
+                    f"{examined:>6}/{returned:<6} {','.join(sorted(stages))}"
+                )
+                if problems:
+                    failures.append(f"{name} ({command_name} {collection}): {', '.join(problems)}")
+
+    await MongoDB.client.drop_database(db_name)
+    await MongoDB.disconnect()
+
+    if failures:
+        print("\n❌ Problemas encontrados:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return False
+
+    print("\n✅ Todas las consultas usan índices")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Comprobar que las consultas de los servicios usan índices")
+    parser.add_argument("--max-ratio", type=float, default=10.0,
+                        help="Máximo de documentos examinados por documento devuelto (por defecto 10)")
+    parser.add_argument("--db", default="elearning_query_plans",
+                        help="Base de datos temporal (se borra al empezar y al terminar)")
+    args = parser.parse_args()
+
+    sys.exit(0 if asyncio.run(check_plans(args.db, args.max_ratio)) else 1)
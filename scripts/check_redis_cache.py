@@ -0,0 +1,130 @@
+"""
+Comprobación de la caché compartida de cursos contra un redis-server local.
+
+Crea un curso temporal y simula dos workers vaciando la caché en memoria entre
+lecturas, para verificar que:
+1. La segunda lectura de get_course_by_id se sirve desde Redis (sin find en MongoDB)
+2. update_course incrementa la versión del curso y la lectura siguiente ve el cambio
+3. La invalidación se publica por pub/sub y la recibe el listener de otro worker
+4. Sin Redis disponible, get_course_by_id sigue funcionando contra MongoDB
+
+Al terminar elimina el curso temporal.
+
+Uso:
+    REDIS_URL=redis://localhost:6379/0 python scripts/check_redis_cache.py
+
+Requiere MONGODB_URI apuntando a una base de datos de pruebas.
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from pymongo import monitoring
+from motor.motor_asyncio import AsyncIOMotorClient
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB, RedisCache
+from E_Learning_JCB_Reflex.database.mongodb import MONGODB_URI
+from E_Learning_JCB_Reflex.database import redis_cache
+from E_Learning_JCB_Reflex.services import course_service
+from E_Learning_JCB_Reflex.services.course_service import (
+    COURSE_INVALIDATION_CHANNEL,
+    get_course_by_id,
+    update_course,
+)
+
+
+class FindCounter(monitoring.CommandListener):
+    """Cuenta los comandos find enviados a MongoDB."""
+
+    def __init__(self):
+        self.finds = 0
+
+    def started(self, event):
+        if event.command_name == "find":
+            self.finds += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+
+def check(label: str, ok: bool):
+    """Mostrar el resultado de una comprobación."""
+    print(f"  {'✅' if ok else '❌'} {label}")
+    return ok
+
+
+async def run_checks():
+    """Ejecutar las comprobaciones de la caché compartida."""
+    if not RedisCache.enabled():
+        print("❌ REDIS_URL no está configurada o la librería redis no está instalada")
+        return False
+
+    counter = FindCounter()
+
+    # Sustituir el cliente compartido por uno con el listener registrado
+    MongoDB.client = AsyncIOMotorClient(MONGODB_URI, event_listeners=[counter])
+    MongoDB.db = MongoDB.client.get_default_database()
+    courses = MongoDB.db["courses"]
+
+    result = await courses.insert_one({
+        "title": f"check-redis-cache-{int(time.time())}",
+        "description": "Curso temporal",
+        "instructor": {"name": "Cache Check"},
+        "price": 10,
+        "studentsEnrolled": 0,
+    })
+    course_id = str(result.inserted_id)
+
+    # Otro "worker" escuchando invalidaciones
+    received = []
+    listener = asyncio.create_task(RedisCache.listen(COURSE_INVALIDATION_CHANNEL, received.append))
+    await asyncio.sleep(0.5)
+
+    all_ok = True
+    try:
+        print("🔍 Comprobando la caché compartida de cursos\n")
+
+        await get_course_by_id(course_id)
+        course_service._course_cache.clear()  # simular otro worker sin caché local
+        finds_before = counter.finds
+        course = await get_course_by_id(course_id)
+        all_ok &= check("Segunda lectura servida desde Redis", course is not None and counter.finds == finds_before)
+
+        await update_course(course_id, {"price": 20})
+        course_service._course_cache.clear()
+        course = await get_course_by_id(course_id)
+        all_ok &= check("La lectura tras update_course ve el nuevo precio", course is not None and course.price == 20)
+
+        await asyncio.sleep(0.5)
+        all_ok &= check("Invalidación recibida por pub/sub", course_id in received)
+
+        # Simular Redis caído: la lectura debe ir a MongoDB sin error
+        await RedisCache.close()
+        original_url = redis_cache.REDIS_URL
+        redis_cache.REDIS_URL = "redis://127.0.0.1:1/0"
+        course_service._course_cache.clear()
+        course = await get_course_by_id(course_id)
+        all_ok &= check("Sin Redis, get_course_by_id recurre a MongoDB", course is not None and course.price == 20)
+        redis_cache.REDIS_URL = original_url
+    finally:
+        listener.cancel()
+        await asyncio.gather(listener, return_exceptions=True)
+        await courses.delete_one({"_id": result.inserted_id})
+        await RedisCache.close()
+        await MongoDB.disconnect()
+
+    print(f"\n{'✅ Todas las comprobaciones correctas' if all_ok else '❌ Alguna comprobación ha fallado'}")
+    return all_ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(run_checks()) else 1)
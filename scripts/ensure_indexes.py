@@ -0,0 +1,78 @@
+"""
+Script para crear y verificar los índices de MongoDB.
+
+Crea los índices declarados en database/indexes.py que falten y muestra un
+informe con los índices ausentes, los no declarados y los que no se han usado
+desde el último reinicio del servidor.
+
+Con --check no crea nada: solo verifica y termina con código 1 si falta algún
+índice declarado o si existe con otras opciones (por ejemplo, un índice de
+texto sin los pesos declarados o un índice de email no único), para usarlo en
+CI o antes de un despliegue.
+
+Los índices discrepantes no se tocan salvo con --replace-mismatched, que los
+elimina y crea los declarados. Eliminar un índice único o de texto deja las
+consultas sin él mientras se reconstruye: hacerlo en una ventana de
+mantenimiento.
+
+Uso:
+    python scripts/ensure_indexes.py
+    python scripts/ensure_indexes.py --check
+    python scripts/ensure_indexes.py --replace-mismatched
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB, ensure_indexes, verify_indexes
+
+
+async def main(check_only: bool, replace_mismatched: bool) -> int:
+    """Crear (salvo en modo --check) y verificar los índices."""
+    exit_code = 0
+
+    if not check_only:
+        print("🔧 Creando índices que falten...\n")
+        errors = await ensure_indexes(replace_mismatched=replace_mismatched)
+        for collection_name, messages in errors.items():
+            for message in messages:
+                print(f"  ❌ {collection_name}: {message}")
+        if errors:
+            exit_code = 1
+
+    print("\n🔍 Verificando índices...\n")
+    report = await verify_indexes()
+
+    for name in report["missing"]:
+        print(f"  ❌ Falta el índice {name}")
+    for name in report["mismatched"]:
+        print(f"  ❌ Índice con otras opciones: {name}")
+    for name in report["undeclared"]:
+        print(f"  ⚠️  Índice no declarado: {name}")
+    for name in report["unused"]:
+        print(f"  ⚠️  Índice sin uso desde el último reinicio: {name}")
+
+    if report["missing"] or report["mismatched"]:
+        exit_code = 1
+    elif exit_code == 0:
+        print("  ✅ Todos los índices declarados existen con sus opciones")
+
+    await MongoDB.disconnect()
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crear y verificar los índices de MongoDB")
+    parser.add_argument("--check", action="store_true",
+                        help="Solo verificar; código 1 si falta algún índice o tiene otras opciones")
+    parser.add_argument("--replace-mismatched", action="store_true",
+                        help="Eliminar los índices con otras opciones y crear los declarados")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.check, args.replace_mismatched)))
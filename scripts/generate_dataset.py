@@ -0,0 +1,446 @@
+"""
+Generador de datos sintéticos a gran escala para pruebas de capacidad.
+
+Crea en una base de datos aparte usuarios (estudiantes, instructores y un
+administrador), cursos con sus lecciones, inscripciones y reseñas con el
+mismo esquema que usa la aplicación, para reproducir en local problemas de
+rendimiento que solo aparecen con volúmenes de producción.
+
+- Las inserciones se hacen con insert_many no ordenado en lotes de
+  --batch-size documentos, con hasta --concurrency lotes en vuelo.
+- Las contraseñas salen de un pool de hashes bcrypt precalculados (todos de
+  SYNTHETIC_PASSWORD), así que no se paga un hash por usuario y todos los
+  usuarios pueden iniciar sesión.
+- Con la misma --seed se generan los mismos datos, incluidos los _id
+  (ObjectId derivados del tipo de documento y su posición); solo cambian
+  los hashes de contraseña, que llevan una sal aleatoria.
+- La popularidad de los cursos sigue una distribución de Zipf (--zipf): unos
+  pocos cursos concentran la mayoría de inscripciones y reseñas, como en
+  producción. Las reseñas solo las escriben estudiantes inscritos.
+- Los contadores de los cursos (studentsEnrolled, totalReviews, ratingSum,
+  ratingHistogram, averageRating) se calculan durante la generación, y al
+  terminar se crean los índices declarados y se reconstruye platform_stats.
+
+Uso:
+    python scripts/generate_dataset.py
+    python scripts/generate_dataset.py --students 1000000 --instructors 10000 \\
+        --courses 50000 --enrollments 5000000 --reviews 500000 --drop
+    python scripts/generate_dataset.py --db elearning_capacity --seed 7 --zipf 1.2
+
+Requiere MONGODB_URI apuntando a un servidor de pruebas (por ejemplo un mongod
+local). La base de datos de la aplicación no se puede usar como destino.
+"""
+
+import argparse
+import asyncio
+import itertools
+import random
+import struct
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from bson import ObjectId
+from motor.motor_asyncio import AsyncIOMotorClient
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB, ensure_indexes
+from E_Learning_JCB_Reflex.database.mongodb import MONGODB_URI
+from E_Learning_JCB_Reflex.services.stats_service import rebuild_platform_stats
+from E_Learning_JCB_Reflex.utils.password import hash_password
+
+# Contraseña de todos los usuarios generados
+SYNTHETIC_PASSWORD = "synthetic123"
+
+# Dominio de los emails generados
+EMAIL_DOMAIN = "synthetic.elearningjcb.test"
+
+# Fecha de referencia de los datos generados (los cursos se crean en los 3 años anteriores)
+BASE_DATE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+HISTORY_DAYS = 3 * 365
+
+# Prefijo de los ObjectId por tipo de documento (deben ser distintos entre sí)
+OID_KINDS = {"user": 1, "course": 2, "lesson": 3, "enrollment": 4, "review": 5}
+
+FIRST_NAMES = [
+    "María", "Carlos", "Ana", "Luis", "Lucía", "Javier", "Carmen", "Pablo", "Elena", "Diego",
+    "Sofía", "Miguel", "Laura", "Andrés", "Paula", "Jorge", "Marta", "Raúl", "Isabel", "Hugo",
+]
+LAST_NAMES = [
+    "García", "Rodríguez", "Martínez", "López", "Sánchez", "Pérez", "Gómez", "Martín", "Jiménez",
+    "Ruiz", "Hernández", "Díaz", "Moreno", "Álvarez", "Romero", "Navarro", "Torres", "Castro",
+]
+TOPICS = [
+    "Python", "JavaScript", "React", "Node.js", "MongoDB", "SQL", "Docker", "Kubernetes",
+    "Machine Learning", "Diseño UX", "Figma", "Marketing Digital", "Excel", "Finanzas",
+    "Fotografía", "Inglés", "Data Science", "Ciberseguridad", "Go", "Rust",
+]
+CATEGORIES = [
+    "programacion", "desarrollo-web", "datos", "devops", "diseno", "negocios", "marketing",
+    "idiomas", "fotografia", "seguridad",
+]
+LEVELS = ["beginner", "intermediate", "advanced"]
+LESSON_VIDEOS = [
+    "https://www.youtube.com/watch?v=qz0aGYrrlhU",
+    "https://www.youtube.com/watch?v=W6NZfCO5SIk",
+    "https://www.youtube.com/watch?v=ExsyufNRoMw",
+]
+REVIEW_COMMENTS = [
+    "Muy buen curso, lo recomiendo.", "Explicaciones claras y ejemplos útiles.",
+    "Le faltan ejercicios prácticos.", "Demasiado básico para mi nivel.",
+    "Excelente instructor.", "Contenido desactualizado en algunas lecciones.", "",
+]
+# Probabilidad de cada calificación (1 a 5 estrellas)
+RATING_WEIGHTS = [0.05, 0.07, 0.15, 0.33, 0.40]
+
+
+def make_object_id(kind: str, index: int) -> ObjectId:
+    """
+    ObjectId determinista para el documento número index de un tipo.
+
+    Los 4 primeros bytes son una marca de tiempo creciente con index (como
+    en los ObjectId reales, el orden de _id sigue el orden de inserción), el
+    siguiente byte es el tipo y los 7 restantes el índice.
+    """
+    timestamp = int(BASE_DATE.timestamp()) - HISTORY_DAYS * 86400 + index // 1000
+    return ObjectId(struct.pack(">IB", timestamp, OID_KINDS[kind]) + index.to_bytes(7, "big"))
+
+
+def zipf_cum_weights(size: int, exponent: float, rng: random.Random) -> list:
+    """
+    Pesos acumulados de una distribución de Zipf sobre size elementos.
+
+    El elemento de rango r tiene peso 1 / r^exponent. Los rangos se reparten
+    al azar entre los elementos para que la popularidad no dependa del _id.
+    """
+    ranks = list(range(1, size + 1))
+    rng.shuffle(ranks)
+    return list(itertools.accumulate(1 / rank ** exponent for rank in ranks))
+
+
+class BatchWriter:
+    """Acumula documentos por colección y los inserta con insert_many no ordenado."""
+
+    def __init__(self, db, batch_size: int, concurrency: int):
+        self.db = db
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.buffers = defaultdict(list)
+        self.inflight = set()
+        self.inserted = defaultdict(int)
+        self.start = time.perf_counter()
+
+    async def add(self, collection: str, document: dict):
+        """Añadir un documento y enviar el lote si está lleno."""
+        buffer = self.buffers[collection]
+        buffer.append(document)
+        if len(buffer) >= self.batch_size:
+            await self.flush(collection)
+
+    async def flush(self, collection: str):
+        """Enviar el lote pendiente de una colección sin superar la concurrencia."""
+        documents = self.buffers.pop(collection, [])
+        if not documents:
+            return
+
+        while len(self.inflight) >= self.concurrency:
+            done, self.inflight = await asyncio.wait(self.inflight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+
+        self.inflight.add(asyncio.create_task(self.db[collection].insert_many(documents, ordered=False)))
+        self.inserted[collection] += len(documents)
+
+    async def close(self):
+        """Enviar todos los lotes pendientes y esperar a que terminen."""
+        for collection in list(self.buffers):
+            await self.flush(collection)
+        if self.inflight:
+            for result in await asyncio.gather(*self.inflight, return_exceptions=True):
+                if isinstance(result, Exception):
+                    raise result
+        self.inflight = set()
+
+    def report(self, collection: str) -> str:
+        """Línea de progreso con documentos insertados y velocidad."""
+        total = sum(self.inserted.values())
+        elapsed = time.perf_counter() - self.start
+        return (f"  📦 {collection}: {self.inserted[collection]:,} "
+                f"(total {total:,}, {total / max(elapsed, 1e-9):,.0f} docs/s)")
+
+
+def person_name(rng: random.Random) -> tuple:
+    """Nombre y apellido aleatorios."""
+    return rng.choice(FIRST_NAMES), f"{rng.choice(LAST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+
+async def generate(args) -> dict:
+    """Generar el conjunto de datos completo y devolver los totales insertados."""
+    rng = random.Random(args.seed)
+    db = MongoDB.get_db()
+    writer = BatchWriter(db, args.batch_size, args.concurrency)
+    progress_every = max(args.batch_size * 20, 1)
+
+    print(f"🔐 Precalculando {args.password_pool} hashes de contraseña...")
+    password_pool = [hash_password(SYNTHETIC_PASSWORD) for _ in range(args.password_pool)]
+
+    def created_at(days_ago_max: int = HISTORY_DAYS) -> datetime:
+        return BASE_DATE - timedelta(seconds=rng.randrange(days_ago_max * 86400))
+
+    # Asignación de cursos a instructores (también con Zipf: pocos instructores crean muchos cursos)
+    instructor_weights = zipf_cum_weights(args.instructors, 1.0, rng)
+    course_instructor = rng.choices(range(args.instructors), cum_weights=instructor_weights, k=args.courses)
+    courses_by_instructor = defaultdict(list)
+    for course_index, instructor_index in enumerate(course_instructor):
+        courses_by_instructor[instructor_index].append(make_object_id("course", course_index))
+
+    # --- Usuarios -----------------------------------------------------------
+    print(f"\n👤 Generando {args.instructors:,} instructores y {args.students:,} estudiantes...")
+    instructors = []
+    for index in range(args.instructors):
+        first_name, last_name = person_name(rng)
+        instructor = {
+            "_id": make_object_id("user", index),
+            "firstName": first_name,
+            "lastName": last_name,
+            "email": f"instructor{index}@{EMAIL_DOMAIN}",
+            "password": rng.choice(password_pool),
+            "role": "instructor",
+            "createdAt": created_at(),
+            "instructorProfile": {
+                "bio": f"Instructor de {rng.choice(TOPICS)}",
+                "expertise": rng.choice(TOPICS),
+                "avatarUrl": "",
+            },
+        }
+        if courses_by_instructor.get(index):
+            instructor["coursesCreated"] = courses_by_instructor[index]
+        instructors.append(instructor)
+        await writer.add("users", instructor)
+
+    await writer.add("users", {
+        "_id": make_object_id("user", args.instructors),
+        "firstName": "Admin",
+        "lastName": "Sintético",
+        "email": f"admin@{EMAIL_DOMAIN}",
+        "password": rng.choice(password_pool),
+        "role": "admin",
+        "createdAt": BASE_DATE - timedelta(days=HISTORY_DAYS),
+    })
+
+    student_offset = args.instructors + 1
+    for index in range(args.students):
+        first_name, last_name = person_name(rng)
+        await writer.add("users", {
+            "_id": make_object_id("user", student_offset + index),
+            "firstName": first_name,
+            "lastName": last_name,
+            "email": f"student{index}@{EMAIL_DOMAIN}",
+            "password": rng.choice(password_pool),
+            "role": "student",
+            "createdAt": created_at(),
+        })
+        if (index + 1) % progress_every == 0:
+            print(writer.report("users"))
+    print(writer.report("users"))
+
+    # --- Cursos (metadatos) -------------------------------------------------
+    lessons_per_course = []
+    course_created = []
+    for course_index in range(args.courses):
+        lessons_per_course.append(rng.randint(max(args.lessons_per_course // 2, 1), args.lessons_per_course * 3 // 2))
+        course_created.append(created_at())
+
+    def lesson_id(course_index: int, position: int) -> ObjectId:
+        return make_object_id("lesson", course_index * args.lessons_per_course * 2 + position)
+
+    # --- Inscripciones y reseñas -------------------------------------------
+    print(f"\n📝 Generando ~{args.enrollments:,} inscripciones y ~{args.reviews:,} reseñas (Zipf s={args.zipf})...")
+    course_weights = zipf_cum_weights(args.courses, args.zipf, rng)
+    students_enrolled = [0] * args.courses
+    rating_histogram = [[0] * 5 for _ in range(args.courses)]
+    review_probability = min(args.reviews / args.enrollments, 1.0) if args.enrollments else 0
+    mean_per_student = args.enrollments / args.students if args.students else 0
+    max_per_student = min(args.courses, max(int(mean_per_student * 10), 1))
+
+    enrollment_count = 0
+    review_count = 0
+    for student_index in range(args.students):
+        if enrollment_count >= args.enrollments:
+            break
+        user_oid = make_object_id("user", student_offset + student_index)
+
+        # Número de cursos del estudiante (exponencial alrededor de la media)
+        wanted = min(max(int(rng.expovariate(1 / mean_per_student)) + 1, 1), max_per_student,
+                     args.enrollments - enrollment_count)
+        chosen = set()
+        for _ in range(wanted * 4):
+            if len(chosen) >= wanted:
+                break
+            chosen.add(rng.choices(range(args.courses), cum_weights=course_weights)[0])
+
+        for course_index in chosen:
+            course_oid = make_object_id("course", course_index)
+            enrolled_at = course_created[course_index] + timedelta(
+                seconds=rng.randrange(max(int((BASE_DATE - course_created[course_index]).total_seconds()), 1))
+            )
+            total_lessons = lessons_per_course[course_index]
+            completed = rng.randint(0, total_lessons)
+            progress = round(completed * 100 / total_lessons) if total_lessons else 0
+
+            await writer.add("enrollments", {
+                "_id": make_object_id("enrollment", enrollment_count),
+                "userId": user_oid,
+                "courseId": course_oid,
+                "enrolledAt": enrolled_at,
+                "progress": progress,
+                "completedLessons": [str(lesson_id(course_index, n)) for n in range(completed)],
+                "status": "completed" if progress >= 100 else "active",
+            })
+            students_enrolled[course_index] += 1
+            enrollment_count += 1
+
+            if review_count < args.reviews and rng.random() < review_probability:
+                rating = rng.choices(range(1, 6), weights=RATING_WEIGHTS)[0]
+                rating_histogram[course_index][rating - 1] += 1
+                await writer.add("reviews", {
+                    "_id": make_object_id("review", review_count),
+                    "courseId": course_oid,
+                    "student": user_oid,
+                    "rating": rating,
+                    "comment": rng.choice(REVIEW_COMMENTS),
+                    "createdAt": enrolled_at + timedelta(days=rng.randint(1, 60)),
+                })
+                review_count += 1
+
+            if enrollment_count % progress_every == 0:
+                print(writer.report("enrollments"))
+    print(writer.report("enrollments"))
+    print(writer.report("reviews"))
+
+    # --- Cursos y lecciones -------------------------------------------------
+    print(f"\n📚 Generando {args.courses:,} cursos con sus lecciones...")
+    for course_index in range(args.courses):
+        course_oid = make_object_id("course", course_index)
+        instructor = instructors[course_instructor[course_index]]
+        topic = rng.choice(TOPICS)
+        category = rng.choice(CATEGORIES)
+        level = rng.choice(LEVELS)
+
+        outline = []
+        for position in range(lessons_per_course[course_index]):
+            lesson = {
+                "_id": lesson_id(course_index, position),
+                "title": f"{topic}: lección {position + 1}",
+                "order": position + 1,
+                "duration": f"{rng.randint(5, 45)} min",
+            }
+            outline.append(lesson)
+            await writer.add("lessons", {
+                **lesson,
+                "courseId": course_oid,
+                "content": f"Contenido de la lección {position + 1} de {topic}. " * max(args.content_bytes // 40, 1),
+                "video_url": LESSON_VIDEOS[position % len(LESSON_VIDEOS)],
+            })
+
+        histogram = rating_histogram[course_index]
+        total_reviews = sum(histogram)
+        rating_sum = sum((stars + 1) * count for stars, count in enumerate(histogram))
+        await writer.add("courses", {
+            "_id": course_oid,
+            "title": f"{topic} {level} #{course_index}",
+            "description": f"Curso de {topic} generado para pruebas de capacidad.",
+            "instructor": {
+                "userId": instructor["_id"],
+                "name": f"{instructor['firstName']} {instructor['lastName']}",
+                "email": instructor["email"],
+                "avatarUrl": "",
+                "bio": instructor["instructorProfile"]["bio"],
+            },
+            "price": round(rng.choice([0, 9.99, 19.99, 29.99, 49.99, 99.99]), 2),
+            "level": level,
+            "category": category,
+            "categories": [category],
+            "image": "/images/courses/default.webp",
+            "lessons": outline,
+            "studentsEnrolled": students_enrolled[course_index],
+            "totalReviews": total_reviews,
+            "ratingSum": rating_sum,
+            "ratingHistogram": {str(stars + 1): count for stars, count in enumerate(histogram) if count},
+            "averageRating": round(rating_sum / total_reviews, 1) if total_reviews else 0,
+            "createdAt": course_created[course_index],
+        })
+        if (course_index + 1) % progress_every == 0:
+            print(writer.report("courses"))
+
+    await writer.close()
+    print(writer.report("courses"))
+    print(writer.report("lessons"))
+
+    return dict(writer.inserted)
+
+
+async def main(args) -> bool:
+    """Preparar la base de datos destino, generar los datos y crear índices y estadísticas."""
+    MongoDB.client = AsyncIOMotorClient(MONGODB_URI)
+    default_db = MongoDB.client.get_default_database("elearning")
+    if args.db == default_db.name:
+        print(f"❌ La base de datos {args.db} es la de la aplicación; usa otra con --db")
+        return False
+    MongoDB.db = MongoDB.client[args.db]
+
+    if args.drop:
+        print(f"🗑️  Eliminando la base de datos {args.db}...")
+        await MongoDB.client.drop_database(args.db)
+    elif await MongoDB.db["users"].estimated_document_count():
+        print(f"❌ La base de datos {args.db} ya tiene datos; usa --drop para regenerarla")
+        return False
+
+    start = time.perf_counter()
+    totals = await generate(args)
+
+    print("\n🗂️  Creando índices...")
+    errors = await ensure_indexes()
+    if errors:
+        print(f"⚠️  Errores al crear índices: {errors}")
+
+    print("📊 Reconstruyendo platform_stats...")
+    await rebuild_platform_stats()
+    await MongoDB.disconnect()
+
+    elapsed = time.perf_counter() - start
+    print(f"\n✅ Datos generados en {args.db} en {elapsed:.0f}s (seed {args.seed}):")
+    for collection, count in sorted(totals.items()):
+        print(f"   {collection:<12} {count:>12,}")
+    print(f"\n🔑 Contraseña de todos los usuarios: {SYNTHETIC_PASSWORD}")
+    return not errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generar datos sintéticos a gran escala en una base de datos de pruebas")
+    parser.add_argument("--db", default="elearning_synthetic",
+                        help="Base de datos destino (por defecto elearning_synthetic)")
+    parser.add_argument("--drop", action="store_true", help="Eliminar la base de datos destino antes de generar")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla para datos reproducibles (por defecto 42)")
+    parser.add_argument("--students", type=int, default=10000, help="Número de estudiantes")
+    parser.add_argument("--instructors", type=int, default=100, help="Número de instructores")
+    parser.add_argument("--courses", type=int, default=500, help="Número de cursos")
+    parser.add_argument("--lessons-per-course", type=int, default=10, help="Lecciones por curso (media)")
+    parser.add_argument("--enrollments", type=int, default=50000, help="Número aproximado de inscripciones")
+    parser.add_argument("--reviews", type=int, default=5000, help="Número máximo de reseñas")
+    parser.add_argument("--content-bytes", type=int, default=2000, help="Tamaño aproximado del contenido de cada lección")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Exponente de Zipf de la popularidad de los cursos")
+    parser.add_argument("--batch-size", type=int, default=5000, help="Documentos por insert_many")
+    parser.add_argument("--concurrency", type=int, default=4, help="Lotes de insert_many en vuelo a la vez")
+    parser.add_argument("--password-pool", type=int, default=16, help="Hashes bcrypt precalculados")
+    args = parser.parse_args()
+
+    if min(args.students, args.instructors, args.courses, args.lessons_per_course) < 1:
+        parser.error("--students, --instructors, --courses y --lessons-per-course deben ser al menos 1")
+
+    sys.exit(0 if asyncio.run(main(args)) else 1)
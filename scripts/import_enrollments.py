@@ -0,0 +1,111 @@
+"""
+Script para importar inscripciones masivas desde un fichero CSV o JSONL.
+
+Lee el fichero en streaming (sin cargarlo entero en memoria), agrupa las filas
+en bloques de tamaño acotado y envía cada bloque a bulk_enroll, que valida
+usuarios y cursos con dos consultas $in y aplica las inscripciones con
+bulk_write. Muestra el progreso y la velocidad de importación, y escribe los
+errores por fila (con su número de línea) en un fichero JSONL.
+
+Formato de entrada:
+    CSV   -> cabecera con las columnas user_id,course_id
+    JSONL -> una línea por inscripción: {"user_id": "...", "course_id": "..."}
+
+Uso:
+    python scripts/import_enrollments.py inscripciones.csv
+    python scripts/import_enrollments.py inscripciones.jsonl --chunk-size 2000 --errors errores.jsonl
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB
+from E_Learning_JCB_Reflex.services.enrollment_service import bulk_enroll
+
+
+def read_rows(path: Path):
+    """Generar (número_de_línea, user_id, course_id) leyendo el fichero en streaming."""
+    with path.open(encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".jsonl":
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    row = {}
+                yield line_number, str(row.get("user_id", "")), str(row.get("course_id", ""))
+        else:
+            # La línea 1 es la cabecera
+            for line_number, row in enumerate(csv.DictReader(f), start=2):
+                yield line_number, (row.get("user_id") or "").strip(), (row.get("course_id") or "").strip()
+
+
+def chunked(rows, size: int):
+    """Agrupar un iterable en listas de como máximo size elementos."""
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+async def import_enrollments(path: Path, chunk_size: int, errors_path: Path):
+    """Importar el fichero por bloques e informar del progreso."""
+    print(f"📥 Importando inscripciones desde {path} (bloques de {chunk_size})\n")
+
+    totals = {"rows": 0, "enrolled": 0, "skipped": 0, "errors": 0, "counter_errors": 0}
+    start = time.perf_counter()
+
+    with errors_path.open("w", encoding="utf-8") as errors_file:
+        for chunk in chunked(read_rows(path), chunk_size):
+            summary = await bulk_enroll([(user_id, course_id) for _, user_id, course_id in chunk])
+
+            for error in summary["errors"]:
+                line_number = chunk[error["index"]][0]
+                errors_file.write(json.dumps({"line": line_number, **error}, ensure_ascii=False) + "\n")
+
+            totals["rows"] += len(chunk)
+            totals["enrolled"] += summary["enrolled"]
+            totals["skipped"] += summary["skipped"]
+            totals["errors"] += len(summary["errors"])
+            totals["counter_errors"] += len(summary["counter_errors"])
+
+            elapsed = time.perf_counter() - start
+            print(
+                f"  {totals['rows']:>9} filas | {totals['enrolled']:>9} inscritas | "
+                f"{totals['skipped']:>7} omitidas | {totals['errors']:>7} errores | "
+                f"{totals['rows'] / elapsed:,.0f} filas/s"
+            )
+
+    await MongoDB.disconnect()
+
+    print(f"\n✅ Importación completada en {time.perf_counter() - start:.1f}s")
+    if totals["errors"]:
+        print(f"⚠️  Errores por fila guardados en {errors_path}")
+    if totals["counter_errors"]:
+        print(f"⚠️  {totals['counter_errors']} bloques no actualizaron los contadores: "
+              "ejecutar python scripts/rebuild_platform_stats.py")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Importar inscripciones masivas desde CSV o JSONL")
+    parser.add_argument("path", type=Path, help="Fichero .csv o .jsonl con user_id y course_id")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Filas por bloque (por defecto 1000)")
+    parser.add_argument("--errors", type=Path, default=Path("import_enrollments_errors.jsonl"),
+                        help="Fichero JSONL donde guardar los errores por fila")
+    args = parser.parse_args()
+
+    asyncio.run(import_enrollments(args.path, args.chunk_size, args.errors))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+"""
+Prueba de carga de extremo a extremo contra el backend de Reflex.
+
+Abre muchas sesiones Socket.IO simuladas contra un backend local (el mismo
+endpoint /_event que usa el navegador) y reproduce en cada una el recorrido
+de un estudiante:
+
+    set_login_email / set_login_password → handle_login → load_courses →
+    load_course_by_id → enroll_in_course → load_course_viewer_from_url →
+    go_to_next_lesson (x --lessons) → flush_progress
+
+Cada evento se envía con el mismo formato que el frontend (token, nombre
+completo del manejador, payload y router_data con la ruta de la página) y se
+mide desde el envío hasta la actualización con final=True. Por evento se
+informa de la latencia p50/p95/p99, la tasa de error y los bytes de delta de
+estado recibidos, y globalmente del throughput en eventos por segundo.
+
+Un evento cuenta como error si no llega respuesta antes de --timeout, si se
+cierra la conexión o si la respuesta pone un texto en la variable error de
+algún estado (la forma en que los estados de la aplicación informan de un
+fallo).
+
+Los resultados se guardan en un JSON con claves ordenadas y valores
+redondeados (--output) para poder compararlos entre ejecuciones con diff o
+con --compare.
+
+Uso:
+    python scripts/load_test.py
+    python scripts/load_test.py --sessions 500 --concurrency 100 --ramp-up 30
+    python scripts/load_test.py --url http://localhost:8000 --output results/after.json \\
+        --compare results/before.json
+
+Requiere:
+- El backend en marcha (reflex run --env prod --backend-only) apuntando a una
+  base de datos de pruebas, por ejemplo la creada con
+  scripts/generate_dataset.py: los usuarios student{i}@synthetic.elearningjcb.test
+  con contraseña synthetic123 son los que usa este script por defecto.
+- Todas las sesiones salen de la misma IP: subir LOGIN_IP_BURST y
+  LOGIN_IP_PER_MINUTE en el backend (o ponerlos a 0) para que la limitación
+  de intentos de login no rechace los logins de la prueba.
+- python-socketio con su cliente asíncrono (pip install aiohttp).
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import socketio
+    import aiohttp  # noqa: F401 - transporte del cliente asíncrono de python-socketio
+except ImportError:  # solo lo necesita este script, no la aplicación
+    socketio = None
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.states.auth_state import AuthState
+from E_Learning_JCB_Reflex.states.course_state import CourseState
+from E_Learning_JCB_Reflex.states.course_viewer_state import CourseViewerState
+from E_Learning_JCB_Reflex.states.enrollment_state import EnrollmentState
+
+# Endpoint de eventos de Reflex (constants.Endpoint.EVENT y SocketEvent.EVENT)
+EVENT_NAMESPACE = "/_event"
+SOCKETIO_PATH = "_event"
+SOCKET_EVENT = "event"
+
+# Sufijo que Reflex añade a los nombres de variable en los deltas
+FIELD_MARKER = "_rx_state_"
+
+# Usuarios de scripts/generate_dataset.py
+DEFAULT_EMAIL_TEMPLATE = "student{index}@synthetic.elearningjcb.test"
+DEFAULT_PASSWORD = "synthetic123"
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Percentil por rango más cercano de una lista ya ordenada."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+class EventFailed(Exception):
+    """Un evento del recorrido falló y la sesión no puede continuar."""
+
+
+class Recorder:
+    """Acumula latencias, errores y bytes de delta por evento."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.delta_bytes = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.error_samples = defaultdict(list)
+
+    def record(self, event: str, latency: float, delta_bytes: int, error: str = ""):
+        self.latencies[event].append(latency)
+        self.delta_bytes[event].append(delta_bytes)
+        if error:
+            self.errors[event] += 1
+            if len(self.error_samples[event]) < 3:
+                self.error_samples[event].append(error[:200])
+
+    def summary(self) -> dict:
+        """Estadísticas por evento (latencias en ms, redondeadas para poder hacer diff)."""
+        events = {}
+        for event, latencies in self.latencies.items():
+            values = sorted(latency * 1000 for latency in latencies)
+            sizes = self.delta_bytes[event]
+            events[event] = {
+                "count": len(values),
+                "errors": self.errors[event],
+                "error_rate": round(self.errors[event] / len(values), 4),
+                "p50_ms": round(percentile(values, 0.50), 1),
+                "p95_ms": round(percentile(values, 0.95), 1),
+                "p99_ms": round(percentile(values, 0.99), 1),
+                "max_ms": round(values[-1], 1),
+                "mean_ms": round(sum(values) / len(values), 1),
+                "delta_bytes_mean": round(sum(sizes) / len(sizes)),
+                "delta_bytes_total": sum(sizes),
+                "error_samples": self.error_samples.get(event, []),
+            }
+        return events
+
+
+class Session:
+    """Una pestaña de navegador simulada: un token y una conexión Socket.IO."""
+
+    def __init__(self, url: str, recorder: Recorder, timeout: float):
+        self.url = url
+        self.recorder = recorder
+        self.timeout = timeout
+        self.token = str(uuid.uuid4())
+        self.client = socketio.AsyncClient(reconnection=False)
+        # Estado del cliente reconstruido a partir de los deltas: {estado: {variable: valor}}
+        self.state = defaultdict(dict)
+        self._pending = None
+        self._delta_bytes = 0
+        self._error = ""
+
+        self.client.on(SOCKET_EVENT, self._on_update, namespace=EVENT_NAMESPACE)
+        self.client.on("disconnect", self._on_disconnect, namespace=EVENT_NAMESPACE)
+
+    async def _on_update(self, update):
+        """Aplicar una StateUpdate y resolver el evento en curso cuando llega la final."""
+        if isinstance(update, str):
+            raw = update
+            update = json.loads(update)
+        else:
+            raw = json.dumps(update.get("delta", {}), separators=(",", ":"), default=str)
+        self._delta_bytes += len(raw.encode())
+
+        for state_name, variables in (update.get("delta") or {}).items():
+            for key, value in variables.items():
+                name = key[: -len(FIELD_MARKER)] if key.endswith(FIELD_MARKER) else key
+                self.state[state_name][name] = value
+                if name == "error" and value:
+                    self._error = f"{state_name.rsplit('.', 1)[-1]}: {value}"
+
+        if update.get("final", True) and self._pending and not self._pending.done():
+            self._pending.set_result(None)
+
+    async def _on_disconnect(self, *args):
+        if self._pending and not self._pending.done():
+            self._pending.set_exception(ConnectionError("conexión cerrada por el servidor"))
+
+    def get_var(self, state_cls, name: str, default=None):
+        """Valor de una variable de estado según los deltas recibidos."""
+        return self.state[state_cls.get_full_name()].get(name, default)
+
+    async def connect(self):
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                self.client.connect(
+                    f"{self.url}?token={self.token}",
+                    namespaces=[EVENT_NAMESPACE],
+                    socketio_path=SOCKETIO_PATH,
+                    transports=["websocket"],
+                ),
+                self.timeout,
+            )
+        except Exception as e:
+            self.recorder.record("connect", time.perf_counter() - start, 0, f"{type(e).__name__}: {e}")
+            raise EventFailed("connect") from e
+        self.recorder.record("connect", time.perf_counter() - start, 0)
+
+    async def send(self, state_cls, handler: str, payload: dict, path: str, check_error: bool = True):
+        """
+        Enviar un evento como lo hace el frontend y esperar su actualización final.
+
+        Args:
+            state_cls: Clase de estado que define el manejador
+            handler: Nombre del manejador
+            payload: Argumentos del manejador
+            path: Ruta de la página desde la que se lanza (router_data)
+            check_error: Contar como error un texto en la variable error
+
+        Raises:
+            EventFailed: Si el evento falla (timeout, desconexión o error de la aplicación)
+        """
+        loop = asyncio.get_running_loop()
+        self._pending = loop.create_future()
+        self._delta_bytes = 0
+        self._error = ""
+
+        event = {
+            "token": self.token,
+            "name": f"{state_cls.get_full_name()}.{handler}",
+            "payload": payload,
+            "router_data": {"pathname": path, "asPath": path, "query": {}},
+        }
+
+        start = time.perf_counter()
+        error = ""
+        try:
+            await self.client.emit(SOCKET_EVENT, event, namespace=EVENT_NAMESPACE)
+            await asyncio.wait_for(self._pending, self.timeout)
+        except asyncio.TimeoutError:
+            error = f"timeout ({self.timeout}s)"
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        latency = time.perf_counter() - start
+
+        if not error and check_error:
+            error = self._error
+        self.recorder.record(handler, latency, self._delta_bytes, error)
+        if error:
+            raise EventFailed(f"{handler}: {error}")
+
+    async def close(self):
+        if self.client.connected:
+            await self.client.disconnect()
+
+
+async def run_journey(index: int, args, recorder: Recorder):
+    """Recorrido completo de un estudiante. Devuelve True si termina sin errores."""
+    session = Session(args.url, recorder, args.timeout)
+    email = args.email_template.format(index=index % args.users)
+
+    async def think():
+        if args.think_time:
+            await asyncio.sleep(random.uniform(0, 2 * args.think_time))
+
+    try:
+        await session.connect()
+
+        await session.send(AuthState, "set_login_email", {"value": email}, "/login")
+        await session.send(AuthState, "set_login_password", {"value": args.password}, "/login")
+        await session.send(AuthState, "handle_login", {}, "/login")
+        if not session.get_var(AuthState, "is_authenticated"):
+            return False
+        await think()
+
+        await session.send(CourseState, "load_courses", {}, "/courses")
+        courses = session.get_var(CourseState, "courses", [])
+        if not courses:
+            raise EventFailed("load_courses: catálogo vacío")
+        course_id = random.choice(courses)["id"]
+        await think()
+
+        await session.send(CourseState, "load_course_by_id", {"course_id": course_id}, f"/courses/{course_id}")
+        await think()
+
+        # Un estudiante que ya estaba inscrito recibe un error esperado: no cuenta como fallo
+        await session.send(EnrollmentState, "enroll_in_course", {"course_id": course_id},
+                           f"/courses/{course_id}", check_error=False)
+        await think()
+
+        viewer_path = f"/courses/{course_id}/view"
+        await session.send(CourseViewerState, "load_course_viewer_from_url", {}, viewer_path)
+        for _ in range(args.lessons):
+            await think()
+            await session.send(CourseViewerState, "go_to_next_lesson", {}, viewer_path)
+        await session.send(CourseViewerState, "flush_progress", {}, viewer_path)
+        return True
+    except EventFailed:
+        return False
+    finally:
+        await session.close()
+
+
+def print_summary(report: dict):
+    """Mostrar la tabla de resultados por evento."""
+    print(f"\n{'evento':<30} {'n':>6} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'delta B':>9}")
+    for event, stats in report["events"].items():
+        print(f"{event:<30} {stats['count']:>6} {stats['error_rate'] * 100:>5.1f}% "
+              f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} "
+              f"{stats['delta_bytes_mean']:>9}")
+    totals = report["totals"]
+    print(f"\n📊 {totals['events']} eventos en {totals['duration_s']}s → {totals['events_per_second']} eventos/s, "
+          f"{totals['error_rate'] * 100:.2f}% errores")
+    print(f"👥 Sesiones completadas: {totals['sessions_completed']}/{totals['sessions']}")
+
+
+def print_comparison(report: dict, previous_path: str):
+    """Comparar p95 y tasa de error con un resultado anterior."""
+    previous = json.loads(Path(previous_path).read_text(encoding="utf-8"))
+    print(f"\n🔁 Comparación con {previous_path} (p95 en ms)")
+    for event, stats in report["events"].items():
+        before = previous.get("events", {}).get(event)
+        if not before:
+            print(f"  {event:<30} (nuevo)")
+            continue
+        change = stats["p95_ms"] - before["p95_ms"]
+        ratio = f"{change / before['p95_ms'] * 100:+.0f}%" if before["p95_ms"] else ""
+        print(f"  {event:<30} {before['p95_ms']:>8.1f} → {stats['p95_ms']:>8.1f} {ratio:>6}  "
+              f"err {before['error_rate'] * 100:.1f}% → {stats['error_rate'] * 100:.1f}%")
+    before_total = previous.get("totals", {}).get("events_per_second", 0)
+    print(f"  {'throughput (eventos/s)':<30} {before_total:>8} → {report['totals']['events_per_second']:>8}")
+
+
+async def run_load_test(args) -> dict:
+    """Lanzar las sesiones con la concurrencia y rampa indicadas y construir el informe."""
+    recorder = Recorder()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    delay = args.ramp_up / args.sessions if args.ramp_up else 0
+
+    async def limited(index: int):
+        await asyncio.sleep(index * delay)
+        async with semaphore:
+            return await run_journey(args.first_user + index, args, recorder)
+
+    print(f"🚀 {args.sessions} sesiones contra {args.url} "
+          f"(concurrencia {args.concurrency}, rampa {args.ramp_up}s, think time {args.think_time}s)")
+    start = time.perf_counter()
+    results = await asyncio.gather(*(limited(index) for index in range(args.sessions)))
+    duration = time.perf_counter() - start
+
+    events = recorder.summary()
+    total_events = sum(stats["count"] for stats in events.values())
+    total_errors = sum(stats["errors"] for stats in events.values())
+    return {
+        "config": {
+            "url": args.url,
+            "sessions": args.sessions,
+            "concurrency": args.concurrency,
+            "ramp_up_s": args.ramp_up,
+            "think_time_s": args.think_time,
+            "lessons": args.lessons,
+            "users": args.users,
+        },
+        "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "totals": {
+            "sessions": args.sessions,
+            "sessions_completed": sum(1 for ok in results if ok),
+            "events": total_events,
+            "errors": total_errors,
+            "error_rate": round(total_errors / max(total_events, 1), 4),
+            "duration_s": round(duration, 1),
+            "events_per_second": round(total_events / max(duration, 1e-9), 1),
+        },
+        "events": events,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prueba de carga del backend de Reflex por Socket.IO")
+    parser.add_argument("--url", default="http://localhost:8000", help="URL del backend (por defecto http://localhost:8000)")
+    parser.add_argument("--sessions", type=int, default=50, help="Sesiones (recorridos) en total")
+    parser.add_argument("--concurrency", type=int, default=20, help="Sesiones abiertas a la vez como máximo")
+    parser.add_argument("--ramp-up", type=float, default=10.0, help="Segundos para arrancar todas las sesiones")
+    parser.add_argument("--think-time", type=float, default=0.0,
+                        help="Pausa media entre pasos del recorrido en segundos (0 = sin pausa)")
+    parser.add_argument("--lessons", type=int, default=3, help="Lecciones que avanza cada sesión en el visor")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Segundos máximos de espera por evento")
+    parser.add_argument("--users", type=int, default=1000, help="Estudiantes distintos a usar (se reparten en ciclo)")
+    parser.add_argument("--first-user", type=int, default=0, help="Índice del primer estudiante")
+    parser.add_argument("--email-template", default=DEFAULT_EMAIL_TEMPLATE,
+                        help="Plantilla del email con {index} (por defecto la de generate_dataset.py)")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="Contraseña de los estudiantes")
+    parser.add_argument("--seed", type=int, default=42, help="Semilla para elegir cursos y pausas")
+    parser.add_argument("--output", default="load_test_results.json", help="Fichero JSON de resultados")
+    parser.add_argument("--compare", help="Fichero de resultados anterior con el que comparar")
+    args = parser.parse_args()
+
+    if socketio is None:
+        print("❌ Falta el cliente asíncrono de Socket.IO: pip install python-socketio aiohttp")
+        sys.exit(1)
+
+    random.seed(args.seed)
+    report = asyncio.run(run_load_test(args))
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, sort_keys=True, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    print_summary(report)
+    print(f"\n💾 Resultados guardados en {output}")
+    if args.compare:
+        print_comparison(report, args.compare)
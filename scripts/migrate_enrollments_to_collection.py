@@ -0,0 +1,164 @@
+"""
+Script para mover las inscripciones embebidas en los usuarios a la colección enrollments.
+
+Recorre en streaming los usuarios que todavía tienen un array enrolledCourses
+(proyectando solo ese array), escribe cada inscripción en la colección
+enrollments con su userId y, por cada lote de usuarios, elimina los arrays ya
+copiados. Al terminar recalcula el contador studentsEnrolled de cada curso a
+partir de enrollments, elimina el array antiguo courses.students y reconstruye
+las estadísticas de la plataforma.
+
+Es idempotente: las inscripciones se escriben con UpdateOne($setOnInsert,
+upsert=True) por userId + courseId, así que una inscripción que ya existe en
+enrollments (por ejemplo con progreso más reciente) no se sobrescribe, y el
+array de un usuario solo se elimina después de copiarlo. Se puede volver a
+ejecutar si se interrumpe.
+
+Uso:
+    python scripts/migrate_enrollments_to_collection.py
+    python scripts/migrate_enrollments_to_collection.py --batch-size 500
+    python scripts/migrate_enrollments_to_collection.py --dry-run
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB, ensure_indexes
+from E_Learning_JCB_Reflex.services.course_service import invalidate_catalog_cache, invalidate_course_cache
+from E_Learning_JCB_Reflex.services.stats_service import rebuild_platform_stats
+
+
+def to_enrollment_document(user_id, enrollment: dict):
+    """Convertir una inscripción embebida en un documento de enrollments (None si no es válida)."""
+    course_id = enrollment.get("courseId")
+    if isinstance(course_id, str) and ObjectId.is_valid(course_id):
+        course_id = ObjectId(course_id)
+    if not isinstance(course_id, ObjectId):
+        return None
+
+    progress = enrollment.get("progress", 0)
+    return {
+        "userId": user_id,
+        "courseId": course_id,
+        "enrolledAt": enrollment.get("enrolledAt") or datetime.now(timezone.utc),
+        "progress": progress,
+        "completedLessons": enrollment.get("completedLessons", []),
+        "status": enrollment.get("status") or ("completed" if progress >= 100 else "active"),
+    }
+
+
+async def flush_batch(db, operations: list, user_ids: list, dry_run: bool):
+    """Escribir las inscripciones del lote y eliminar los arrays de sus usuarios."""
+    if dry_run:
+        return
+    if operations:
+        await db["enrollments"].bulk_write(operations, ordered=False)
+    if user_ids:
+        await db["users"].update_many({"_id": {"$in": user_ids}}, {"$unset": {"enrolledCourses": ""}})
+
+
+async def recount_course_students(db) -> int:
+    """Corregir studentsEnrolled de cada curso a partir de enrollments y eliminar courses.students."""
+    counts = {
+        group["_id"]: group["count"]
+        async for group in db["enrollments"].aggregate([
+            {"$group": {"_id": "$courseId", "count": {"$sum": 1}}},
+        ])
+    }
+
+    changed = 0
+    cursor = db["courses"].find({}, {"studentsEnrolled": 1, "students": {"$slice": 1}})
+    async for course in cursor:
+        count = counts.get(course["_id"], 0)
+        if course.get("studentsEnrolled") == count and "students" not in course:
+            continue
+        await db["courses"].update_one(
+            {"_id": course["_id"]},
+            {"$set": {"studentsEnrolled": count}, "$unset": {"students": ""}},
+        )
+        await invalidate_course_cache(course["_id"], catalog=False)
+        changed += 1
+    return changed
+
+
+async def migrate(batch_size: int, dry_run: bool):
+    """Migrar las inscripciones embebidas de todos los usuarios."""
+    db = MongoDB.get_db()
+
+    await ensure_indexes()
+
+    print(f"🔍 Migrando inscripciones embebidas (lotes de {batch_size} inscripciones)...\n")
+
+    migrated_users = 0
+    migrated_enrollments = 0
+    skipped = 0
+    start = time.perf_counter()
+
+    operations = []
+    user_ids = []
+
+    cursor = db["users"].find(
+        {"enrolledCourses": {"$exists": True}},
+        {"enrolledCourses": 1},
+        batch_size=batch_size,
+    )
+    async for user in cursor:
+        for enrollment in user.get("enrolledCourses") or []:
+            document = to_enrollment_document(user["_id"], enrollment)
+            if document is None:
+                skipped += 1
+                continue
+            operations.append(UpdateOne(
+                {"userId": document["userId"], "courseId": document["courseId"]},
+                {"$setOnInsert": document},
+                upsert=True,
+            ))
+        user_ids.append(user["_id"])
+        migrated_users += 1
+
+        if len(operations) >= batch_size:
+            migrated_enrollments += len(operations)
+            await flush_batch(db, operations, user_ids, dry_run)
+            operations, user_ids = [], []
+
+            elapsed = time.perf_counter() - start
+            print(f"  📦 {migrated_enrollments} inscripciones de {migrated_users} usuarios "
+                  f"({migrated_enrollments / max(elapsed, 1e-9):.0f}/s)")
+
+    migrated_enrollments += len(operations)
+    await flush_batch(db, operations, user_ids, dry_run)
+
+    if not dry_run:
+        courses = await recount_course_students(db)
+        print(f"\n🔢 Contador studentsEnrolled corregido en {courses} cursos")
+        await rebuild_platform_stats()
+        await invalidate_catalog_cache()
+
+    await MongoDB.disconnect()
+
+    action = "Se migrarían" if dry_run else "Migradas"
+    print(f"\n✅ {action} {migrated_enrollments} inscripciones de {migrated_users} usuarios "
+          f"en {time.perf_counter() - start:.1f}s")
+    if skipped:
+        print(f"⚠️  {skipped} inscripciones sin courseId válido descartadas")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mover las inscripciones embebidas a la colección enrollments")
+    parser.add_argument("--batch-size", type=int, default=1000,
+                        help="Inscripciones por bulk_write (por defecto 1000)")
+    parser.add_argument("--dry-run", action="store_true", help="Mostrar qué se migraría sin escribir nada")
+    args = parser.parse_args()
+
+    asyncio.run(migrate(args.batch_size, args.dry_run))
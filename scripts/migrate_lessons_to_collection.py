@@ -0,0 +1,107 @@
+"""
+Script para mover el contenido de las lecciones a la colección lessons.
+
+Recorre los cursos cuyo array lessons todavía tiene lecciones completas
+(content, video_url, ...) o lecciones sin _id, guarda cada lección en la
+colección lessons con su courseId y deja en el curso solo el índice
+(_id, title, order, duration).
+
+Es idempotente: antes de escribir en lessons, los _id generados para las
+lecciones que no lo tenían se guardan en el array del propio curso. Después
+las lecciones se escriben con ReplaceOne(upsert=True) por _id y los cursos ya
+migrados se omiten, así que si se interrumpe se puede volver a ejecutar sin
+duplicar lecciones.
+
+Uso:
+    python scripts/migrate_lessons_to_collection.py
+    python scripts/migrate_lessons_to_collection.py --dry-run
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from pymongo import ReplaceOne
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB, ensure_indexes
+from E_Learning_JCB_Reflex.services.course_service import invalidate_course_cache
+from E_Learning_JCB_Reflex.services.lesson_service import LESSON_OUTLINE_FIELDS, split_lessons
+
+
+def needs_migration(lessons: list) -> bool:
+    """Indicar si el array de lecciones de un curso no es ya un índice ligero."""
+    return any(
+        "_id" not in lesson or set(lesson) - set(LESSON_OUTLINE_FIELDS)
+        for lesson in lessons
+    )
+
+
+async def migrate(dry_run: bool):
+    """Migrar las lecciones embebidas de todos los cursos."""
+    db = MongoDB.get_db()
+    courses_collection = db["courses"]
+    lessons_collection = db["lessons"]
+
+    await ensure_indexes()
+
+    print("🔍 Buscando cursos con lecciones embebidas...\n")
+
+    migrated_courses = 0
+    migrated_lessons = 0
+
+    cursor = courses_collection.find({"lessons.0": {"$exists": True}}, {"title": 1, "lessons": 1})
+    async for course in cursor:
+        lessons = course.get("lessons", [])
+        if not needs_migration(lessons):
+            continue
+
+        outline, bodies = split_lessons(lessons)
+        print(f"📚 {course.get('title', course['_id'])}: {len(bodies)} lecciones")
+
+        if not dry_run:
+            # Fijar en el curso los _id generados por split_lessons: una
+            # ejecución posterior reutiliza los mismos _id en lugar de crear
+            # copias nuevas de las lecciones. El filtro por el array leído
+            # evita pisar un cambio concurrente del curso.
+            if any("_id" not in lesson for lesson in lessons):
+                result = await courses_collection.update_one(
+                    {"_id": course["_id"], "lessons": lessons},
+                    {"$set": {"lessons": bodies}},
+                )
+                if result.matched_count == 0:
+                    print("   ⚠️  El curso ha cambiado durante la migración, se omite (volver a ejecutar)")
+                    continue
+
+            # Después las lecciones y por último el índice del curso: si se
+            # interrumpe, el curso sigue teniendo el contenido con sus _id y
+            # se puede volver a ejecutar
+            await lessons_collection.bulk_write(
+                [
+                    ReplaceOne({"_id": body["_id"]}, {**body, "courseId": course["_id"]}, upsert=True)
+                    for body in bodies
+                ],
+                ordered=False,
+            )
+            await courses_collection.update_one({"_id": course["_id"]}, {"$set": {"lessons": outline}})
+            await invalidate_course_cache(course["_id"])
+
+        migrated_courses += 1
+        migrated_lessons += len(bodies)
+
+    await MongoDB.disconnect()
+
+    action = "Se migrarían" if dry_run else "Migradas"
+    print(f"\n✅ {action} {migrated_lessons} lecciones de {migrated_courses} cursos")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mover el contenido de las lecciones a la colección lessons")
+    parser.add_argument("--dry-run", action="store_true", help="Mostrar qué se migraría sin escribir nada")
+    args = parser.parse_args()
+
+    asyncio.run(migrate(args.dry_run))
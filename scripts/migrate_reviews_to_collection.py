@@ -0,0 +1,103 @@
+"""
+Script para mover las reseñas embebidas en los cursos a la colección reviews.
+
+Recorre los cursos que todavía tienen un array reviews, guarda cada reseña en
+la colección reviews con su courseId, recalcula los agregados de valoración
+del curso (totalReviews, ratingSum, ratingHistogram, averageRating) y elimina
+el array embebido.
+
+Es idempotente: las reseñas se escriben con ReplaceOne(upsert=True) por
+courseId + student y el array solo se elimina después de copiarlas, así que
+se puede volver a ejecutar si se interrumpe. Si un estudiante tiene varias
+reseñas en el mismo curso solo se conserva la más reciente (índice único
+courseId + student).
+
+Uso:
+    python scripts/migrate_reviews_to_collection.py
+    python scripts/migrate_reviews_to_collection.py --dry-run
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from bson import ObjectId
+from pymongo import ReplaceOne
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB, ensure_indexes
+from E_Learning_JCB_Reflex.services.review_service import recompute_course_rating
+
+
+def to_review_document(course_id, review: dict) -> dict:
+    """Convertir una reseña embebida en un documento de la colección reviews."""
+    student = review.get("student")
+    if isinstance(student, str) and ObjectId.is_valid(student):
+        student = ObjectId(student)
+
+    return {
+        "courseId": course_id,
+        "student": student,
+        "rating": review.get("rating", 5),
+        "comment": review.get("comment", ""),
+        "createdAt": review.get("createdAt") or datetime.now(timezone.utc),
+    }
+
+
+async def migrate(dry_run: bool):
+    """Migrar las reseñas embebidas de todos los cursos."""
+    db = MongoDB.get_db()
+    courses_collection = db["courses"]
+    reviews_collection = db["reviews"]
+
+    await ensure_indexes()
+
+    print("🔍 Buscando cursos con reseñas embebidas...\n")
+
+    migrated_courses = 0
+    migrated_reviews = 0
+
+    cursor = courses_collection.find({"reviews": {"$exists": True}}, {"title": 1, "reviews": 1})
+    async for course in cursor:
+        reviews = course.get("reviews") or []
+        print(f"⭐ {course.get('title', course['_id'])}: {len(reviews)} reseñas")
+
+        if not dry_run:
+            # Una reseña por estudiante: conservar la más reciente
+            latest = {}
+            for review in sorted(reviews, key=lambda r: str(r.get("createdAt", ""))):
+                document = to_review_document(course["_id"], review)
+                latest[str(document["student"])] = document
+
+            if latest:
+                await reviews_collection.bulk_write(
+                    [
+                        ReplaceOne({"courseId": doc["courseId"], "student": doc["student"]}, doc, upsert=True)
+                        for doc in latest.values()
+                    ],
+                    ordered=False,
+                )
+
+            await recompute_course_rating(course["_id"])
+            await courses_collection.update_one({"_id": course["_id"]}, {"$unset": {"reviews": ""}})
+
+        migrated_courses += 1
+        migrated_reviews += len(reviews)
+
+    await MongoDB.disconnect()
+
+    action = "Se migrarían" if dry_run else "Migradas"
+    print(f"\n✅ {action} {migrated_reviews} reseñas de {migrated_courses} cursos")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mover las reseñas embebidas a la colección reviews")
+    parser.add_argument("--dry-run", action="store_true", help="Mostrar qué se migraría sin escribir nada")
+    args = parser.parse_args()
+
+    asyncio.run(migrate(args.dry_run))
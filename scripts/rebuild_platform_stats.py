@@ -0,0 +1,39 @@
+"""
+Script para recalcular el documento de estadísticas de la plataforma.
+
+Reconstruye desde cero el documento materializado de la colección
+platform_stats (usuarios por rol, cursos, lecciones, inscripciones y
+categorías). Útil tras importaciones masivas o si los contadores
+incrementales se han desviado.
+
+Uso:
+    python scripts/rebuild_platform_stats.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Añadir el directorio raíz al path
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from E_Learning_JCB_Reflex.database import MongoDB
+from E_Learning_JCB_Reflex.services.stats_service import rebuild_platform_stats
+
+
+async def main():
+    """Recalcular y mostrar las estadísticas."""
+    print("🔄 Recalculando platform_stats...\n")
+
+    stats = await rebuild_platform_stats()
+
+    for key, value in stats.items():
+        print(f"  {key}: {value}")
+
+    await MongoDB.disconnect()
+    print("\n✅ Estadísticas reconstruidas")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())